@@ -1,46 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
-from django.db import connection
+from django.db import connection, transaction
 from pathlib import Path
 
+from addressbase.partitions import (
+    NEW_TABLE_NAME,
+    TABLE_NAME,
+    copy_indexes_and_constraints,
+    create_missing_partitions,
+    create_partitioned_table,
+    is_partitioned,
+    swap_tables,
+)
+
 
 class Command(BaseCommand):
     """
     This creates a lookup csv of uprn and council GSS codes.
     This can then be imported using 'import_uprn_council_lookup'.
+
+    Alternatively, with --in-db the lookup is built straight into a new
+    table one council at a time over several database connections, and
+    swapped in for the existing addressbase_uprntocouncil table at the end.
+    If the build is interrupted, running it again picks up from the
+    councils which haven't been loaded yet. If the existing table is
+    partitioned by lad, the new one will be too.
     """
 
     def add_arguments(self, parser):
         parser.add_argument(
             "-d", "--destination", help="Path to write csv to", default=None
         )
+        parser.add_argument(
+            "--in-db",
+            help="<Optional> Build the lookup table in the database instead of writing a csv",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            help="<Optional> Number of councils to load in parallel with --in-db (default: 4)",
+            type=int,
+            default=4,
+        )
+        parser.add_argument(
+            "--restart",
+            help="<Optional> Discard any partially built table instead of resuming",
+            action="store_true",
+            default=False,
+        )
 
     def handle(self, *args, **kwargs):
 
         self.cursor = connection.cursor()
+
+        # We join against the subdivided council polygons maintained by the
+        # councils app (see CouncilSubdividedGeography) because
+        # point in polygon lookups are super fast on small geometries.
+        if kwargs["in_db"]:
+            self.build_in_db(kwargs["jobs"], kwargs["restart"])
+            call_command("import_uprn_council_lookup", pier_check_only=True)
+        else:
+            self.write_csv(kwargs["destination"])
+            self.stdout.write(
+                f"To import this data run: python manage.py import_uprn_council_lookup {self.dst.name}"
+            )
+
+    def write_csv(self, destination):
         # Set where we'll write the join query to.
-        if kwargs["destination"]:
-            self.dst = Path(kwargs["destination"]).open("w")
+        if destination:
+            self.dst = Path(destination).open("w")
         else:
             self.dst = Path("./uprn-to-councils.csv").open("w")
 
-        # Build the temporary subdivided council polygon table
-        # See http://blog.cleverelephant.ca/2019/11/subdivide.html for why we're doing this.
-        # tl;dr point in polygon lookups are super fast on small geometries.
-        self.stdout.write("Creating subdivided councils table...")
-        self.cursor.execute(
-            """
-            DROP TABLE IF EXISTS councils_council_subdivided;
-            """
-        )
-        self.cursor.execute(
-            """
-            CREATE TABLE councils_council_subdivided AS
-            SELECT gss, st_subdivide(geography) AS geom
-            FROM councils_councilgeography;
-            """
-        )
-
-        # spatial join between councils_council_subdivided and addressbase
+        # spatial join between the subdivided councils and addressbase
         # & dump out a CSV file
         self.stdout.write("Joining addresses to councils...")
         self.cursor.copy_expert(
@@ -52,9 +89,9 @@ class Command(BaseCommand):
                 FROM
                     addressbase_address a
                     JOIN
-                    councils_council_subdivided c
+                    councils_councilsubdividedgeography c
                     ON
-                    ST_Covers(c.geom, a.location)
+                    ST_Covers(c.geography, a.location)
                     )
                 TO STDOUT
 
@@ -64,14 +101,91 @@ class Command(BaseCommand):
         )
         self.stdout.write(f"Output written to: {self.dst.name}")
 
-        # Drop councils_council_subdivided
-        self.stdout.write("Dropping subdivided councils table...")
+    def build_in_db(self, jobs, restart):
+        if restart:
+            self.cursor.execute(f"DROP TABLE IF EXISTS {NEW_TABLE_NAME};")
+
         self.cursor.execute(
-            """
-            DROP TABLE councils_council_subdivided;
-            """
+            "SELECT gss FROM councils_councilgeography WHERE gss IS NOT NULL ORDER BY gss;"
         )
+        councils = [row[0] for row in self.cursor.fetchall()]
+
+        # no indexes or constraints until the data is loaded
+        if is_partitioned(self.cursor, TABLE_NAME):
+            create_partitioned_table(self.cursor, NEW_TABLE_NAME)
+            create_missing_partitions(self.cursor, councils, NEW_TABLE_NAME)
+        else:
+            self.cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {NEW_TABLE_NAME}
+                (LIKE {TABLE_NAME} INCLUDING DEFAULTS);
+                """
+            )
+        self.cursor.execute(f"SELECT DISTINCT lad FROM {NEW_TABLE_NAME};")
+        done = {row[0] for row in self.cursor.fetchall()}
+        todo = [gss for gss in councils if gss not in done]
+        if done:
+            self.stdout.write(f"Resuming: {len(done)} councils already loaded")
 
         self.stdout.write(
-            f"To import this data run: python manage.py import_uprn_council_lookup {self.dst.name}"
+            f"Joining addresses to {len(todo)} councils with {jobs} connections..."
         )
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(self.load_council, gss): gss for gss in todo}
+            for i, future in enumerate(as_completed(futures), start=1):
+                rows, seconds = future.result()
+                self.stdout.write(
+                    f"[{i}/{len(todo)}] {futures[future]}: {rows:,} addresses in {seconds:.1f}s"
+                )
+
+        self.remove_ambiguous_uprns()
+        self.stdout.write("Creating indexes and constraints...")
+        renames = copy_indexes_and_constraints(self.cursor, TABLE_NAME, NEW_TABLE_NAME)
+        self.stdout.write(f"Swapping {NEW_TABLE_NAME} for {TABLE_NAME}...")
+        self.swap_tables(renames)
+
+    def load_council(self, gss):
+        """
+        Runs in a worker thread, so Django gives us a separate connection.
+        Each council is loaded in a single statement, so a council either
+        has all its rows in the new table or none of them.
+        """
+        start = time.time()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO {NEW_TABLE_NAME} (uprn, lad, polling_station_id, council_id)
+                    SELECT DISTINCT a.uprn, c.gss, '', c.council_id
+                    FROM
+                        addressbase_address a
+                        JOIN
+                        councils_councilsubdividedgeography c
+                        ON
+                        ST_Covers(c.geography, a.location)
+                    WHERE c.gss = %s;
+                    """,
+                    [gss],
+                )
+                return cursor.rowcount, time.time() - start
+        finally:
+            connection.close()
+
+    def remove_ambiguous_uprns(self):
+        # addresses on the boundary between two councils end up in both.
+        # Take them out and let the pier check assign them by postcode.
+        self.cursor.execute(
+            f"""
+            DELETE FROM {NEW_TABLE_NAME} WHERE uprn IN (
+                SELECT uprn FROM {NEW_TABLE_NAME}
+                GROUP BY uprn HAVING COUNT(*) > 1
+            );
+            """
+        )
+        self.stdout.write(
+            f"Removed {self.cursor.rowcount:,} rows for addresses in more than one council"
+        )
+
+    @transaction.atomic
+    def swap_tables(self, renames):
+        swap_tables(connection.cursor(), TABLE_NAME, NEW_TABLE_NAME, renames)
@@ -1,8 +1,12 @@
-from django.db import connection
+from collections import Counter
+
+from django.db import connection, transaction
 from django.core.management.base import BaseCommand
 from pathlib import Path
 
-from addressbase.models import Address, UprnToCouncil
+from addressbase.models import Address, refresh_postcode_routes, update_uprn_councils
+from addressbase.partitions import create_missing_partitions, is_partitioned
+from data_finder.helpers.geocoders import geocoder_cache
 
 
 class Command(BaseCommand):
@@ -13,14 +17,31 @@ class Command(BaseCommand):
     """
 
     def add_arguments(self, parser):
-        parser.add_argument("path", help="Path to CSV mapping UPRNs to GSS codes.")
+        parser.add_argument(
+            "path", nargs="?", help="Path to CSV mapping UPRNs to GSS codes."
+        )
+        parser.add_argument(
+            "--pier-check-only",
+            help="<Optional> Don't import anything, just check for addresses outside council areas",
+            action="store_true",
+            default=False,
+        )
 
     def handle(self, *args, **kwargs):
-        self.path = Path(kwargs["path"])
+        if not kwargs["pier_check_only"]:
+            self.import_csv(kwargs["path"])
+        self.pier_check()
+        self.stdout.write("Updating postcode routes...")
+        self.stdout.write(f"Routed {refresh_postcode_routes():,} postcodes")
+        # AddressBase geocoding gets its codes from this table
+        geocoder_cache.clear()
+
+    def import_csv(self, path):
         self.table_name = "addressbase_uprntocouncil"
 
-        if not self.path.exists():
-            raise FileNotFoundError(f"No csv found at {kwargs['path']}")
+        if not path or not Path(path).exists():
+            raise FileNotFoundError(f"No csv found at {path}")
+        self.path = Path(path)
 
         cursor = connection.cursor()
         self.stdout.write("clearing existing data..")
@@ -28,21 +49,67 @@ class Command(BaseCommand):
 
         self.stdout.write("importing from CSV..")
         with self.path.open("r") as f:
-            cursor.copy_from(f, self.table_name, sep=",")
+            cursor.copy_from(
+                f,
+                self.table_name,
+                sep=",",
+                columns=("uprn", "lad", "polling_station_id"),
+            )
+
+        if is_partitioned(cursor, self.table_name):
+            # anything without a partition of its own will be in the default one
+            cursor.execute(f"SELECT DISTINCT lad FROM {self.table_name};")
+            created = create_missing_partitions(
+                cursor, [row[0] for row in cursor.fetchall() if row[0]], self.table_name
+            )
+            self.stdout.write(f"created {len(created)} partitions..")
 
+        self.stdout.write("resolving councils..")
+        update_uprn_councils()
         self.stdout.write("...done")
+
+    @transaction.atomic
+    def pier_check(self):
+        """
+        Addresses which didn't fall inside any council's boundary (e.g: on
+        piers) get the council of the other addresses in their postcode.
+        If that's ambiguous (or there are no other addresses) we delete them.
+        """
         self.stdout.write(
             "Looking for addresses outside council areas... (aka the pier check...)"
         )
-        for address in Address.objects.filter(uprntocouncil__isnull=True):
-            council = address.get_council_from_others_in_postcode()
-            if council:
-                self.stdout.write(
-                    f"Creating UprnToCouncil record for {address.uprn} with gss {council.geography.gss}"
-                )
-                UprnToCouncil.objects.create(
-                    uprn=address, lad=council.geography.gss, polling_station_id=""
-                )
-            else:
-                self.stdout.write(f"Council ambiguous for {address.uprn}, deleting")
-                address.delete()
+        cursor = connection.cursor()
+        cursor.execute(
+            """
+            WITH orphans AS (
+                SELECT a.uprn, a.postcode
+                FROM addressbase_address a
+                    LEFT JOIN addressbase_uprntocouncil u ON a.uprn = u.uprn
+                WHERE u.uprn IS NULL
+            ), resolved AS (
+                SELECT a.postcode, MIN(u.lad) AS lad
+                FROM addressbase_address a
+                    JOIN addressbase_uprntocouncil u ON a.uprn = u.uprn
+                WHERE a.postcode IN (SELECT postcode FROM orphans)
+                GROUP BY a.postcode
+                HAVING COUNT(DISTINCT u.lad) = 1
+            )
+            INSERT INTO addressbase_uprntocouncil (uprn, lad, polling_station_id, council_id)
+            SELECT DISTINCT ON (o.uprn) o.uprn, g.gss, '', c.council_id
+            FROM orphans o
+                JOIN resolved r ON o.postcode = r.postcode
+                JOIN councils_council c ON r.lad = ANY(c.identifiers)
+                JOIN councils_councilgeography g ON g.council_id = c.council_id
+            ORDER BY o.uprn
+            RETURNING lad;
+            """
+        )
+        created = Counter(row[0] for row in cursor.fetchall())
+        for lad, count in sorted(created.items()):
+            self.stdout.write(f"Created {count} UprnToCouncil records with gss {lad}")
+
+        deleted, _ = Address.objects.filter(uprntocouncil__isnull=True).delete()
+        self.stdout.write(
+            f"Created {sum(created.values())} UprnToCouncil records, "
+            f"deleted {deleted} addresses where the council was ambiguous"
+        )
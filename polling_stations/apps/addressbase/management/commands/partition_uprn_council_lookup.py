@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from addressbase.partitions import (
+    NEW_TABLE_NAME,
+    TABLE_NAME,
+    copy_indexes_and_constraints,
+    create_missing_partitions,
+    create_partitioned_table,
+    get_partitions,
+    is_partitioned,
+    supports_partitioning,
+    swap_tables,
+)
+
+
+class Command(BaseCommand):
+    """
+    Turn addressbase_uprntocouncil into a table which is list partitioned
+    by lad, with a partition for each council (see addressbase.partitions).
+
+    If the table is already partitioned, this adds partitions for any
+    councils which don't have one yet, e.g: after running import_councils.
+
+    Use --undo to turn it back into a normal table.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--undo",
+            help="<Optional> Turn the partitioned table back into a normal table",
+            action="store_true",
+            default=False,
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **kwargs):
+        if not supports_partitioning(connection):
+            raise CommandError("Partitioning UprnToCouncil needs postgres 11 or later")
+
+        cursor = connection.cursor()
+        partitioned = is_partitioned(cursor, TABLE_NAME)
+
+        if kwargs["undo"]:
+            if not partitioned:
+                raise CommandError(f"{TABLE_NAME} isn't partitioned")
+            self.stdout.write(f"Copying {TABLE_NAME} into a normal table...")
+            cursor.execute(
+                f"CREATE TABLE {NEW_TABLE_NAME} (LIKE {TABLE_NAME} INCLUDING DEFAULTS);"
+            )
+            self.copy_and_swap(cursor, primary_key=["uprn"])
+            return
+
+        cursor.execute(
+            f"""
+            SELECT gss FROM councils_councilgeography WHERE gss IS NOT NULL
+            UNION SELECT DISTINCT lad FROM {TABLE_NAME};
+            """
+        )
+        lads = [row[0] for row in cursor.fetchall() if row[0]]
+
+        if partitioned:
+            created = create_missing_partitions(cursor, lads, TABLE_NAME)
+            self.stdout.write(f"Created {len(created)} partitions: {created}")
+            return
+
+        self.stdout.write(
+            f"Copying {TABLE_NAME} into a table with {len(lads)} partitions..."
+        )
+        create_partitioned_table(cursor, NEW_TABLE_NAME)
+        create_missing_partitions(cursor, lads, NEW_TABLE_NAME)
+        # the primary key of a partitioned table has to include the partition key
+        self.copy_and_swap(cursor, primary_key=["uprn", "lad"])
+
+    def copy_and_swap(self, cursor, primary_key):
+        cursor.execute(f"INSERT INTO {NEW_TABLE_NAME} SELECT * FROM {TABLE_NAME};")
+        self.stdout.write(f"Copied {cursor.rowcount:,} rows")
+        self.stdout.write("Creating indexes and constraints...")
+        renames = copy_indexes_and_constraints(
+            cursor, TABLE_NAME, NEW_TABLE_NAME, primary_key
+        )
+        self.stdout.write(f"Swapping {NEW_TABLE_NAME} for {TABLE_NAME}...")
+        swap_tables(cursor, TABLE_NAME, NEW_TABLE_NAME, renames)
+        self.stdout.write(
+            f"..done. {TABLE_NAME} has {len(get_partitions(cursor, TABLE_NAME))} partitions"
+        )
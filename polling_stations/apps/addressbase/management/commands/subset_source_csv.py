@@ -1,42 +1,144 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 import csv
+import os
+from importlib.machinery import SourceFileLoader
 from pathlib import Path
 
 from addressbase.models import Address
+from data_importers import ems_importers
+from data_importers.filehelpers import clean_field_name
+
+EMS_IMPORTERS = {
+    "xpress-dc": ems_importers.BaseXpressDemocracyClubCsvImporter,
+    "xpress-weblookup": ems_importers.BaseXpressWebLookupCsvImporter,
+    "halarose": ems_importers.BaseHalaroseCsvImporter,
+    "democracy-counts": ems_importers.BaseDemocracyCountsCsvImporter,
+}
 
 
 class Command(BaseCommand):
     """
     This duplicates a csv but only taking uprns that are in our database
-    It currently only works for Xpress
+    It works for any of the EMS formats we have base importers for, either
+    by naming the format or an import script which uses it.
     It was used to generate csvs for testing as found in the test_data/pollingstations_data
     directory in the repository root.
     """
 
+    # how many uprns to look up in addressbase at once
+    chunk_size = 50000
+
     def add_arguments(self, parser):
         parser.add_argument("source", help="Path to read csv from", default=None)
         parser.add_argument("destination", help="Path to write csv to", default=None)
+        parser.add_argument(
+            "-e",
+            "--ems",
+            help="<Optional> Format of the source csv (default: xpress-dc)",
+            choices=sorted(EMS_IMPORTERS),
+            default="xpress-dc",
+        )
+        parser.add_argument(
+            "-s",
+            "--script",
+            help="<Optional> Take the format, encoding and delimiter from this import script e.g: import_birmingham",
+            required=False,
+        )
+        parser.add_argument(
+            "--encoding",
+            help="<Optional> Encoding of the source csv (default: utf-8)",
+            required=False,
+        )
+
+    def get_importer(self, kwargs):
+        if kwargs.get("script"):
+            path = os.path.join(
+                os.path.dirname(ems_importers.__file__),
+                "management/commands/{}.py".format(kwargs["script"]),
+            )
+            if not os.path.exists(path):
+                raise CommandError(f"No import script found at {path}")
+            return SourceFileLoader("module.name", path).load_module().Command
+        return EMS_IMPORTERS[kwargs["ems"]]
+
+    def get_field_index(self, header, field, required=True):
+        clean_header = [clean_field_name(h) for h in header]
+        try:
+            return clean_header.index(field)
+        except ValueError:
+            if not required:
+                return None
+            raise CommandError(f"Couldn't find a '{field}' column in {header}")
+
+    def get_uprns_in_addressbase(self, uprns):
+        uprns = list(uprns)
+        found = set()
+        for i in range(0, len(uprns), self.chunk_size):
+            found.update(
+                Address.objects.filter(
+                    uprn__in=uprns[i : i + self.chunk_size]
+                ).values_list("uprn", flat=True)
+            )
+        return found
 
     def handle(self, *args, **kwargs):
 
         self.source_path = Path(kwargs["source"])
         if not self.source_path.exists():
-            raise FileNotFoundError(f"No csv found at {kwargs['path']}")
+            raise FileNotFoundError(f"No csv found at {kwargs['source']}")
         self.destination_path = Path(kwargs["destination"])
-        with self.source_path.open("r") as source_csv:
-            dialect = csv.Sniffer().sniff(source_csv.read(4096))
+
+        importer = self.get_importer(kwargs)
+        encoding = kwargs.get("encoding")
+        if not encoding:
+            encoding = importer.csv_encoding if kwargs.get("script") else "utf-8"
+        if hasattr(importer, "station_name_field"):
+            station_name_field = importer.station_name_field
+        else:
+            station_name_field = importer.station_address_fields[0]
+
+        with self.source_path.open("r", encoding=encoding, newline="") as source_csv:
+            if kwargs.get("script"):
+                delimiter = importer.csv_delimiter
+            else:
+                delimiter = (
+                    csv.Sniffer().sniff(source_csv.read(4096), ",\t|;").delimiter
+                )
+                source_csv.seek(0)
+            csv_reader = csv.reader(source_csv, delimiter=delimiter)
+            header = next(csv_reader)
+            uprn_index = self.get_field_index(header, importer.residential_uprn_field)
+            name_index = self.get_field_index(
+                header, station_name_field, required=False
+            )
+            if name_index is None:
+                # e.g: democracy counts keeps station names in another file
+                self.stdout.write(
+                    f"No '{station_name_field}' column, leaving station names alone"
+                )
+
+            # one pass to find out which uprns we've got...
+            uprns_in_addressbase = self.get_uprns_in_addressbase(
+                {row[uprn_index].strip().lstrip("0") for row in csv_reader if row}
+            )
+
+            # ...and another to write them out
             source_csv.seek(0)
-            csv_reader = csv.DictReader(source_csv, dialect=dialect)
-            fieldnames = csv_reader.fieldnames
-            with self.destination_path.open("w") as destination_csv:
-                csv_writer = csv.DictWriter(destination_csv, fieldnames=fieldnames)
-                csv_writer.writeheader()
+            next(csv_reader)
+            written = 0
+            with self.destination_path.open(
+                "w", encoding=encoding, newline=""
+            ) as destination_csv:
+                csv_writer = csv.writer(destination_csv, delimiter=delimiter)
+                csv_writer.writerow(header)
                 for row in csv_reader:
-                    try:
-                        Address.objects.get(uprn=row["Property_URN"])
-                        row[
-                            "Polling_Place_Name"
-                        ] = f'[TESTING]{row["Polling_Place_Name"]}[TESTING]'
-                        csv_writer.writerow(row)
-                    except Address.DoesNotExist:
+                    if not row:
                         continue
+                    if row[uprn_index].strip().lstrip("0") not in uprns_in_addressbase:
+                        continue
+                    if name_index is not None:
+                        row[name_index] = f"[TESTING]{row[name_index]}[TESTING]"
+                    csv_writer.writerow(row)
+                    written += 1
+
+        self.stdout.write(f"Wrote {written} rows to {self.destination_path}")
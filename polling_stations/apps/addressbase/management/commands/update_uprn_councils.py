@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from addressbase.models import update_uprn_councils
+from councils.models import Council
+
+
+class Command(BaseCommand):
+    """
+    Set UprnToCouncil.council for every UPRN, one council at a time, so we
+    never hold row locks on the whole of addressbase_uprntocouncil in one
+    transaction. Run this after deploying addressbase migration 0017.
+
+    import_councils and import_uprn_council_lookup keep the column up to
+    date after that. Until it has been run, lookups fall back to finding
+    the council from lad.
+    """
+
+    def handle(self, *args, **kwargs):
+        total = 0
+        councils = Council.objects.exclude(identifiers=[]).order_by("council_id")
+        for council in councils:
+            with transaction.atomic():
+                updated = update_uprn_councils(lads=council.identifiers)
+            if kwargs["verbosity"] > 1:
+                self.stdout.write(f"{council.council_id}: updated {updated:,} UPRNs")
+            total += updated
+        self.stdout.write(f"Updated {total:,} UPRNs")
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("councils", "0010_council_identifiers_gin"),
+        ("addressbase", "0016_join_uprntocouncil_to_address"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uprntocouncil",
+            name="council",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="councils.Council",
+            ),
+        ),
+    ]
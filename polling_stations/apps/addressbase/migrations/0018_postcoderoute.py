@@ -0,0 +1,39 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("addressbase", "0017_uprntocouncil_council"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostcodeRoute",
+            fields=[
+                (
+                    "postcode",
+                    models.CharField(max_length=15, primary_key=True, serialize=False),
+                ),
+                ("route_type", models.CharField(max_length=20)),
+                (
+                    "council_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=100),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "polling_station_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("uprn", models.CharField(blank=True, max_length=12)),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pollingstations", "0015_delete_residential_address"),
+        ("addressbase", "0018_postcoderoute"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uprntocouncil",
+            name="station",
+            field=models.ForeignObject(
+                from_fields=["council", "polling_station_id"],
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="pollingstations.PollingStation",
+                to_fields=["council", "internal_council_id"],
+            ),
+        ),
+    ]
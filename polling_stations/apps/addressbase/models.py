@@ -1,6 +1,10 @@
 from django.contrib.gis.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection, transaction
+from django.db.models import OuterRef, Subquery
 from uk_geo_utils.models import (
     AbstractAddress,
+    AbstractAddressManager,
     AbstractOnsudManager,
 )
 
@@ -8,7 +12,28 @@ from councils.models import Council
 from pollingstations.models import PollingStation
 
 
+class AddressManager(AbstractAddressManager):
+    def get_resolved(self, uprn):
+        """
+        Get an address along with its council, its polling station and
+        the route_type of its postcode (see PostcodeRoute) in one query
+        """
+        return (
+            self.select_related("uprntocouncil__council", "uprntocouncil__station")
+            .annotate(
+                route_type=Subquery(
+                    PostcodeRoute.objects.filter(postcode=OuterRef("postcode")).values(
+                        "route_type"
+                    )[:1]
+                )
+            )
+            .get(uprn=uprn)
+        )
+
+
 class Address(AbstractAddress):
+    objects = AddressManager()
+
     def get_council_from_others_in_postcode(self):
         others = (
             Address.objects.filter(postcode=self.postcode)
@@ -22,10 +47,12 @@ class Address(AbstractAddress):
 
     @property
     def council_id(self):
-        return self.council.council_id
+        return self.uprntocouncil.council_id or self.council.council_id
 
     @property
     def council(self):
+        if self.uprntocouncil.council_id:
+            return self.uprntocouncil.council
         return Council.objects.get(identifiers__contains=[self.uprntocouncil.lad])
 
     @property
@@ -34,6 +61,11 @@ class Address(AbstractAddress):
 
     @property
     def polling_station(self):
+        if self.uprntocouncil.council_id:
+            try:
+                return self.uprntocouncil.station
+            except PollingStation.DoesNotExist:
+                return None
         station = PollingStation.objects.filter(
             internal_council_id=self.polling_station_id, council_id=self.council_id
         )
@@ -64,6 +96,42 @@ class UprnToCouncil(models.Model):
         db_column="uprn",
     )
     polling_station_id = models.CharField(blank=True, max_length=255)
+    # The council whose identifiers contain lad, resolved when the lookup
+    # is built so we don't have to search Council.identifiers on every
+    # request. This isn't a real foreign key because import_councils
+    # deletes and recreates councils, see update_uprn_councils()
+    council = models.ForeignKey(
+        Council,
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    # The polling station for this address. There's no column for this,
+    # it joins on (council, polling_station_id) so it can be select_related()
+    station = models.ForeignObject(
+        PollingStation,
+        on_delete=models.DO_NOTHING,
+        from_fields=["council", "polling_station_id"],
+        to_fields=["council", "internal_council_id"],
+        null=True,
+        related_name="+",
+    )
+
+
+class PostcodeRoute(models.Model):
+    """
+    Everything RoutingHelper needs to know about the addresses in a
+    postcode, precomputed from Address and UprnToCouncil by
+    refresh_postcode_routes() so routing a postcode is one row fetch.
+    """
+
+    postcode = models.CharField(primary_key=True, max_length=15)
+    route_type = models.CharField(max_length=20)
+    council_ids = ArrayField(models.CharField(max_length=100), default=list)
+    polling_station_ids = ArrayField(models.CharField(max_length=255), default=list)
+    # the address to send people to if route_type is 'single_address'
+    uprn = models.CharField(blank=True, max_length=12)
 
 
 def get_uprn_hash_table(gss_code):
@@ -77,3 +145,122 @@ def get_uprn_hash_table(gss_code):
         }
         for a in addresses
     }
+
+
+def update_uprn_councils(lads=None):
+    """
+    Set UprnToCouncil.council from lad for every row (or every row with
+    one of lads) where it is missing or out of date.
+    Returns the number of rows changed.
+    """
+    where = ""
+    params = []
+    if lads is not None:
+        where = "AND u.lad = ANY(%s)"
+        params = [list(lads)]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE addressbase_uprntocouncil u
+            SET council_id = c.council_id
+            FROM (
+                SELECT council_id, unnest(identifiers) AS lad FROM councils_council
+            ) c
+            WHERE u.lad = c.lad AND u.council_id IS DISTINCT FROM c.council_id
+            {};
+            """.format(
+                where
+            ),
+            params,
+        )
+        updated = cursor.rowcount
+        cursor.execute(
+            """
+            UPDATE addressbase_uprntocouncil u
+            SET council_id = NULL
+            WHERE u.council_id IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM councils_council c
+                WHERE c.council_id = u.council_id AND u.lad = ANY(c.identifiers)
+            ) {};
+            """.format(
+                where
+            ),
+            params,
+        )
+        return updated + cursor.rowcount
+
+
+# key for the advisory lock taken by refresh_postcode_routes()
+POSTCODE_ROUTES_LOCK = 2018
+
+
+@transaction.atomic
+def refresh_postcode_routes(council_id=None):
+    """
+    Rebuild PostcodeRoute for every postcode with an address
+    in this council, or for every postcode if council_id is None.
+    route_type is worked out the same way as RoutingHelper.route_type
+
+    Councils can share boundary postcodes, so refreshes for different
+    councils (e.g. `import -m`) would delete and insert the same rows.
+    They take it in turns, holding an advisory lock until commit.
+    """
+    where = ""
+    params = []
+    if council_id:
+        where = """
+            WHERE a.postcode IN (
+                SELECT a2.postcode
+                FROM addressbase_address a2
+                    JOIN addressbase_uprntocouncil u2 ON a2.uprn = u2.uprn
+                WHERE u2.lad IN (
+                    SELECT unnest(identifiers) FROM councils_council
+                    WHERE council_id = %s
+                )
+            )
+        """
+        params = [council_id]
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s);", [POSTCODE_ROUTES_LOCK])
+        cursor.execute(
+            "DELETE FROM addressbase_postcoderoute a {};".format(where), params
+        )
+        cursor.execute(
+            """
+            INSERT INTO addressbase_postcoderoute
+                (postcode, route_type, council_ids, polling_station_ids, uprn)
+            SELECT postcode,
+                CASE
+                    WHEN cardinality(council_ids) > 1 AND station_ids = '{{""}}'
+                        THEN 'multiple_addresses'
+                    WHEN station_ids = '{{""}}' THEN 'postcode'
+                    WHEN cardinality(station_ids) = 1 THEN 'single_address'
+                    ELSE 'multiple_addresses'
+                END,
+                council_ids, station_ids, uprn
+            FROM (
+                SELECT a.postcode,
+                    COALESCE(
+                        array_agg(DISTINCT COALESCE(u.council_id, c.council_id))
+                        FILTER (WHERE COALESCE(u.council_id, c.council_id) IS NOT NULL),
+                        '{{}}'
+                    ) AS council_ids,
+                    array_agg(DISTINCT u.polling_station_id) AS station_ids,
+                    MIN(a.uprn) AS uprn
+                FROM addressbase_address a
+                    JOIN addressbase_uprntocouncil u ON a.uprn = u.uprn
+                    LEFT JOIN (
+                        SELECT council_id, unnest(identifiers) AS lad
+                        FROM councils_council
+                    ) c ON u.lad = c.lad
+                {}
+                GROUP BY a.postcode
+            ) routes;
+            """.format(
+                where
+            ),
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,188 @@
+"""
+Helpers for managing addressbase_uprntocouncil as a table
+which is list partitioned by lad, with one partition per council.
+
+Nearly everything we do to this table (imports, teardown, reports)
+filters by lad, so postgres only has to touch one small partition.
+Partitioning needs postgres 11 or later. It is optional, see the
+partition_uprn_council_lookup management command.
+"""
+
+import re
+
+TABLE_NAME = "addressbase_uprntocouncil"
+NEW_TABLE_NAME = "addressbase_uprntocouncil_new"
+
+
+def check_lad(lad):
+    # lad ends up in table names, so be strict about what it can contain
+    if not re.match(r"^[A-Za-z0-9]+$", lad):
+        raise ValueError(f"Can't create a partition for lad '{lad}'")
+    return lad
+
+
+def partition_name(lad, table=TABLE_NAME):
+    return f"{table}_{check_lad(lad).lower()}"
+
+
+def default_partition_name(table=TABLE_NAME):
+    return f"{table}_default"
+
+
+def supports_partitioning(connection):
+    return connection.pg_version >= 110000
+
+
+def is_partitioned(cursor, table=TABLE_NAME):
+    cursor.execute(
+        """
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)
+        );
+        """,
+        [table],
+    )
+    return cursor.fetchone()[0]
+
+
+def get_partitions(cursor, table=TABLE_NAME):
+    """
+    Returns {partition name: lad} for table's partitions.
+    The default partition has a lad of None.
+    """
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = %s::regclass;
+        """,
+        [table],
+    )
+    partitions = {}
+    for name, bound in cursor.fetchall():
+        match = re.match(r"^FOR VALUES IN \('(.*)'\)$", bound)
+        partitions[name] = match.group(1) if match else None
+    return partitions
+
+
+def create_partitioned_table(cursor, table, like=TABLE_NAME):
+    """
+    Create an empty partitioned copy of like's columns (but not its
+    indexes or constraints) with a default partition to catch any
+    rows whose lad doesn't have a partition of its own.
+    """
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {table}
+        (LIKE {like} INCLUDING DEFAULTS) PARTITION BY LIST (lad);
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {default_partition_name(table)}
+        PARTITION OF {table} DEFAULT;
+        """
+    )
+
+
+def create_partition(cursor, lad, table=TABLE_NAME):
+    """
+    Add a partition for lad, moving over any rows for it which
+    have ended up in the default partition in the meantime.
+    Returns the number of rows moved.
+    """
+    name = partition_name(lad, table)
+    default = default_partition_name(table)
+    cursor.execute(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS);")
+    cursor.execute(
+        f"""
+        WITH moved AS (DELETE FROM {default} WHERE lad = %s RETURNING *)
+        INSERT INTO {name} SELECT * FROM moved;
+        """,
+        [lad],
+    )
+    moved = cursor.rowcount
+    cursor.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES IN (%s);", [lad]
+    )
+    return moved
+
+
+def create_missing_partitions(cursor, lads, table=TABLE_NAME):
+    """
+    Make sure each of lads has its own partition.
+    Returns the lads we created partitions for.
+    """
+    existing = set(get_partitions(cursor, table).values())
+    created = []
+    for lad in sorted(set(lads) - existing):
+        create_partition(cursor, lad, table)
+        created.append(lad)
+    return created
+
+
+def copy_indexes_and_constraints(cursor, table, new_table, primary_key=None):
+    """
+    Recreate table's constraints and indexes on new_table. Index names have
+    to be unique, so these get temporary names until the tables are swapped.
+    The primary key can be replaced with one on the primary_key columns
+    e.g: a partitioned table's primary key has to include lad.
+    Returns (temporary, original) pairs.
+    """
+    renames = []
+    cursor.execute(
+        """
+        SELECT conname, contype, pg_get_constraintdef(oid)
+        FROM pg_constraint WHERE conrelid = %s::regclass;
+        """,
+        [table],
+    )
+    constraints = cursor.fetchall()
+    for name, contype, definition in constraints:
+        new_name = name
+        if contype == "p" and primary_key:
+            definition = "PRIMARY KEY ({})".format(", ".join(primary_key))
+        if contype in ("p", "u"):
+            new_name = f"{name[:59]}_new"
+            renames.append((new_name, name))
+        cursor.execute(
+            f"ALTER TABLE {new_table} ADD CONSTRAINT {new_name} {definition};"
+        )
+
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s;", [table]
+    )
+    constraint_names = {name for name, _, _ in constraints}
+    for name, definition in cursor.fetchall():
+        if name in constraint_names:
+            continue
+        new_name = f"{name[:59]}_new"
+        # indexes on a partitioned table are created with ON ONLY
+        definition = re.sub(
+            rf"INDEX {name} ON (ONLY )?(\S+\.)?{table} ",
+            f"INDEX {new_name} ON {new_table} ",
+            definition,
+        )
+        cursor.execute(definition)
+        renames.append((new_name, name))
+
+    cursor.execute(f"ANALYZE {new_table};")
+    return renames
+
+
+def swap_tables(cursor, table, new_table, renames):
+    """
+    Replace table with new_table, giving new_table's indexes
+    and partitions the names that table's had.
+    Call this inside a transaction.
+    """
+    cursor.execute(f"DROP TABLE {table};")
+    cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table};")
+    for new_name, name in renames:
+        cursor.execute(f"ALTER INDEX {new_name} RENAME TO {name};")
+    if is_partitioned(cursor, table):
+        for name in get_partitions(cursor, table):
+            if name.startswith(f"{new_table}_"):
+                cursor.execute(
+                    f"ALTER TABLE {name} RENAME TO {table}{name[len(new_table):]};"
+                )
@@ -1,8 +1,20 @@
-from django.test import TestCase
+import threading
+from io import StringIO
 
-from addressbase.models import UprnToCouncil
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from addressbase.models import (
+    Address,
+    PostcodeRoute,
+    UprnToCouncil,
+    refresh_postcode_routes,
+    update_uprn_councils,
+)
 from addressbase.tests.factories import UprnToCouncilFactory
 from councils.tests.factories import CouncilFactory
+from pollingstations.tests.factories import PollingStationFactory
 
 
 class TestAddressFactory(TestCase):
@@ -25,3 +37,119 @@ class TestAddressFactory(TestCase):
         address = uprn.uprn
         uprn.delete()
         self.assertIsNone(address.get_council_from_others_in_postcode())
+
+    def test_council_uses_resolved_council(self):
+        council_abc = CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        CouncilFactory(pk="DEF", identifiers=["X01000001"])
+        uprn = UprnToCouncilFactory(lad="X01000000")
+
+        # not resolved yet: fall back to searching identifiers
+        self.assertEqual(uprn.uprn.council, council_abc)
+
+        self.assertEqual(update_uprn_councils(), 1)
+        address = UprnToCouncil.objects.get(pk=uprn.pk).uprn
+        self.assertEqual(address.uprntocouncil.council_id, "ABC")
+        with self.assertNumQueries(1):
+            self.assertEqual(address.council, council_abc)
+        with self.assertNumQueries(0):
+            self.assertEqual(address.council_id, "ABC")
+
+        # the lad moves to another council
+        UprnToCouncil.objects.filter(pk=uprn.pk).update(lad="X01000001")
+        self.assertEqual(update_uprn_councils(), 1)
+        self.assertEqual(UprnToCouncil.objects.get(pk=uprn.pk).council_id, "DEF")
+
+        # and then to one we don't know about
+        UprnToCouncil.objects.filter(pk=uprn.pk).update(lad="X01000002")
+        self.assertEqual(update_uprn_councils(), 1)
+        self.assertIsNone(UprnToCouncil.objects.get(pk=uprn.pk).council_id)
+
+    def test_update_uprn_councils_command(self):
+        CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        CouncilFactory(pk="DEF", identifiers=["X01000001", "X01000002"])
+        UprnToCouncilFactory.create_batch(2, lad="X01000000")
+        UprnToCouncilFactory(lad="X01000002")
+        UprnToCouncilFactory(lad="X01000003")
+
+        self.assertEqual(2, update_uprn_councils(lads=["X01000000", "X01000003"]))
+        self.assertEqual(
+            {"X01000000": "ABC", "X01000002": None, "X01000003": None},
+            dict(UprnToCouncil.objects.values_list("lad", "council_id")),
+        )
+
+        out = StringIO()
+        call_command("update_uprn_councils", stdout=out)
+        self.assertIn("Updated 1 UPRNs", out.getvalue())
+        self.assertEqual(
+            {"X01000000": "ABC", "X01000002": "DEF", "X01000003": None},
+            dict(UprnToCouncil.objects.values_list("lad", "council_id")),
+        )
+
+    def test_get_resolved(self):
+        council = CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        station = PollingStationFactory(council=council, internal_council_id="PS1")
+        uprn = UprnToCouncilFactory(
+            lad="X01000000", polling_station_id="PS1", uprn__postcode="AA1 1AA"
+        )
+        update_uprn_councils()
+        refresh_postcode_routes()
+
+        with self.assertNumQueries(1):
+            address = Address.objects.get_resolved(uprn.pk)
+            self.assertEqual(council, address.council)
+            self.assertEqual("ABC", address.council_id)
+            self.assertEqual(station, address.polling_station)
+            self.assertEqual("single_address", address.route_type)
+
+    def test_get_resolved_without_station(self):
+        CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        uprn = UprnToCouncilFactory(lad="X01000000", polling_station_id="")
+        update_uprn_councils()
+
+        with self.assertNumQueries(1):
+            address = Address.objects.get_resolved(uprn.pk)
+            self.assertIsNone(address.polling_station)
+            self.assertIsNone(address.route_type)
+
+
+class TestRefreshPostcodeRoutes(TransactionTestCase):
+    def test_concurrent_councils_sharing_a_postcode(self):
+        CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        CouncilFactory(pk="DEF", identifiers=["X01000001"])
+        UprnToCouncilFactory.create_batch(
+            3, lad="X01000000", polling_station_id="PS1", uprn__postcode="AA1 1AA"
+        )
+        UprnToCouncilFactory.create_batch(
+            3, lad="X01000001", polling_station_id="PS2", uprn__postcode="AA1 1AA"
+        )
+        UprnToCouncilFactory(lad="X01000001", uprn__postcode="BB1 1BB")
+        update_uprn_councils()
+
+        errors = []
+
+        def refresh(council_id, barrier):
+            try:
+                barrier.wait()
+                refresh_postcode_routes(council_id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        for _ in range(5):
+            barrier = threading.Barrier(2)
+            threads = [
+                threading.Thread(target=refresh, args=(council_id, barrier))
+                for council_id in ("ABC", "DEF")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(2, PostcodeRoute.objects.count())
+        route = PostcodeRoute.objects.get(postcode="AA1 1AA")
+        self.assertEqual("multiple_addresses", route.route_type)
+        self.assertEqual(["ABC", "DEF"], sorted(route.council_ids))
+        self.assertEqual(["PS1", "PS2"], sorted(route.polling_station_ids))
@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from addressbase.models import Address, UprnToCouncil
+from addressbase.tests.factories import AddressFactory, UprnToCouncilFactory
+from councils.tests.factories import CouncilFactory
+
+
+class PierCheckTest(TestCase):
+    def test_pier_check(self):
+        CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        CouncilFactory(pk="DEF", identifiers=["X01000001"])
+
+        # unambiguous: the other address in AA11AA is in ABC
+        UprnToCouncilFactory(lad="X01000000", uprn__postcode="AA11AA")
+        pier = AddressFactory(postcode="AA11AA")
+
+        # ambiguous: addresses in BB11BB are in both councils
+        UprnToCouncilFactory(lad="X01000000", uprn__postcode="BB11BB")
+        UprnToCouncilFactory(lad="X01000001", uprn__postcode="BB11BB")
+        ambiguous = AddressFactory(postcode="BB11BB")
+
+        # nothing else in this postcode
+        lonely = AddressFactory(postcode="CC11CC")
+
+        call_command(
+            "import_uprn_council_lookup", pier_check_only=True, stdout=StringIO()
+        )
+
+        self.assertEqual("X01000000", UprnToCouncil.objects.get(uprn=pier).lad)
+        self.assertEqual("ABC", UprnToCouncil.objects.get(uprn=pier).council_id)
+        self.assertFalse(
+            Address.objects.filter(uprn__in=[ambiguous.uprn, lonely.uprn]).exists()
+        )
+        self.assertEqual(4, UprnToCouncil.objects.count())
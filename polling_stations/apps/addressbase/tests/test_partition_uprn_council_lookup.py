@@ -0,0 +1,47 @@
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from addressbase.models import UprnToCouncil
+from addressbase.partitions import get_partitions, is_partitioned, supports_partitioning
+from addressbase.tests.factories import UprnToCouncilFactory
+
+
+@skipUnless(supports_partitioning(connection), "needs postgres 11 or later")
+class PartitionUprnCouncilLookupTest(TestCase):
+    def partition(self, **kwargs):
+        # we can't drop a table with deferred foreign key checks pending
+        connection.cursor().execute("SET CONSTRAINTS ALL IMMEDIATE;")
+        call_command("partition_uprn_council_lookup", stdout=StringIO(), **kwargs)
+
+    def test_partition_and_undo(self):
+        UprnToCouncilFactory.create_batch(2, lad="X01000000", polling_station_id="A")
+        UprnToCouncilFactory(lad="X01000001")
+
+        self.partition()
+        cursor = connection.cursor()
+        self.assertTrue(is_partitioned(cursor))
+        self.assertEqual(
+            {None, "X01000000", "X01000001"}, set(get_partitions(cursor).values())
+        )
+        self.assertEqual(2, UprnToCouncil.objects.filter(lad="X01000000").count())
+
+        # per-council updates still work through the ORM
+        UprnToCouncil.objects.filter(lad="X01000000").update(polling_station_id="")
+        self.assertFalse(UprnToCouncil.objects.exclude(polling_station_id="").exists())
+
+        # a new council's rows land in the default partition
+        # until we run the command again
+        UprnToCouncilFactory(lad="X01000002")
+        self.partition()
+        partitions = get_partitions(cursor)
+        self.assertIn("addressbase_uprntocouncil_x01000002", partitions)
+        cursor.execute("SELECT COUNT(*) FROM addressbase_uprntocouncil_default;")
+        self.assertEqual(0, cursor.fetchone()[0])
+
+        self.partition(undo=True)
+        self.assertFalse(is_partitioned(cursor))
+        self.assertEqual(4, UprnToCouncil.objects.count())
@@ -0,0 +1,77 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from addressbase.tests.factories import AddressFactory
+
+
+class SubsetSourceCsvTest(TestCase):
+    def run_command(self, source, **kwargs):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_path = os.path.join(tmpdir, "source.csv")
+            destination_path = os.path.join(tmpdir, "destination.csv")
+            with open(source_path, "w") as f:
+                f.write(source)
+            call_command(
+                "subset_source_csv",
+                source_path,
+                destination_path,
+                stdout=StringIO(),
+                **kwargs,
+            )
+            with open(destination_path) as f:
+                return f.read()
+
+    def test_xpress(self):
+        AddressFactory(uprn="100040310729")
+        source = (
+            "Property_URN,AddressLine1,Polling_Place_Name\r\n"
+            "100040310729,1 Cross View Terrace,Memorial Hall\r\n"
+            "100040310730,2 Cross View Terrace,Memorial Hall\r\n"
+        )
+        self.assertEqual(
+            "Property_URN,AddressLine1,Polling_Place_Name\r\n"
+            "100040310729,1 Cross View Terrace,[TESTING]Memorial Hall[TESTING]\r\n",
+            self.run_command(source),
+        )
+
+    def test_halarose(self):
+        AddressFactory(uprn="10023117155")
+        source = (
+            "UPRN,PollingStationName,PollingStationNumber\r\n"
+            "010023117155,Village Hall,1\r\n"
+            "10023117156,Village Hall,1\r\n"
+        )
+        self.assertEqual(
+            "UPRN,PollingStationName,PollingStationNumber\r\n"
+            "010023117155,[TESTING]Village Hall[TESTING],1\r\n",
+            self.run_command(source, ems="halarose"),
+        )
+
+    def test_democracy_counts(self):
+        AddressFactory(uprn="100110711155")
+        source = (
+            "uprn,add1,postcode,stationcode\r\n"
+            "100110711155,1 High Street,AA1 1AA,S1\r\n"
+            "100110711156,2 High Street,AA1 1AA,S1\r\n"
+        )
+        self.assertEqual(
+            "uprn,add1,postcode,stationcode\r\n"
+            "100110711155,1 High Street,AA1 1AA,S1\r\n",
+            self.run_command(source, ems="democracy-counts"),
+        )
+
+    def test_democracy_counts_stations(self):
+        AddressFactory(uprn="100110711155")
+        source = (
+            "uprn,postcode,stationcode,placename\r\n"
+            "100110711155,AA1 1AA,S1,Church Hall\r\n"
+        )
+        self.assertEqual(
+            "uprn,postcode,stationcode,placename\r\n"
+            "100110711155,AA1 1AA,S1,[TESTING]Church Hall[TESTING]\r\n",
+            self.run_command(source, ems="democracy-counts"),
+        )
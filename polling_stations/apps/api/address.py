@@ -7,13 +7,7 @@ from django.core.exceptions import ObjectDoesNotExist
 
 from addressbase.models import Address
 from data_finder.views import LogLookUpMixin
-from data_finder.helpers import (
-    EveryElectionWrapper,
-    geocode_point_only,
-    PostcodeError,
-    RoutingHelper,
-)
-from uk_geo_utils.helpers import Postcode
+from data_finder.helpers import geocode_point_only, LookupEngine
 from .councils import CouncilDataSerializer
 from .fields import PointField
 from .pollingstations import PollingStationGeoSerializer
@@ -77,21 +71,14 @@ class AddressViewSet(ViewSet, LogLookUpMixin):
 
     def get_object(self, **kwargs):
         assert "uprn" in kwargs
-        return Address.objects.get(uprn=kwargs["uprn"])
+        return Address.objects.get_resolved(kwargs["uprn"])
 
-    def get_ee_wrapper(self, address):
-        rh = RoutingHelper(address.postcode)
-        if not rh.addresses_have_single_station:
-            if address.location:
-                return EveryElectionWrapper(point=address.location)
-        return EveryElectionWrapper(postcode=address.postcode)
+    def get_ee_wrapper(self, lookup):
+        return lookup.ee_wrapper
 
     def retrieve(
         self, request, uprn=None, format=None, geocoder=geocode_point_only, log=True
     ):
-        ret = {}
-        ret["custom_finder"] = None
-
         # attempt to get address based on uprn
         # if we fail, return an error response
         try:
@@ -99,40 +86,13 @@ class AddressViewSet(ViewSet, LogLookUpMixin):
         except ObjectDoesNotExist:
             return Response({"detail": "Address not found"}, status=404)
 
-        # create singleton list for consistency with /postcode endpoint
-        ret["addresses"] = [address]
-
-        # council object
-        ret["council"] = address.council
-
-        # attempt to attach point
         # in this situation, failure to geocode is non-fatal
-        try:
-            l = geocoder(address.postcode)
-            location = l.centroid
-        except PostcodeError:
-            location = None
-        ret["postcode_location"] = location
-
-        ret["polling_station_known"] = False
-        ret["polling_station"] = None
-
-        ee = self.get_ee_wrapper(address)
-        has_election = ee.has_election()
-        # An address might have an election but we might not know the polling station.
-        if has_election and address.polling_station_id:
-            # get polling station if there is an election in this area
-            polling_station = address.polling_station
-            if polling_station:
-                ret["polling_station"] = polling_station
-                ret["polling_station_known"] = True
-
-        ret["metadata"] = ee.get_metadata()
-
-        if request.query_params.get("all_future_ballots", None):
-            ret["ballots"] = ee.get_all_ballots()
-        else:
-            ret["ballots"] = ee.get_ballots_for_next_date()
+        lookup = LookupEngine(address.postcode, address=address, geocoder=geocoder)
+        lookup.ee_wrapper = self.get_ee_wrapper(lookup)
+
+        ret = lookup.get_response_data(
+            all_future_ballots=bool(request.query_params.get("all_future_ballots"))
+        )
 
         # create log entry
         log_data = {}
@@ -142,9 +102,9 @@ class AddressViewSet(ViewSet, LogLookUpMixin):
         log_data["brand"] = "api"
         log_data["language"] = ""
         log_data["api_user"] = request.user
-        log_data["has_election"] = has_election
+        log_data["has_election"] = lookup.ee_wrapper.has_election()
         if log:
-            self.log_postcode(Postcode(address.postcode), log_data, "api")
+            self.log_postcode(lookup.postcode, log_data, "api")
 
         ret["report_problem_url"] = get_bug_report_url(
             request, ret["polling_station_known"]
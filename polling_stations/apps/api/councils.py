@@ -24,6 +24,16 @@ def contact_type_to_dict(obj, contact_type):
     return data
 
 
+# resolutions the geo endpoint can serve -> CouncilGeography field
+GEO_RESOLUTIONS = {
+    "full": "geography",
+    "high": "geography_high",
+    "medium": "geography_medium",
+    "low": "geography_low",
+    "bbox": "bbox",
+}
+
+
 COUNCIL_FIELDS = (
     "url",
     "council_id",
@@ -77,7 +87,9 @@ class CouncilGeoSerializer(GeoFeatureModelSerializer, CouncilContactsMixin):
     geography_model_geo_field = GeometrySerializerMethodField()
 
     def get_geography_model_geo_field(self, obj):
-        return obj.geography.geography
+        field = GEO_RESOLUTIONS[self.context.get("resolution", "full")]
+        # fall back to the full geography if we haven't simplified this one
+        return getattr(obj.geography, field) or obj.geography.geography
 
     class Meta:
         model = Council
@@ -128,13 +140,34 @@ class CouncilViewSet(ReadOnlyModelViewSet):
 
     @action(detail=True, url_path="geo")
     def geo(self, request, pk=None, format=None):
+        resolution = request.query_params.get("resolution", "full")
+        if resolution not in GEO_RESOLUTIONS:
+            return Response(
+                {
+                    "detail": "resolution must be one of: {}".format(
+                        ", ".join(GEO_RESOLUTIONS)
+                    )
+                },
+                400,
+            )
+
+        # only load the geometry we're going to serve
+        deferred = [
+            "geography__{}".format(field)
+            for name, field in GEO_RESOLUTIONS.items()
+            if name != resolution
+        ]
         try:
-            council = Council.objects.get(pk=pk)
+            council = (
+                Council.objects.select_related("geography").defer(*deferred).get(pk=pk)
+            )
         except ObjectDoesNotExist:
             return Response({"detail": "Not found."}, 404)
         except:
             return Response({"detail": "Internal server error"}, 500)
 
         return Response(
-            CouncilGeoSerializer(council, context={"request": request}).data
+            CouncilGeoSerializer(
+                council, context={"request": request, "resolution": resolution}
+            ).data
         )
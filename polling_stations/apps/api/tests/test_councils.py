@@ -1,6 +1,7 @@
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory
 from api.councils import CouncilViewSet
+from councils.models import CouncilGeography
 from councils.tests.factories import CouncilFactory
 
 
@@ -60,6 +61,27 @@ class CouncilsTest(TestCase):
         response = CouncilViewSet.as_view({"get": "geo"})(self.request, pk="DEF")
         self.assertEqual(None, response.data["geometry"])
 
+    def test_geo_resolution(self):
+        CouncilGeography.objects.filter(council_id="ABC").update(
+            geography_low="MULTIPOLYGON (((-2.8 53.6,1.5 53.6,1.5 52.5,-2.8 53.6)))"
+        )
+        request = APIRequestFactory().get("/foo", {"resolution": "low"})
+        response = CouncilViewSet.as_view({"get": "geo"})(request, pk="ABC")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            [[[-2.8, 53.6], [1.5, 53.6], [1.5, 52.5], [-2.8, 53.6]]],
+            response.data["geometry"]["coordinates"][0],
+        )
+
+        # we haven't precomputed this one, so fall back to the full geography
+        request = APIRequestFactory().get("/foo", {"resolution": "medium"})
+        response = CouncilViewSet.as_view({"get": "geo"})(request, pk="ABC")
+        self.assertEqual(5, len(response.data["geometry"]["coordinates"][0][0]))
+
+        request = APIRequestFactory().get("/foo", {"resolution": "foo"})
+        response = CouncilViewSet.as_view({"get": "geo"})(request, pk="ABC")
+        self.assertEqual(400, response.status_code)
+
     def test_redirect_from_identifier(self):
         """
         Check that a non-PK ID that is a valid identifier is redirected to
@@ -1,4 +1,5 @@
 import json
+import time
 from html import unescape
 
 import requests
@@ -6,9 +7,12 @@ from django.apps import apps
 from django.contrib.gis.geos import GEOSGeometry, MultiPolygon, Polygon
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models.signals import post_save
 from requests.exceptions import HTTPError
 from retry import retry
-from councils.models import Council, CouncilGeography
+from addressbase.models import refresh_postcode_routes, update_uprn_councils
+from councils.models import Council, CouncilGeography, rebuild_subdivided_geography
 
 
 def union_areas(a1, a2):
@@ -57,6 +61,12 @@ class Command(BaseCommand):
             required=False,
             help="<Optional> Alternative url to override settings.BOUNDARIES_URL",
         )
+        parser.add_argument(
+            "-f",
+            "--boundaries-file",
+            required=False,
+            help="<Optional> Load boundaries from a local GeoJSON file instead of a url",
+        )
         parser.add_argument(
             "--only-contact-details",
             action="store_true",
@@ -89,39 +99,92 @@ class Command(BaseCommand):
             raise HTTPError("202 Accepted", response=r)
         return r.json()
 
-    def attach_boundaries(self, url=None, id_field="lad19cd"):
+    def get_boundaries(self, url=None, path=None):
+        if path:
+            self.stdout.write("Loading boundaries from %s..." % (path))
+            with open(path) as f:
+                return json.load(f)
+        if not url:
+            url = settings.BOUNDARIES_URL
+        self.stdout.write("Downloading ONS boundaries from %s..." % (url))
+        return self.get_ons_boundary_json(url)
+
+    def iter_features(self, feature_collection):
+        # pop features off the list as we go, so each one's
+        # coordinates can be freed once we've built its geometry
+        features = feature_collection["features"]
+        features.reverse()
+        while features:
+            yield features.pop()
+
+    def attach_boundaries(self, feature_collection, id_field="lad19cd"):
         """
-        Fetch each council's boundary from ONS and attach it to an existing
-        council object
+        Attach each council's boundary from ONS to an existing council object
 
-        :param url: The URL of the geoJSON file containing council boundaries
+        :param feature_collection: GeoJSON FeatureCollection of council boundaries
         :param id_field: The name of the feature properties field containing
                          the council ID
         :return:
         """
-        if not url:
-            url = settings.BOUNDARIES_URL
-        self.stdout.write("Downloading ONS boundaries from %s..." % (url))
-        feature_collection = self.get_ons_boundary_json(url)
-        for feature in feature_collection["features"]:
+        start = time.time()
+        councils_by_gss = {}
+        for council in Council.objects.all():
+            for identifier in council.identifiers:
+                councils_by_gss[identifier] = council
+        geography_ids = dict(CouncilGeography.objects.values_list("council_id", "id"))
+
+        geographies = {}
+        for feature in self.iter_features(feature_collection):
             gss_code = feature["properties"][id_field]
-            try:
-                council = Council.objects.get(identifiers__contains=[gss_code])
-                self.stdout.write(
-                    "Found boundary for %s: %s" % (gss_code, council.name)
-                )
-            except Council.DoesNotExist:
+            council = councils_by_gss.get(gss_code)
+            if not council:
                 self.stderr.write(
                     "No council object with GSS {} found".format(gss_code)
                 )
                 continue
+            self.stdout.write("Found boundary for %s: %s" % (gss_code, council.name))
+            geographies[council.pk] = CouncilGeography(
+                id=geography_ids.get(council.pk),
+                council=council,
+                gss=gss_code,
+                geography=self.feature_to_multipolygon(feature),
+            )
+
+        CouncilGeography.objects.bulk_create(
+            [g for g in geographies.values() if g.id is None]
+        )
+        CouncilGeography.objects.bulk_update(
+            [g for g in geographies.values() if g.id is not None],
+            ["gss", "geography"],
+            batch_size=50,
+        )
+        self.stdout.write(
+            "Attached %i boundaries in %.1fs" % (len(geographies), time.time() - start)
+        )
 
-            council_geography, _ = CouncilGeography.objects.get_or_create(
-                council=council
+    def simplify_boundaries(self):
+        """
+        Precompute simplified copies and a bounding box of each boundary
+        so we don't have to serve the full resolution geography everywhere
+        """
+        start = time.time()
+        simplified = [
+            "geography_{0}=ST_Multi(ST_SimplifyPreserveTopology(geography, {1}))".format(
+                name, tolerance
             )
-            council_geography.gss = gss_code
-            council_geography.geography = self.feature_to_multipolygon(feature)
-            council_geography.save()
+            for name, tolerance in CouncilGeography.SIMPLIFIED_TOLERANCES.items()
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE councils_councilgeography
+                SET {0}, bbox=ST_Envelope(geography)
+                WHERE geography IS NOT NULL;
+                """.format(
+                    ", ".join(simplified)
+                )
+            )
+        self.stdout.write("Simplified boundaries in %.1fs" % (time.time() - start))
 
     def load_contact_details(self):
         return requests.get(settings.EC_COUNCIL_CONTACT_DETAILS_API_URL).json()
@@ -145,36 +208,53 @@ class Command(BaseCommand):
             raise ValueError("No official name for {}".format(council_data["code"]))
         return unescape(name)
 
-    def import_councils_from_ec(self):
+    def update_council(self, council, council_data):
+        council.name = self.get_council_name(council_data)
+        council.identifiers = council_data["identifiers"]
+
+        if council_data["electoral_services"]:
+            electoral_services = council_data["electoral_services"][0]
+            council.electoral_services_email = electoral_services["email"]
+            council.electoral_services_address = unescape(electoral_services["address"])
+            council.electoral_services_postcode = electoral_services["postcode"]
+            council.electoral_services_phone_numbers = electoral_services["tel"]
+            council.electoral_services_website = electoral_services["website"].replace(
+                "\\", ""
+            )
+        if council_data["registration"]:
+            registration = council_data["registration"][0]
+            council.registration_email = registration["email"]
+            council.registration_address = unescape(registration["address"])
+            council.registration_postcode = registration["postcode"]
+            council.registration_phone_numbers = registration["tel"]
+            council.registration_website = registration["website"].replace("\\", "")
+
+    def import_councils_from_ec(self, contact_details):
         self.stdout.write("Importing councils...")
+        start = time.time()
 
-        for council_data in self.load_contact_details():
+        existing = Council.objects.in_bulk()
+        to_create = {}
+        for council_data in contact_details:
             self.seen_ids.add(council_data["code"])
-            council, _ = Council.objects.get_or_create(council_id=council_data["code"])
-
-            council.name = self.get_council_name(council_data)
-            council.identifiers = council_data["identifiers"]
+            council = existing.get(council_data["code"]) or to_create.setdefault(
+                council_data["code"], Council(council_id=council_data["code"])
+            )
+            self.update_council(council, council_data)
 
-            if council_data["electoral_services"]:
-                electoral_services = council_data["electoral_services"][0]
-                council.electoral_services_email = electoral_services["email"]
-                council.electoral_services_address = unescape(
-                    electoral_services["address"]
-                )
-                council.electoral_services_postcode = electoral_services["postcode"]
-                council.electoral_services_phone_numbers = electoral_services["tel"]
-                council.electoral_services_website = electoral_services[
-                    "website"
-                ].replace("\\", "")
-            if council_data["registration"]:
-                registration = council_data["registration"][0]
-                council.registration_email = registration["email"]
-                council.registration_address = unescape(registration["address"])
-                council.registration_postcode = registration["postcode"]
-                council.registration_phone_numbers = registration["tel"]
-                council.registration_website = registration["website"].replace("\\", "")
-
-            council.save()
+        Council.objects.bulk_create(to_create.values())
+        # bulk_create() doesn't send post_save, but other apps
+        # rely on it to set up their records for new councils
+        for council in to_create.values():
+            post_save.send(sender=Council, instance=council, created=True)
+        Council.objects.bulk_update(
+            [c for c in existing.values() if c.pk in self.seen_ids],
+            [f.name for f in Council._meta.concrete_fields if not f.primary_key],
+            batch_size=100,
+        )
+        self.stdout.write(
+            "Imported %i councils in %.1fs" % (len(self.seen_ids), time.time() - start)
+        )
 
     def handle(self, **options):
         """
@@ -187,19 +267,38 @@ class Command(BaseCommand):
             [apps.get_app_config("councils"), apps.get_app_config("pollingstations")]
         )
 
-        if options["teardown"]:
-            self.stdout.write("Clearing councils table..")
-            Council.objects.all().delete()
-            self.stdout.write("Clearing councils_geography table..")
-            CouncilGeography.objects.all().delete()
+        # fetch everything before we start writing, so we don't
+        # hold a transaction open while we wait on the network
+        contact_details = self.load_contact_details()
+        feature_collection = None
+        if not options["only_contact_details"]:
+            feature_collection = self.get_boundaries(
+                options.get("alt_url"), options.get("boundaries_file")
+            )
+
+        with transaction.atomic():
+            if options["teardown"]:
+                self.stdout.write("Clearing councils table..")
+                Council.objects.all().delete()
+                self.stdout.write("Clearing councils_geography table..")
+                CouncilGeography.objects.all().delete()
 
-        self.seen_ids = set()
-        self.import_councils_from_ec()
+            self.seen_ids = set()
+            self.import_councils_from_ec(contact_details)
 
-        if not options["only_contact_details"]:
-            self.attach_boundaries(options.get("alt_url"))
+            if feature_collection:
+                self.attach_boundaries(feature_collection)
+                self.simplify_boundaries()
+                # bulk_update() doesn't send post_save, so rebuild these ourselves
+                rebuild_subdivided_geography()
+
+            # Clean up old councils that we've not seen in the EC data
+            Council.objects.exclude(council_id__in=self.seen_ids).delete()
 
-        # Clean up old councils that we've not seen in the EC data
-        Council.objects.exclude(council_id__in=self.seen_ids).delete()
+            # identifiers may have changed, so re-resolve each UPRN's council
+            updated = update_uprn_councils()
+            self.stdout.write("Updated council for %i UPRNs" % updated)
+            if updated:
+                refresh_postcode_routes()
 
         self.stdout.write("..done")
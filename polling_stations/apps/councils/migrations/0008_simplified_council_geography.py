@@ -0,0 +1,40 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("councils", "0007_add_council_geography_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="councilgeography",
+            name="bbox",
+            field=django.contrib.gis.db.models.fields.PolygonField(
+                null=True, srid=4326
+            ),
+        ),
+        migrations.AddField(
+            model_name="councilgeography",
+            name="geography_high",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                null=True, srid=4326
+            ),
+        ),
+        migrations.AddField(
+            model_name="councilgeography",
+            name="geography_low",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                null=True, srid=4326
+            ),
+        ),
+        migrations.AddField(
+            model_name="councilgeography",
+            name="geography_medium",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                null=True, srid=4326
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("councils", "0008_simplified_council_geography"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CouncilSubdividedGeography",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("gss", models.CharField(blank=True, max_length=20)),
+                (
+                    "geography",
+                    django.contrib.gis.db.models.fields.MultiPolygonField(srid=4326),
+                ),
+                (
+                    "council",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subdivided_geography",
+                        to="councils.Council",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO councils_councilsubdividedgeography (council_id, gss, geography)
+            SELECT g.council_id, g.gss, ST_Multi(piece)
+            FROM councils_councilgeography g, ST_Subdivide(g.geography) AS piece
+            WHERE g.geography IS NOT NULL;
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("councils", "0009_councilsubdividedgeography"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="council",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["identifiers"], name="council_identifiers_gin"
+            ),
+        ),
+    ]
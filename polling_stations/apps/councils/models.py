@@ -2,6 +2,20 @@ import re
 
 from django.contrib.gis.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection
+from django.db.models.signals import post_save
+
+
+class CouncilManager(models.Manager):
+    def get_by_point(self, point):
+        """
+        Get the council whose boundary covers point
+        using the subdivided council geographies
+        """
+        return (
+            self.filter(subdivided_geography__geography__covers=point).distinct().get()
+        )
 
 
 class Council(models.Model):
@@ -27,13 +41,15 @@ class Council(models.Model):
     registration_postcode = models.CharField(blank=True, null=True, max_length=100)
     registration_address = models.TextField(blank=True, null=True)
 
-    objects = models.Manager()
+    objects = CouncilManager()
 
     def __str__(self):
         return self.name
 
     class Meta:
         ordering = ("name",)
+        # we look councils up by identifiers__contains a lot
+        indexes = [GinIndex(fields=["identifiers"], name="council_identifiers_gin")]
 
     @property
     def nation(self):
@@ -84,8 +100,64 @@ class Council(models.Model):
 
 
 class CouncilGeography(models.Model):
+    # Tolerances (in degrees) used to precompute simplified
+    # copies of each boundary when we import councils
+    SIMPLIFIED_TOLERANCES = {"high": 0.0001, "medium": 0.001, "low": 0.01}
+
     council = models.OneToOneField(
         "Council", related_name="geography", on_delete=models.CASCADE
     )
     gss = models.CharField(blank=True, max_length=20)
     geography = models.MultiPolygonField(null=True)
+    geography_high = models.MultiPolygonField(null=True)
+    geography_medium = models.MultiPolygonField(null=True)
+    geography_low = models.MultiPolygonField(null=True)
+    bbox = models.PolygonField(null=True)
+
+
+class CouncilSubdividedGeography(models.Model):
+    """
+    Each council's boundary split into small pieces with ST_Subdivide.
+    Point in polygon lookups are much faster against small geometries,
+    see http://blog.cleverelephant.ca/2019/11/subdivide.html
+    This is rebuilt whenever a CouncilGeography is saved
+    and by import_councils.
+    """
+
+    council = models.ForeignKey(
+        "Council", related_name="subdivided_geography", on_delete=models.CASCADE
+    )
+    gss = models.CharField(blank=True, max_length=20)
+    geography = models.MultiPolygonField()
+
+
+def rebuild_subdivided_geography(council_id=None):
+    """
+    Rebuild CouncilSubdividedGeography for one council, or all of them
+    """
+    params = [council_id] if council_id else []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM councils_councilsubdividedgeography {};".format(
+                "WHERE council_id = %s" if council_id else ""
+            ),
+            params,
+        )
+        cursor.execute(
+            """
+            INSERT INTO councils_councilsubdividedgeography (council_id, gss, geography)
+            SELECT g.council_id, g.gss, ST_Multi(piece)
+            FROM councils_councilgeography g, ST_Subdivide(g.geography) AS piece
+            WHERE g.geography IS NOT NULL {};
+            """.format(
+                "AND g.council_id = %s" if council_id else ""
+            ),
+            params,
+        )
+
+
+def council_geography_saved(sender, **kwargs):
+    rebuild_subdivided_geography(kwargs["instance"].council_id)
+
+
+post_save.connect(council_geography_saved, sender=CouncilGeography)
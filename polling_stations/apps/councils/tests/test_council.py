@@ -1,6 +1,7 @@
+from django.contrib.gis.geos import Point
 from django.test import TestCase
 
-from councils.models import Council
+from councils.models import Council, CouncilGeography
 from councils.tests.factories import CouncilFactory
 
 
@@ -23,3 +24,19 @@ class CouncilTest(TestCase):
     def test_nation(self):
         newport = Council.objects.get(pk="NWP")
         self.assertEqual("Wales", newport.nation)
+
+    def test_get_by_point(self):
+        # the factory's geography is Exeter
+        inside = Point(-3.52, 50.72, srid=4326)
+        outside = Point(-2.0, 52.0, srid=4326)
+
+        # saving the geography should have subdivided it
+        self.assertTrue(Council.objects.get(pk="NWP").subdivided_geography.exists())
+        self.assertEqual("NWP", Council.objects.get_by_point(inside).pk)
+        with self.assertRaises(Council.DoesNotExist):
+            Council.objects.get_by_point(outside)
+
+        geography = CouncilGeography.objects.get(council_id="NWP")
+        geography.geography = None
+        geography.save()
+        self.assertFalse(Council.objects.get(pk="NWP").subdivided_geography.exists())
@@ -1,6 +1,9 @@
+import json
+import tempfile
 from io import StringIO
 from django.test import TestCase, override_settings
-from councils.models import Council
+from councils.models import Council, CouncilGeography
+from data_importers.models import DataQuality
 from councils.management.commands.import_councils import Command
 
 
@@ -91,3 +94,31 @@ class TestCouncilImporter(TestCase):
         )
 
         assert Council.objects.count() == 6
+
+    @override_settings(NEW_COUNCILS=[])
+    def test_import_councils_boundaries_file(self):
+        cmd = MockCouncilsImporter()
+        cmd.stdout = StringIO()
+        cmd.stderr = StringIO()
+        with tempfile.NamedTemporaryFile("w", suffix=".geojson") as f:
+            json.dump(cmd.get_ons_boundary_json(None), f)
+            f.flush()
+            options = {
+                "teardown": False,
+                "alt_url": None,
+                "only_contact_details": False,
+                "boundaries_file": f.name,
+            }
+
+            # running a second time should update the existing records
+            cmd.handle(**options)
+            cmd.handle(**options)
+
+        assert Council.objects.count() == 6
+        assert DataQuality.objects.count() == 6
+        assert CouncilGeography.objects.count() == 6
+        geography = CouncilGeography.objects.get(council_id="E09000001")
+        assert geography.gss == "E09000001"
+        assert geography.geography is not None
+        assert geography.geography_low is not None
+        assert geography.bbox is not None
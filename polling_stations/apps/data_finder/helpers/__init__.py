@@ -1,9 +1,13 @@
 from .directions import DirectionsHelper
 from .geocoders import (
     PostcodeError,
+    cached_geocode,
     geocode_point_only,
     geocode,
     get_council,
 )
 from .every_election import EveryElectionWrapper
+from .fanout import FanOut
+from .log_writer import log_writer
 from .routing import RoutingHelper
+from .lookup import LookupEngine
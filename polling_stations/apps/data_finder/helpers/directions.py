@@ -4,8 +4,15 @@ import random
 import requests
 from collections import namedtuple
 from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.utils import translation
 from django.utils.translation import ugettext as _
 
+from .outbound import outbound
+from .response_cache import ResponseCache
+
+directions_cache = ResponseCache("directions", "DIRECTIONS_CACHE")
+
 
 Directions = namedtuple(
     "Directions", ["time", "dist", "mode", "route", "precision", "source"]
@@ -29,6 +36,34 @@ def get_distance(start, end):
     return distance_km
 
 
+def get_transport_verb(start, end):
+    if get_distance(start, end) > 1.5:
+        return {"base": "drive", "gerund": "driving"}
+    return {"base": "walk", "gerund": "walking"}
+
+
+def round_point(point, places=4):
+    # 4 decimal places is about 10m, so everyone at the same
+    # postcode centroid gets the same route to their station
+    return Point(round(point.x, places), round(point.y, places), srid=point.srid)
+
+
+def get_cache_key(start, station):
+    end = station.location
+    return "{council}:{station}:{end_x},{end_y}:{start_x},{start_y}:{mode}:{lang}".format(
+        council=station.council_id,
+        station=station.internal_council_id,
+        # if the station moves, we need a new route
+        end_x=end.x,
+        end_y=end.y,
+        start_x=start.x,
+        start_y=start.y,
+        mode=get_transport_verb(start, end)["base"],
+        # the time and distance are translated
+        lang=translation.get_language(),
+    )
+
+
 class DirectionsException(Exception):
     pass
 
@@ -49,7 +84,10 @@ class GoogleDirectionsClient(DirectionsClient):
         )
 
     def get_data(self, url):
-        resp = requests.get(url)
+        try:
+            resp = outbound.get(url)
+        except requests.exceptions.RequestException as e:
+            raise DirectionsException("Google Directions API error: %s" % e)
         if resp.status_code != 200:
             raise DirectionsException(
                 "Google Directions API error: HTTP status code %i" % resp.status_code
@@ -57,11 +95,7 @@ class GoogleDirectionsClient(DirectionsClient):
         return resp.json()
 
     def get_route(self, start, end):
-        distance_km = get_distance(start, end)
-        if distance_km > 1.5:
-            transport_verb = {"base": "drive", "gerund": "driving"}
-        else:
-            transport_verb = {"base": "walk", "gerund": "walking"}
+        transport_verb = get_transport_verb(start, end)
 
         url = "{base_url}&mode={mode}&origin={origin}&destination={destination}".format(
             base_url=self.get_base_url(),
@@ -99,15 +133,35 @@ class GoogleDirectionsClient(DirectionsClient):
 
 class DirectionsHelper:
     def get_directions(self, **kwargs):
+        """
+        Pass station as well as start_location and end_location (the
+        station's location) to cache the route, starting from
+        start_location rounded to the nearest few metres.
+        """
         if kwargs["start_location"] and kwargs["end_location"]:
-            clients = (GoogleDirectionsClient(),)
-            for client in clients:
-                try:
-                    return client.get_route(
-                        kwargs["start_location"], kwargs["end_location"]
+            station = kwargs.get("station")
+            try:
+                if station:
+                    start = round_point(kwargs["start_location"])
+                    return directions_cache.get(
+                        get_cache_key(start, station),
+                        lambda: self.get_route(start, kwargs["end_location"]),
                     )
-                except DirectionsException:
-                    pass
-            return None
+                return self.get_route(kwargs["start_location"], kwargs["end_location"])
+            except DirectionsException:
+                return None
         else:
             return None
+
+    def get_route(self, start, end):
+        """
+        Raises DirectionsException if none of our clients
+        could give us a route
+        """
+        clients = (GoogleDirectionsClient(),)
+        for client in clients:
+            try:
+                return client.get_route(start, end)
+            except DirectionsException:
+                pass
+        raise DirectionsException("No directions from any source")
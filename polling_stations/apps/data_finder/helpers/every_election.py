@@ -3,6 +3,11 @@ import requests
 from django.conf import settings
 from uk_geo_utils.helpers import Postcode
 
+from .outbound import outbound
+from .response_cache import ResponseCache
+
+ee_cache = ResponseCache("ee", "EE_CACHE")
+
 
 class EveryElectionWrapper:
     def __init__(self, postcode=None, point=None):
@@ -23,6 +28,16 @@ class EveryElectionWrapper:
         except requests.exceptions.RequestException:
             self.request_success = False
 
+    @classmethod
+    def no_response(cls):
+        """
+        Behave as if we failed to contact EE
+        e.g: because it didn't answer in time
+        """
+        ee = cls.__new__(cls)
+        ee.request_success = False
+        return ee
+
     def get_data_by_postcode(self, postcode):
         query_url = "%sapi/elections.json?postcode=%s&future=1&current=1" % (
             settings.EE_BASE,
@@ -39,11 +54,14 @@ class EveryElectionWrapper:
         return self.get_data(query_url)
 
     def get_data(self, query_url):
+        return ee_cache.get(query_url, lambda: self.fetch_data(query_url))
+
+    def fetch_data(self, query_url):
         headers = {}
         if hasattr(settings, "CUSTOM_UA"):
             headers["User-Agent"] = settings.CUSTOM_UA
 
-        res = requests.get(query_url, timeout=4, headers=headers)
+        res = outbound.get(query_url, timeout=4, headers=headers)
 
         if res.status_code != 200:
             res.raise_for_status()
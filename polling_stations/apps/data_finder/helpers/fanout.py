@@ -0,0 +1,102 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from django.conf import settings
+from django.utils import translation
+
+
+class LatencyHistogram:
+    """
+    Count how long calls to each of our dependencies take,
+    in buckets of (at most) 50ms, 100ms, 250ms, etc
+    """
+
+    buckets = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, float("inf"))
+
+    def __init__(self):
+        self.counts = defaultdict(lambda: [0] * len(self.buckets))
+        self.timeouts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            self.counts[name][bisect.bisect_left(self.buckets, seconds)] += 1
+
+    def timed_out(self, name):
+        with self._lock:
+            self.timeouts[name] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {
+                    "buckets": dict(zip(self.buckets, counts)),
+                    "timeouts": self.timeouts[name],
+                }
+                for name, counts in self.counts.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+            self.timeouts.clear()
+
+
+latency = LatencyHistogram()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.LOOKUP_WORKERS)
+        return _executor
+
+
+class FanOut:
+    """
+    Make calls to external services in parallel, so a lookup takes as long
+    as the slowest one instead of all of them added together. All the
+    calls share one deadline: once it has passed we stop waiting and
+    use a default instead, so we can still show what we do know.
+
+    The calls run in other threads, so they shouldn't touch the database.
+    """
+
+    def __init__(self, deadline):
+        self.deadline = time.monotonic() + deadline
+        self.futures = {}
+        self.timed_out = []
+
+    def submit(self, name, fn, *args, **kwargs):
+        # translation is per-thread, so take the request's language with us
+        language = translation.get_language()
+
+        def run():
+            start = time.monotonic()
+            try:
+                with translation.override(language):
+                    return fn(*args, **kwargs)
+            finally:
+                latency.observe(name, time.monotonic() - start)
+
+        self.futures[name] = get_executor().submit(run)
+
+    def result(self, name, default=None):
+        """
+        Wait for name's result until the deadline.
+        Re-raises any exception the call raised.
+        """
+        timeout = max(0, self.deadline - time.monotonic())
+        try:
+            return self.futures[name].result(timeout=timeout)
+        except TimeoutError:
+            self.timed_out.append(name)
+            latency.timed_out(name)
+            return default
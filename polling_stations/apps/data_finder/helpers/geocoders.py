@@ -1,6 +1,10 @@
 import abc
+import threading
+import time
+from collections import OrderedDict
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist
 
 from uk_geo_utils.helpers import Postcode
@@ -8,6 +12,7 @@ from uk_geo_utils.geocoders import (
     AddressBaseGeocoder,
     OnspdGeocoder,
     CodesNotFoundException,
+    MultipleCodesException,
 )
 
 from pollingstations.models import Council
@@ -17,6 +22,26 @@ class PostcodeError(Exception):
     pass
 
 
+class OldToNewMixin:
+    """
+    Translate old codes if our data source isn't up-to-date yet
+    """
+
+    def get_code(self, code_type, *args, **kwargs):
+        code = super().get_code(code_type, *args, **kwargs)
+        if code_type == "lad" and code in settings.OLD_TO_NEW_MAP:
+            return settings.OLD_TO_NEW_MAP[code]
+        return code
+
+
+class PatchedAddressBaseGeocoder(OldToNewMixin, AddressBaseGeocoder):
+    pass
+
+
+class PatchedOnspdGeocoder(OldToNewMixin, OnspdGeocoder):
+    pass
+
+
 class BaseGeocoder(metaclass=abc.ABCMeta):
     def __init__(self, postcode):
         self.postcode = self.format_postcode(postcode)
@@ -35,7 +60,7 @@ class BaseGeocoder(metaclass=abc.ABCMeta):
 
 class OnspdGeocoderAdapter(BaseGeocoder):
     def geocode(self):
-        geocoder = OnspdGeocoder(self.postcode)
+        geocoder = PatchedOnspdGeocoder(self.postcode)
         centre = geocoder.centroid
         if not centre:
             raise PostcodeError("No location information")
@@ -61,7 +86,7 @@ class OnspdGeocoderAdapter(BaseGeocoder):
 
 class AddressBaseGeocoderAdapter(BaseGeocoder):
     def geocode(self):
-        return AddressBaseGeocoder(self.postcode)
+        return PatchedAddressBaseGeocoder(self.postcode)
 
     def geocode_point_only(self):
         return AddressBaseGeocoder(self.postcode)
@@ -90,23 +115,13 @@ def geocode_point_only(postcode):
     raise PostcodeError("Could not geocode from any source")
 
 
-def geocode(postcode):
+def geocode(postcode, result=lambda geocoder: geocoder):
     geocoders = (AddressBaseGeocoderAdapter(postcode), OnspdGeocoderAdapter(postcode))
     for geocoder in geocoders:
         try:
-            gc = geocoder.geocode()
-
-            # Declare a new subclass of whatever type `gc` is on-the-fly
-            # this allows us to monkey-patch `get_code()` with a function that
-            # can translate old codes if our data source isn't up-to-date yet
-            class PatchedGeocoder(type(gc)):
-                def get_code(self, code_type, *args, **kwargs):
-                    code = super().get_code(code_type, *args, **kwargs)
-                    if code_type == "lad" and code in settings.OLD_TO_NEW_MAP:
-                        return settings.OLD_TO_NEW_MAP[code]
-                    return code
-
-            return PatchedGeocoder(postcode)
+            # build the result in here: some geocoders don't look
+            # anything up until we ask them for a code
+            return result(geocoder.geocode())
 
         except ObjectDoesNotExist:
             # we couldn't find this postcode in AddressBase
@@ -137,4 +152,155 @@ def get_council(geocode_result):
             identifiers__contains=[geocode_result.get_code("lad")]
         )
     except Council.DoesNotExist:
-        return Council.objects.get(geography__geography__covers=geocode_result.centroid)
+        return Council.objects.get_by_point(geocode_result.centroid)
+
+
+class GeocodeResult:
+    """
+    The parts of a geocoder we need to look up a postcode, with the
+    OLD_TO_NEW_MAP translation already applied, so we can cache them
+    instead of querying ONSPD/AddressBase again.
+    """
+
+    code_types = ("lad",)
+    multiple = "MULTIPLE"
+
+    def __init__(self, postcode, centroid, codes):
+        self.postcode = postcode
+        self.centroid = centroid
+        self.codes = codes
+
+    @classmethod
+    def from_geocoder(cls, postcode, geocoder):
+        codes = {}
+        for code_type in cls.code_types:
+            try:
+                codes[code_type] = geocoder.get_code(code_type)
+            except MultipleCodesException:
+                codes[code_type] = cls.multiple
+        return cls(postcode, geocoder.centroid, codes)
+
+    def get_code(self, code_type):
+        code = self.codes[code_type]
+        if code == self.multiple:
+            raise MultipleCodesException(
+                "Postcode %s covers more than one '%s'" % (self.postcode, code_type)
+            )
+        return code
+
+
+def geocode_result(postcode):
+    """
+    Like geocode(), but returns a GeocodeResult
+    """
+    return geocode(
+        postcode,
+        result=lambda geocoder: GeocodeResult.from_geocoder(postcode, geocoder),
+    )
+
+
+class GeocoderCache:
+    """
+    Cache the results of geocode(), first in memory in this process and
+    then (optionally) in a django cache shared between processes.
+
+    Configured by settings.GEOCODER_CACHE:
+
+    LRU_SIZE:      postcodes to keep in memory. 0 turns the cache off
+    LOCAL_TIMEOUT: seconds to keep a postcode in memory for
+    BACKEND:       the django cache alias to share results in, or None
+    TIMEOUT:       seconds to keep a postcode in the shared cache for
+
+    clear() throws everything away. Other processes keep using what they
+    have in memory for up to LOCAL_TIMEOUT seconds, but won't get anything
+    from before the clear() out of the shared cache.
+    """
+
+    defaults = {
+        "LRU_SIZE": 10000,
+        "LOCAL_TIMEOUT": 60,
+        "BACKEND": None,
+        "TIMEOUT": 60 * 60 * 24,
+    }
+    generation_key = "geocoder:generation"
+
+    def __init__(self):
+        self.local = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_setting(self, key):
+        return getattr(settings, "GEOCODER_CACHE", {}).get(key, self.defaults[key])
+
+    @property
+    def shared(self):
+        backend = self.get_setting("BACKEND")
+        return caches[backend] if backend else None
+
+    def get_local(self, key):
+        with self._lock:
+            entry = self.local.get(key)
+            if not entry:
+                return None
+            added, value = entry
+            if time.monotonic() - added > self.get_setting("LOCAL_TIMEOUT"):
+                del self.local[key]
+                return None
+            self.local.move_to_end(key)
+            return value
+
+    def set_local(self, key, value):
+        with self._lock:
+            self.local[key] = (time.monotonic(), value)
+            self.local.move_to_end(key)
+            while len(self.local) > self.get_setting("LRU_SIZE"):
+                self.local.popitem(last=False)
+
+    def fetch(self, postcode):
+        try:
+            return geocode_result(postcode)
+        except PostcodeError as e:
+            # remember postcodes we can't geocode too
+            return e
+
+    def geocode(self, postcode):
+        key = Postcode(postcode).without_space
+        if not self.get_setting("LRU_SIZE"):
+            value = self.fetch(key)
+        else:
+            value = self.get_local(key)
+            if value is None:
+                value = self.get_shared(key)
+                self.set_local(key, value)
+
+        if isinstance(value, PostcodeError):
+            raise PostcodeError(str(value))
+        return value
+
+    def get_shared(self, key):
+        shared = self.shared
+        if not shared:
+            return self.fetch(key)
+        shared_key = "geocoder:%i:%s" % (shared.get(self.generation_key, 0), key)
+        value = shared.get(shared_key)
+        if value is None:
+            value = self.fetch(key)
+            shared.set(shared_key, value, self.get_setting("TIMEOUT"))
+        return value
+
+    def clear(self):
+        with self._lock:
+            self.local.clear()
+        shared = self.shared
+        if shared:
+            shared.add(self.generation_key, 0, None)
+            shared.incr(self.generation_key)
+
+
+geocoder_cache = GeocoderCache()
+
+
+def cached_geocode(postcode):
+    """
+    Like geocode(), but returns a GeocodeResult which may have been cached
+    """
+    return geocoder_cache.geocode(postcode)
@@ -0,0 +1,152 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+from data_finder.models import LoggedPostcode
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedLogWriter:
+    """
+    Write LoggedPostcode records without holding up the request.
+
+    Configured by settings.POSTCODE_LOGGING:
+
+    BUFFERED:       if False, just save each record as we get it
+    BATCH_SIZE:     write records in batches of up to this many
+    FLUSH_INTERVAL: seconds to wait for a batch to fill up before
+                    writing what we've got
+    MAX_QUEUE_SIZE: records to hold in memory before we start dropping
+                    them, so a slow database can't eat all our memory
+    DATABASE:       database alias to write the records to
+
+    Records are queued in memory and written by a background thread, so
+    if the process dies (rather than exiting normally) we lose whatever
+    is in the queue. That's OK for analytics. Each record's created time
+    is set when it is queued, so it is the time of the lookup, however
+    long the record waits to be written.
+    """
+
+    defaults = {
+        "BUFFERED": False,
+        "BATCH_SIZE": 500,
+        "FLUSH_INTERVAL": 5,
+        "MAX_QUEUE_SIZE": 10000,
+        "DATABASE": "default",
+    }
+    # how often the background thread checks whether it has been stopped
+    poll_interval = 0.1
+
+    def __init__(self, background=True):
+        self.background = background
+        self.queue = None
+        self.thread = None
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def get_setting(self, key):
+        return getattr(settings, "POSTCODE_LOGGING", {}).get(key, self.defaults[key])
+
+    def write(self, **kwargs):
+        record = LoggedPostcode(**kwargs)
+        if not self.get_setting("BUFFERED"):
+            record.save(using=self.get_setting("DATABASE"))
+            with self._lock:
+                self.stats["written"] += 1
+            return
+
+        self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.stats["dropped"] += 1
+
+    def start(self):
+        with self._lock:
+            if self.queue is None:
+                self.queue = queue.Queue(maxsize=self.get_setting("MAX_QUEUE_SIZE"))
+            if self.background and self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.run, name="postcode-log-writer", daemon=True
+                )
+                self.thread.start()
+                atexit.register(self.close)
+
+    def get_batch(self, timeout):
+        """
+        Wait up to timeout seconds for BATCH_SIZE records
+        and return however many we got.
+        """
+        batch = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.get_setting("BATCH_SIZE"):
+            remaining = deadline - time.monotonic()
+            waiting = remaining > 0 and not self._stop.is_set()
+            try:
+                if waiting:
+                    batch.append(
+                        self.queue.get(timeout=min(remaining, self.poll_interval))
+                    )
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                if not waiting:
+                    break
+        return batch
+
+    def run(self):
+        while not self._stop.is_set():
+            self.flush(timeout=self.get_setting("FLUSH_INTERVAL"))
+        connections[self.get_setting("DATABASE")].close()
+
+    def flush(self, timeout=0):
+        """
+        Write a batch of records. Returns how many we wrote.
+        """
+        if self.queue is None:
+            return 0
+        batch = self.get_batch(timeout)
+        if not batch:
+            return 0
+        database = self.get_setting("DATABASE")
+        try:
+            LoggedPostcode.objects.using(database).bulk_create(batch)
+        except Exception:
+            logger.exception("Failed to write %i postcode logs", len(batch))
+            with self._lock:
+                self.stats["failed"] += len(batch)
+            # in case the connection is broken, get a new one next time
+            connections[database].close()
+            return 0
+        with self._lock:
+            self.stats["written"] += len(batch)
+        return len(batch)
+
+    def close(self):
+        """
+        Stop the background thread and write whatever is left in the queue
+        """
+        self._stop.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        while self.flush():
+            pass
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+        stats["queued"] = self.queue.qsize() if self.queue else 0
+        return stats
+
+
+log_writer = BufferedLogWriter()
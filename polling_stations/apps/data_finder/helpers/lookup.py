@@ -0,0 +1,179 @@
+from django.utils.functional import cached_property
+from uk_geo_utils.geocoders import MultipleCodesException
+from uk_geo_utils.helpers import AddressSorter, Postcode
+
+from addressbase.models import Address
+from councils.models import Council
+from pollingstations.models import CustomFinder
+from .every_election import EveryElectionWrapper
+from .geocoders import PostcodeError, cached_geocode, get_council
+from .routing import RoutingHelper
+
+
+class LookupEngine:
+    """
+    Works out everything we need to answer a lookup for a postcode,
+    or for a single address, so the web views and the API don't each
+    do it their own way. Each part is only worked out once, and only
+    when something asks for it.
+    """
+
+    def __init__(self, postcode, address=None, geocoder=cached_geocode):
+        self.postcode = Postcode(postcode)
+        self.address = address
+        self.geocoder = geocoder
+
+    @classmethod
+    def for_uprn(cls, uprn, geocoder=cached_geocode):
+        """
+        Raises Address.DoesNotExist if we don't have this UPRN
+        """
+        address = Address.objects.get_resolved(uprn)
+        return cls(address.postcode, address=address, geocoder=geocoder)
+
+    @cached_property
+    def routing(self):
+        return RoutingHelper(self.postcode)
+
+    @cached_property
+    def _geocoded(self):
+        try:
+            return self.geocoder(self.postcode), None
+        except PostcodeError as e:
+            return None, e
+
+    @property
+    def geocode_result(self):
+        """
+        Raises PostcodeError if we couldn't geocode the postcode
+        """
+        result, error = self._geocoded
+        if error:
+            raise error
+        return result
+
+    @cached_property
+    def location(self):
+        result, _ = self._geocoded
+        return result.centroid if result else None
+
+    @cached_property
+    def council(self):
+        """
+        None if the postcode is split between councils.
+        May raise ObjectDoesNotExist if we can't find a council.
+        """
+        if self.address:
+            return self.address.council
+        if self.routing.councils:
+            return None
+        if self.routing.route and self.routing.route.council_ids:
+            council = Council.objects.filter(
+                pk=self.routing.route.council_ids[0]
+            ).first()
+            if council:
+                return council
+        if not self.geocode_result:
+            return None
+        return get_council(self.geocode_result)
+
+    @cached_property
+    def station(self):
+        """
+        The polling station, if we know it
+        """
+        if self.address:
+            if self.address.polling_station_id:
+                return self.address.polling_station
+            return None
+        if self.routing.route_type != "single_address":
+            return None
+        if self.routing.route:
+            return Address.objects.get_resolved(self.routing.route.uprn).polling_station
+        return self.routing.addresses[0].polling_station
+
+    @cached_property
+    def addresses(self):
+        """
+        The addresses to choose from if we need to ask which one you live at
+        """
+        if self.address:
+            return [self.address]
+        if self.routing.route_type == "multiple_addresses":
+            return AddressSorter(self.routing.addresses).natural_sort()
+        return []
+
+    @cached_property
+    def ee_query(self):
+        """
+        Keyword args for EveryElectionWrapper. Work this out before
+        creating the wrapper in another thread, as it may need the db.
+        """
+        if self.address:
+            route_type = getattr(self.address, "route_type", None)
+            if route_type:
+                single_station = route_type == "single_address"
+            else:
+                # we haven't got a precomputed route for this postcode
+                single_station = self.routing.addresses_have_single_station
+            if not single_station and self.address.location:
+                return {"point": self.address.location}
+        return {"postcode": self.postcode}
+
+    @cached_property
+    def ee_wrapper(self):
+        return EveryElectionWrapper(**self.ee_query)
+
+    @cached_property
+    def custom_finder(self):
+        result, _ = self._geocoded
+        if not result:
+            return None
+        try:
+            return CustomFinder.objects.get_custom_finder(
+                result, self.postcode.without_space
+            )
+        except MultipleCodesException:
+            return None
+
+    @property
+    def custom_finder_url(self):
+        finder = self.custom_finder
+        if not finder or not finder.base_url:
+            return None
+        if finder.can_pass_postcode:
+            return finder.base_url + finder.encoded_postcode
+        return finder.base_url
+
+    def get_response_data(self, all_future_ballots=False):
+        """
+        Everything PostcodeResponseSerializer needs, apart from
+        report_problem_url which depends on the request.
+        Raises PostcodeError and ObjectDoesNotExist like geocode_result
+        and council do.
+        """
+        ee = self.ee_wrapper
+        data = {
+            "postcode_location": self.location,
+            "council": self.council,
+            "addresses": self.addresses,
+            "polling_station": None,
+            "polling_station_known": False,
+            "custom_finder": None,
+        }
+        # only give out a polling station if there is an election here
+        if ee.has_election() and self.station:
+            data["polling_station"] = self.station
+            data["polling_station_known"] = True
+            if not data["council"]:
+                data["council"] = self.station.council
+        # the address endpoint doesn't give out custom finders
+        if not data["polling_station_known"] and self.location and not self.address:
+            data["custom_finder"] = self.custom_finder_url
+
+        data["metadata"] = ee.get_metadata()
+        if all_future_ballots:
+            data["ballots"] = ee.get_all_ballots()
+        else:
+            data["ballots"] = ee.get_ballots_for_next_date()
+        return data
@@ -0,0 +1,210 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of making a request to a host which has been failing.
+    This is a RequestException, so callers which already cope with the
+    host being down don't need to do anything different.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests to a host after failure_threshold failures in a
+    row. After reset_timeout seconds we let one request through to see if
+    it has recovered: if it works we close the circuit again, if it fails
+    we wait another reset_timeout seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.time() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self):
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self.trial_in_progress:
+                self.trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_progress = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial_in_progress or self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+            self.trial_in_progress = False
+
+
+class OutboundHTTP:
+    """
+    Make GET requests to external services through one pooled session
+    per host, so we can re-use connections, with a few retries for
+    transient errors and a circuit breaker per host.
+
+    Configured by settings.OUTBOUND_HTTP:
+
+    RETRIES:           how many times to retry a request that couldn't
+                       connect or got a 502/503/504. We don't retry read
+                       timeouts: the caller has already waited as long as
+                       it is prepared to
+    BACKOFF:           seconds to wait before the first retry. This doubles
+                       for each retry and is jittered so clients don't retry
+                       in lockstep
+    FAILURE_THRESHOLD: failures in a row before we stop trying a host
+    RESET_TIMEOUT:     seconds to wait before trying that host again
+    POOL_SIZE:         connections to keep open to each host
+    """
+
+    defaults = {
+        "RETRIES": 1,
+        "BACKOFF": 0.1,
+        "FAILURE_THRESHOLD": 5,
+        "RESET_TIMEOUT": 30,
+        "POOL_SIZE": 10,
+    }
+    retry_statuses = (502, 503, 504)
+
+    def __init__(self):
+        self.sessions = {}
+        self.breakers = {}
+        self.stats = defaultdict(
+            lambda: {
+                "requests": 0,
+                "failures": 0,
+                "retries": 0,
+                "rejected": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+            }
+        )
+        self._lock = threading.Lock()
+
+    def get_setting(self, key):
+        return getattr(settings, "OUTBOUND_HTTP", {}).get(key, self.defaults[key])
+
+    def get_session(self, host):
+        with self._lock:
+            if host not in self.sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.get_setting("POOL_SIZE")
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.sessions[host] = session
+            return self.sessions[host]
+
+    def get_breaker(self, host):
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(
+                    failure_threshold=self.get_setting("FAILURE_THRESHOLD"),
+                    reset_timeout=self.get_setting("RESET_TIMEOUT"),
+                )
+            return self.breakers[host]
+
+    def record(self, host, key, value=1):
+        with self._lock:
+            self.stats[host][key] += value
+
+    def record_latency(self, host, seconds):
+        with self._lock:
+            stats = self.stats[host]
+            stats["latency_total"] += seconds
+            stats["latency_max"] = max(stats["latency_max"], seconds)
+
+    def get(self, url, **kwargs):
+        """
+        Same as requests.get(url, **kwargs). Raises CircuitOpenError
+        if host has been failing, instead of waiting for it to time out.
+        """
+        host = urlsplit(url).netloc
+        breaker = self.get_breaker(host)
+        if not breaker.allow_request():
+            self.record(host, "rejected")
+            raise CircuitOpenError("Not sending requests to %s for now" % host)
+
+        session = self.get_session(host)
+        retries = self.get_setting("RETRIES")
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                self.record(host, "retries")
+                backoff = self.get_setting("BACKOFF") * 2 ** (attempt - 1)
+                time.sleep(backoff * random.uniform(0.5, 1.5))
+
+            self.record(host, "requests")
+            start = time.time()
+            try:
+                response = session.get(url, **kwargs)
+            except requests.exceptions.ConnectionError:
+                # includes ConnectTimeout, but not ReadTimeout
+                self.record_latency(host, time.time() - start)
+                if attempt < retries:
+                    continue
+                self.record(host, "failures")
+                breaker.record_failure()
+                raise
+            except Exception:
+                self.record_latency(host, time.time() - start)
+                self.record(host, "failures")
+                breaker.record_failure()
+                raise
+            self.record_latency(host, time.time() - start)
+
+            if response.status_code in self.retry_statuses and attempt < retries:
+                continue
+            if response.status_code >= 500:
+                self.record(host, "failures")
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            return response
+
+    def get_stats(self):
+        """
+        Requests, failures and latency for each host we've talked to,
+        and the state of its circuit breaker.
+        """
+        with self._lock:
+            stats = {host: dict(host_stats) for host, host_stats in self.stats.items()}
+            breakers = dict(self.breakers)
+        for host, breaker in breakers.items():
+            stats.setdefault(host, {})["breaker"] = breaker.state
+        return stats
+
+
+outbound = OutboundHTTP()
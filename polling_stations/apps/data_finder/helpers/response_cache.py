@@ -0,0 +1,152 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import translation
+
+
+class CachedRequestError(requests.exceptions.RequestException):
+    """
+    Raised when we've recently failed to fetch something and
+    we're not going to try again until the error expires.
+    """
+
+
+class ResponseCache:
+    """
+    Cache the results of slow calls to an external service in a
+    django cache. Configured by a settings dict called settings_name:
+
+    BACKEND:       the django cache alias to use
+    TIMEOUT:       seconds a response is fresh for
+    STALE_TIMEOUT: seconds after that we'll keep serving a stale response
+                   while we fetch a new one in the background
+    ERROR_TIMEOUT: seconds to remember a failed request for, so we don't
+                   hammer a service which is already struggling
+
+    Only one request per key is in flight at a time (per process),
+    so if lots of people look up the same postcode at once, they all
+    wait for the same response.
+    """
+
+    defaults = {
+        "BACKEND": "default",
+        "TIMEOUT": 60 * 5,
+        "STALE_TIMEOUT": 60 * 60,
+        "ERROR_TIMEOUT": 30,
+    }
+
+    def __init__(self, prefix, settings_name, max_workers=4):
+        self.prefix = prefix
+        self.settings_name = settings_name
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def get_setting(self, key):
+        return getattr(settings, self.settings_name, {}).get(key, self.defaults[key])
+
+    @property
+    def cache(self):
+        return caches[self.get_setting("BACKEND")]
+
+    def make_key(self, key):
+        # memcached doesn't like long keys or keys with spaces
+        return "%s:%s" % (self.prefix, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def count(self, event):
+        with self._lock:
+            self.stats[event] += 1
+
+    def get(self, key, fetch):
+        """
+        Return the cached response for key, calling fetch() to get a new
+        one if we need to. Raises requests.exceptions.RequestException if
+        fetch() did, or CachedRequestError if it did recently.
+        """
+        cache_key = self.make_key(key)
+        entry = self.cache.get(cache_key)
+        if entry:
+            age = time.time() - entry["fetched_at"]
+            if entry["error"]:
+                if age < self.get_setting("ERROR_TIMEOUT"):
+                    self.count("error_hits")
+                    raise CachedRequestError(entry["error"])
+            elif age < self.get_setting("TIMEOUT"):
+                self.count("hits")
+                return entry["data"]
+            else:
+                self.count("stale_hits")
+                self.revalidate(cache_key, fetch)
+                return entry["data"]
+
+        self.count("misses")
+        return self.fetch(cache_key, fetch).result()
+
+    def revalidate(self, cache_key, fetch):
+        # only one process gets to refresh a stale key at a time. If that
+        # fails, we keep serving the stale response until ERROR_TIMEOUT
+        # has passed and somebody gets to try again
+        if self.cache.add(
+            cache_key + ":refresh", True, self.get_setting("ERROR_TIMEOUT")
+        ):
+            return self.fetch(cache_key, fetch, background=True)
+        return None
+
+    def fetch(self, cache_key, fetch, background=False):
+        with self._lock:
+            future = self._in_flight.get(cache_key)
+            if future:
+                self.stats["coalesced"] += 1
+                return future
+            future = Future()
+            self._in_flight[cache_key] = future
+
+        # translation is per-thread, so take the request's language with us
+        language = translation.get_language()
+        if background:
+            self._executor.submit(
+                self._run, cache_key, fetch, future, background, language
+            )
+        else:
+            self._run(cache_key, fetch, future, background, language)
+        return future
+
+    def _run(self, cache_key, fetch, future, background, language):
+        try:
+            with translation.override(language):
+                data = fetch()
+        except requests.exceptions.RequestException as e:
+            self.count("errors")
+            if not background:
+                self.set(cache_key, error=str(e) or e.__class__.__name__)
+            future.set_exception(e)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            self.set(cache_key, data=data)
+            future.set_result(data)
+        finally:
+            with self._lock:
+                del self._in_flight[cache_key]
+
+    def set(self, cache_key, data=None, error=None):
+        if error:
+            timeout = self.get_setting("ERROR_TIMEOUT")
+        else:
+            timeout = self.get_setting("TIMEOUT") + self.get_setting("STALE_TIMEOUT")
+        self.cache.set(
+            cache_key,
+            {"data": data, "error": error, "fetched_at": time.time()},
+            timeout,
+        )
+
+    def clear_stats(self):
+        with self._lock:
+            self.stats.clear()
@@ -4,7 +4,7 @@ from django.urls import reverse
 from django.utils.functional import cached_property
 from uk_geo_utils.helpers import Postcode
 
-from addressbase.models import Address
+from addressbase.models import Address, PostcodeRoute
 
 
 # use a postcode to decide which endpoint the user should be directed to
@@ -18,14 +18,30 @@ class RoutingHelper:
 
     def __init__(self, postcode):
         self.postcode = Postcode(postcode)
-        self.addresses = self.get_addresses()
+        self.route = self.get_route()
+
+    def get_route(self):
+        """
+        Precomputed routing for this postcode (see PostcodeRoute) if we have it.
+        Otherwise we work it out from the addresses in the postcode.
+        """
+        return PostcodeRoute.objects.filter(postcode=self.postcode.with_space).first()
+
+    @cached_property
+    def addresses(self):
+        return self.get_addresses()
 
     def get_addresses(self):
-        return Address.objects.filter(postcode=self.postcode.with_space)
+        return Address.objects.filter(postcode=self.postcode.with_space).select_related(
+            "uprntocouncil"
+        )
 
     @property
     def councils(self):
-        council_ids = {a.council_id for a in self.addresses if a.council_id}
+        if self.route:
+            council_ids = set(self.route.council_ids)
+        else:
+            council_ids = {a.council_id for a in self.addresses if a.council_id}
         if len(council_ids) == 1:
             return None
         else:
@@ -33,11 +49,13 @@ class RoutingHelper:
 
     @property
     def polling_stations(self):
+        if self.route:
+            return set(self.route.polling_station_ids)
         return {address.polling_station_id for address in self.addresses}
 
     @property
     def has_addresses(self):
-        return bool(self.addresses)
+        return bool(self.route) or bool(self.addresses)
 
     @property
     def no_stations(self):
@@ -55,6 +73,8 @@ class RoutingHelper:
 
     @property
     def route_type(self):
+        if self.route:
+            return self.route.route_type
         if not self.has_addresses:
             # Postcode is not in addressbase
             return "postcode"
@@ -91,6 +111,8 @@ class RoutingHelper:
     @cached_property
     def kwargs(self):
         if self.route_type == "single_address":
+            if self.route:
+                return {"uprn": self.route.uprn}
             return {"uprn": self.addresses[0].uprn}
         return {"postcode": self.postcode.without_space}
 
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from data_finder.helpers.geocoders import geocoder_cache
+
+
+class Command(BaseCommand):
+    """
+    Throw away cached geocoder results (see GeocoderCache).
+    Run this after importing ONSPD or AddressBase.
+    """
+
+    def handle(self, *args, **kwargs):
+        geocoder_cache.clear()
+        self.stdout.write("Cleared geocoder cache")
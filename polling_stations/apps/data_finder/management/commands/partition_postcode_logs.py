@@ -0,0 +1,112 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from addressbase.partitions import (
+    copy_indexes_and_constraints,
+    get_partitions,
+    is_partitioned,
+    supports_partitioning,
+    swap_tables,
+)
+from data_finder.partitions import (
+    NEW_TABLE_NAME,
+    TABLE_NAME,
+    create_missing_partitions,
+    create_partitioned_table,
+    months_between,
+    next_month,
+)
+
+
+class Command(BaseCommand):
+    """
+    Turn data_finder_loggedpostcode into a table which is range
+    partitioned by month (see data_finder.partitions).
+
+    If the table is already partitioned, this adds partitions for the
+    next few months, so run it every month, e.g: from cron.
+
+    Use --undo to turn it back into a normal table.
+
+    The table is locked while it is copied, so lookups will wait to log
+    until this has finished. Run it when the site is quiet.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            help="<Optional> Number of future months to create partitions for (default: 3)",
+            type=int,
+            default=3,
+        )
+        parser.add_argument(
+            "--undo",
+            help="<Optional> Turn the partitioned table back into a normal table",
+            action="store_true",
+            default=False,
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **kwargs):
+        if not supports_partitioning(connection):
+            raise CommandError("Partitioning LoggedPostcode needs postgres 11 or later")
+
+        cursor = connection.cursor()
+        partitioned = is_partitioned(cursor, TABLE_NAME)
+
+        if kwargs["undo"]:
+            if not partitioned:
+                raise CommandError(f"{TABLE_NAME} isn't partitioned")
+            self.stdout.write(f"Copying {TABLE_NAME} into a normal table...")
+            cursor.execute(
+                f"CREATE TABLE {NEW_TABLE_NAME} (LIKE {TABLE_NAME} INCLUDING DEFAULTS);"
+            )
+            self.copy_and_swap(cursor, primary_key=["id"])
+            return
+
+        last_month = timezone.now().date()
+        for _ in range(kwargs["months_ahead"]):
+            last_month = next_month(last_month)
+
+        if partitioned:
+            created = create_missing_partitions(
+                cursor, months_between(timezone.now().date(), last_month)
+            )
+            self.stdout.write(f"Created {len(created)} partitions: {created}")
+            return
+
+        cursor.execute(f"SELECT MIN(created) FROM {TABLE_NAME};")
+        first = cursor.fetchone()[0]
+        months = months_between(
+            first.date() if first else timezone.now().date(), last_month
+        )
+        self.stdout.write(
+            f"Copying {TABLE_NAME} into a table with {len(months)} partitions..."
+        )
+        create_partitioned_table(cursor, NEW_TABLE_NAME)
+        create_missing_partitions(cursor, months, NEW_TABLE_NAME)
+        # the primary key of a partitioned table has to include the partition key
+        self.copy_and_swap(cursor, primary_key=["id", "created"])
+
+    def copy_and_swap(self, cursor, primary_key):
+        cursor.execute(f"INSERT INTO {NEW_TABLE_NAME} SELECT * FROM {TABLE_NAME};")
+        self.stdout.write(f"Copied {cursor.rowcount:,} rows")
+        self.stdout.write("Creating indexes and constraints...")
+        renames = copy_indexes_and_constraints(
+            cursor, TABLE_NAME, NEW_TABLE_NAME, primary_key
+        )
+
+        # id's sequence belongs to the old table, so it would be dropped with it
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id');", [TABLE_NAME])
+        sequence = cursor.fetchone()[0]
+        if sequence:
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE;")
+
+        self.stdout.write(f"Swapping {NEW_TABLE_NAME} for {TABLE_NAME}...")
+        swap_tables(cursor, TABLE_NAME, NEW_TABLE_NAME, renames)
+        if sequence:
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE_NAME}.id;")
+        self.stdout.write(
+            f"..done. {TABLE_NAME} has {len(get_partitions(cursor, TABLE_NAME))} partitions"
+        )
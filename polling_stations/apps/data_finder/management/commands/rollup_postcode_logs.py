@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from data_finder.models import refresh_postcode_rollups
+
+
+class Command(BaseCommand):
+    """
+    Update the hourly LoggedPostcodeRollup counts from LoggedPostcode.
+    By default this picks up from the last hour it rolled up,
+    so it is cheap to run often e.g: every hour from cron.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="<Optional> Recalculate every hour from this date (YYYY-MM-DD) onwards",
+            type=lambda d: timezone.make_aware(datetime.strptime(d, "%Y-%m-%d")),
+            default=None,
+        )
+
+    def handle(self, *args, **kwargs):
+        rows = refresh_postcode_rollups(since=kwargs["since"])
+        self.stdout.write(f"Wrote {rows:,} rollup rows")
@@ -0,0 +1,91 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import translation
+
+from addressbase.models import UprnToCouncil
+from data_finder.helpers import DirectionsHelper, PostcodeError, geocode
+from pollingstations.models import PollingStation
+
+
+class Command(BaseCommand):
+    """
+    Fetch directions from the centroid of each postcode in a council to
+    each of its polling stations, so they are already in the directions
+    cache when people start looking them up.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--council",
+            nargs=1,
+            required=True,
+            help="Council ID to fetch directions for",
+        )
+        parser.add_argument(
+            "--languages",
+            nargs="+",
+            help="<Optional> Languages to fetch directions in "
+            "(default: settings.LANGUAGE_CODE). Each language is another "
+            "paid request per route, so only add them if you need to",
+            default=[settings.LANGUAGE_CODE],
+        )
+        parser.add_argument(
+            "--sleep",
+            help="<Optional> Seconds to wait between requests (default: 0)",
+            type=float,
+            default=0,
+        )
+
+    def handle(self, *args, **kwargs):
+        council_id = kwargs["council"][0]
+        stations = {
+            station.internal_council_id: station
+            for station in PollingStation.objects.filter(
+                council_id=council_id, location__isnull=False
+            )
+        }
+        pairs = (
+            UprnToCouncil.objects.filter(council_id=council_id)
+            .exclude(polling_station_id="")
+            .values_list("uprn__postcode", "polling_station_id")
+            .distinct()
+            .order_by("uprn__postcode")
+        )
+
+        dh = DirectionsHelper()
+        found = failed = no_station = no_postcode = 0
+        for postcode, station_id in pairs:
+            if station_id not in stations:
+                # we don't know where this station is
+                no_station += 1
+                continue
+            try:
+                location = geocode(postcode).centroid
+            except PostcodeError:
+                no_postcode += 1
+                continue
+            for language in kwargs["languages"]:
+                with translation.override(language):
+                    directions = dh.get_directions(
+                        start_location=location,
+                        end_location=stations[station_id].location,
+                        station=stations[station_id],
+                    )
+                if directions:
+                    found += 1
+                else:
+                    failed += 1
+                if kwargs["sleep"]:
+                    time.sleep(kwargs["sleep"])
+
+        self.stdout.write(
+            f"Cached {found} routes for {council_id}, couldn't get {failed}"
+        )
+        self.stdout.write(
+            f"Skipped {no_station + no_postcode} postcode/station pairs: "
+            f"{no_station} with no station location, "
+            f"{no_postcode} with a postcode we couldn't geocode"
+        )
@@ -0,0 +1,76 @@
+# Generated by Django 2.2.16 on 2021-01-20 10:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("councils", "0010_council_identifiers_gin"),
+        ("data_finder", "0011_time_stamped_model_operation_change"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LoggedPostcodeRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hour", models.DateTimeField(db_index=True)),
+                ("brand", models.CharField(blank=True, max_length=100)),
+                ("had_data", models.BooleanField()),
+                ("view_used", models.CharField(blank=True, max_length=100)),
+                ("api_user", models.CharField(blank=True, max_length=30)),
+                ("count", models.IntegerField()),
+                (
+                    "council",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        to="councils.Council",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="had_data",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="brand",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="utm_source",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="utm_medium",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="utm_campaign",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="loggedpostcode",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created"], name="loggedpostcode_created_brin"
+            ),
+        ),
+    ]
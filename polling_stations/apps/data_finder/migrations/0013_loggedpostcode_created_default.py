@@ -0,0 +1,23 @@
+from django.db import migrations
+import django.utils.timezone
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_finder", "0012_loggedpostcode_rollups"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="loggedpostcode",
+            name="created",
+            field=django_extensions.db.fields.CreationDateTimeField(
+                blank=True,
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="created",
+            ),
+        ),
+    ]
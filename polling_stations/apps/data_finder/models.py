@@ -1,13 +1,31 @@
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
+from django_extensions.db.fields import CreationDateTimeField
 from django_extensions.db.models import TimeStampedModel
 
 from councils.models import Council
 
 
 class LoggedPostcode(TimeStampedModel):
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            # rows are only ever appended, so a BRIN index on created
+            # is tiny, cheap to maintain and good enough for time ranges
+            BrinIndex(fields=["created"], name="loggedpostcode_created_brin")
+        ]
+
+    # set when the lookup happens, not when the record is saved:
+    # BufferedLogWriter can save it a while later
+    created = CreationDateTimeField(
+        _("created"), auto_now_add=False, default=timezone.now
+    )
     postcode = models.CharField(max_length=100)
-    had_data = models.BooleanField(default=False, db_index=True)
+    had_data = models.BooleanField(default=False)
     location = models.PointField(null=True, blank=True)
     council = models.ForeignKey(
         Council,
@@ -16,10 +34,10 @@ class LoggedPostcode(TimeStampedModel):
         db_constraint=False,
         on_delete=models.DO_NOTHING,
     )
-    brand = models.CharField(blank=True, max_length=100, db_index=True)
-    utm_source = models.CharField(blank=True, max_length=100, db_index=True)
-    utm_medium = models.CharField(blank=True, max_length=100, db_index=True)
-    utm_campaign = models.CharField(blank=True, max_length=100, db_index=True)
+    brand = models.CharField(blank=True, max_length=100)
+    utm_source = models.CharField(blank=True, max_length=100)
+    utm_medium = models.CharField(blank=True, max_length=100)
+    utm_campaign = models.CharField(blank=True, max_length=100)
     language = models.CharField(blank=True, max_length=5)
     view_used = models.CharField(blank=True, max_length=100)
     api_user = models.CharField(blank=True, null=True, max_length=30)
@@ -27,3 +45,63 @@ class LoggedPostcode(TimeStampedModel):
 
     def __str__(self):
         return "{0} ({1})".format(self.postcode, self.brand)
+
+
+class LoggedPostcodeRollup(models.Model):
+    """
+    Lookups per hour, precomputed from LoggedPostcode by
+    refresh_postcode_rollups() so reports don't have to scan the raw logs.
+    """
+
+    hour = models.DateTimeField(db_index=True)
+    council = models.ForeignKey(
+        Council,
+        null=True,
+        db_constraint=False,
+        on_delete=models.DO_NOTHING,
+    )
+    brand = models.CharField(blank=True, max_length=100)
+    had_data = models.BooleanField()
+    view_used = models.CharField(blank=True, max_length=100)
+    api_user = models.CharField(blank=True, max_length=30)
+    count = models.IntegerField()
+
+
+@transaction.atomic
+def refresh_postcode_rollups(since=None):
+    """
+    Recalculate LoggedPostcodeRollup for every hour from since onwards.
+    If since is None, start from the last hour we've rolled up, which was
+    probably incomplete last time. Returns the number of rows written.
+    """
+    if since is None:
+        since = LoggedPostcodeRollup.objects.aggregate(Max("hour"))["hour__max"]
+    where = ""
+    params = []
+    if since:
+        where = "WHERE {column} >= date_trunc('hour', %s::timestamptz)"
+        params = [since]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM data_finder_loggedpostcoderollup {};".format(
+                where.format(column="hour")
+            ),
+            params,
+        )
+        cursor.execute(
+            """
+            INSERT INTO data_finder_loggedpostcoderollup
+                (hour, council_id, brand, had_data, view_used, api_user, count)
+            SELECT
+                date_trunc('hour', created), council_id, brand, had_data,
+                view_used, COALESCE(api_user, ''), COUNT(*)
+            FROM data_finder_loggedpostcode
+            {}
+            GROUP BY 1, 2, 3, 4, 5, 6;
+            """.format(
+                where.format(column="created")
+            ),
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,102 @@
+"""
+Helpers for managing data_finder_loggedpostcode as a table which is
+range partitioned by month on created.
+
+Each election adds millions of rows to this table, but we only ever
+append to it and report on recent months, so once it is partitioned
+old months can be archived or dropped without touching the rest.
+Like addressbase_uprntocouncil, partitioning needs postgres 11 or
+later and is optional, see the partition_postcode_logs management command.
+"""
+
+from datetime import date, timedelta
+
+from addressbase.partitions import default_partition_name, get_partitions
+
+TABLE_NAME = "data_finder_loggedpostcode"
+NEW_TABLE_NAME = "data_finder_loggedpostcode_new"
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def next_month(month):
+    return month_start(month_start(month) + timedelta(days=32))
+
+
+def months_between(start, end):
+    """
+    The first day of every month from start to end, inclusive
+    """
+    months = []
+    month = month_start(start)
+    while month <= end:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def partition_name(month, table=TABLE_NAME):
+    return f"{table}_{month:%Y%m}"
+
+
+def create_partitioned_table(cursor, table, like=TABLE_NAME):
+    """
+    Create an empty partitioned copy of like's columns (but not its
+    indexes or constraints) with a default partition to catch any
+    rows from months which don't have a partition of their own.
+    """
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {table}
+        (LIKE {like} INCLUDING DEFAULTS) PARTITION BY RANGE (created);
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {default_partition_name(table)}
+        PARTITION OF {table} DEFAULT;
+        """
+    )
+
+
+def create_partition(cursor, month, table=TABLE_NAME):
+    """
+    Add a partition for month, moving over any rows for it which
+    have ended up in the default partition in the meantime.
+    Returns the number of rows moved.
+    """
+    name = partition_name(month, table)
+    bounds = [month_start(month), next_month(month)]
+    cursor.execute(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS);")
+    cursor.execute(
+        f"""
+        WITH moved AS (
+            DELETE FROM {default_partition_name(table)}
+            WHERE created >= %s AND created < %s RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved;
+        """,
+        bounds,
+    )
+    moved = cursor.rowcount
+    cursor.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s);",
+        bounds,
+    )
+    return moved
+
+
+def create_missing_partitions(cursor, months, table=TABLE_NAME):
+    """
+    Make sure each of months has its own partition.
+    Returns the months we created partitions for.
+    """
+    existing = set(get_partitions(cursor, table))
+    created = []
+    for month in sorted({month_start(month) for month in months}):
+        if partition_name(month, table) not in existing:
+            create_partition(cursor, month, table)
+            created.append(month)
+    return created
@@ -1,8 +1,13 @@
+import threading
+
 import mock
 from django.contrib.gis.geos import Point
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
 from data_finder.helpers.directions import Directions, DirectionsException
 from data_finder.helpers import DirectionsHelper
+from pollingstations.models import PollingStation
 
 
 """
@@ -53,3 +58,59 @@ class DirectionsTest(TestCase):
         d = DirectionsHelper()
         result = d.get_directions(start_location=self.a, end_location=self.b)
         self.assertEqual("Google", result.source)
+
+    def test_cache(self):
+        cache.clear()
+        station = PollingStation(
+            council_id="X01", internal_council_id="1", location=self.b
+        )
+        nearby = Point(self.a.x + 0.00001, self.a.y, srid=4326)
+        route = mock.Mock(
+            side_effect=lambda start, end: mock_route_google(None, start, end)
+        )
+        with mock.patch(
+            "data_finder.helpers.directions.GoogleDirectionsClient.get_route", route
+        ):
+            d = DirectionsHelper()
+            for start in [self.a, nearby]:
+                result = d.get_directions(
+                    start_location=start, end_location=self.b, station=station
+                )
+                self.assertEqual("Google", result.source)
+            self.assertEqual(1, route.call_count)
+
+            # the station has moved
+            station.location = Point(self.b.x, self.b.y + 0.01, srid=4326)
+            d.get_directions(
+                start_location=self.a, end_location=station.location, station=station
+            )
+            self.assertEqual(2, route.call_count)
+
+    @override_settings(DIRECTIONS_CACHE={"TIMEOUT": 0})
+    def test_revalidate_keeps_language(self):
+        cache.clear()
+        station = PollingStation(
+            council_id="X01", internal_council_id="1", location=self.b
+        )
+        languages = []
+        refreshed = threading.Event()
+
+        def get_route(start, end):
+            languages.append(translation.get_language())
+            if len(languages) == 2:
+                refreshed.set()
+            return mock_route_google(None, start, end)
+
+        with mock.patch(
+            "data_finder.helpers.directions.GoogleDirectionsClient.get_route",
+            mock.Mock(side_effect=get_route),
+        ), translation.override("cy-gb"):
+            d = DirectionsHelper()
+            # everything is stale straight away, so the second lookup
+            # is served from the cache and refreshed in the background
+            for _ in range(2):
+                d.get_directions(
+                    start_location=self.a, end_location=self.b, station=station
+                )
+            self.assertTrue(refreshed.wait(5))
+        self.assertEqual(["cy-gb", "cy-gb"], languages)
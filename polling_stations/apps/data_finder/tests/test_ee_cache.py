@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from data_finder.helpers import EveryElectionWrapper
+from data_finder.helpers.every_election import ee_cache
+from data_finder.helpers.outbound import outbound
+from data_finder.helpers.response_cache import CachedRequestError
+
+BALLOT = {
+    "election_id": "local.foo.bar.2018-05-03",
+    "election_title": "Foo Council local elections Bar ward",
+    "group_type": None,
+    "cancelled": False,
+    "poll_open_date": "2018-05-03",
+    "metadata": None,
+    "replaced_by": None,
+}
+
+
+class FakeEEHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+        time.sleep(server.delay)
+        if server.status != 200:
+            self.send_response(server.status)
+            self.end_headers()
+            return
+        body = json.dumps({"results": [BALLOT]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class EECacheTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = HTTPServer(("127.0.0.1", 0), FakeEEHandler)
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.delay = 0
+        self.server.status = 200
+        cache.clear()
+        ee_cache.clear_stats()
+        outbound.breakers.clear()
+        self.settings_override = override_settings(
+            EE_BASE="http://127.0.0.1:%i/" % self.server.server_port,
+            EE_CACHE={
+                "BACKEND": "default",
+                "TIMEOUT": 60,
+                "STALE_TIMEOUT": 60,
+                "ERROR_TIMEOUT": 60,
+            },
+        )
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+    def test_caches_responses(self):
+        for _ in range(3):
+            ee = EveryElectionWrapper(postcode="AA11AA")
+            self.assertTrue(ee.request_success)
+            self.assertEqual([BALLOT], ee.get_ballots_for_next_date())
+        EveryElectionWrapper(postcode="BB11BB")
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(2, ee_cache.stats["hits"])
+        self.assertEqual(2, ee_cache.stats["misses"])
+
+    def test_coalesces_requests(self):
+        self.server.delay = 0.5
+        results = []
+
+        def lookup():
+            results.append(EveryElectionWrapper(postcode="AA11AA").request_success)
+
+        threads = [threading.Thread(target=lookup) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([True] * 5, results)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_caches_errors(self):
+        self.server.status = 500
+        ee = EveryElectionWrapper(postcode="AA11AA")
+        self.assertFalse(ee.request_success)
+        self.assertTrue(ee.has_election())
+
+        self.server.status = 200
+        with self.assertRaises(CachedRequestError):
+            ee.get_data_by_postcode("AA1 1AA")
+        self.assertFalse(EveryElectionWrapper(postcode="AA11AA").request_success)
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(2, ee_cache.stats["error_hits"])
+
+    def test_stale_while_revalidate(self):
+        with override_settings(
+            EE_CACHE={"TIMEOUT": 0, "STALE_TIMEOUT": 60, "ERROR_TIMEOUT": 60}
+        ):
+            EveryElectionWrapper(postcode="AA11AA")
+            self.server.delay = 0.5
+            start = time.time()
+            ee = EveryElectionWrapper(postcode="AA11AA")
+            # we got the stale response without waiting for EE
+            self.assertLess(time.time() - start, 0.5)
+            self.assertTrue(ee.request_success)
+            self.assertEqual(1, ee_cache.stats["stale_hits"])
+
+            # wait for the refresh to finish
+            for _ in range(20):
+                if len(self.server.requests) == 2 and not ee_cache._in_flight:
+                    break
+                time.sleep(0.1)
+            self.assertEqual(2, len(self.server.requests))
+
+    def test_stale_response_survives_errors(self):
+        with override_settings(
+            EE_CACHE={"TIMEOUT": 0, "STALE_TIMEOUT": 60, "ERROR_TIMEOUT": 60}
+        ):
+            EveryElectionWrapper(postcode="AA11AA")
+            self.server.status = 500
+            for _ in range(3):
+                self.assertTrue(EveryElectionWrapper(postcode="AA11AA").request_success)
+            # only one attempt to refresh it until ERROR_TIMEOUT has passed
+            for _ in range(20):
+                if not ee_cache._in_flight:
+                    break
+                time.sleep(0.1)
+            self.assertEqual(2, len(self.server.requests))
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from data_finder.helpers import FanOut
+from data_finder.helpers.fanout import latency
+
+
+class FanOutTest(SimpleTestCase):
+    def setUp(self):
+        latency.clear()
+
+    def test_runs_in_parallel(self):
+        # each call waits for the other to start, so this only
+        # works if they run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait(result):
+            barrier.wait()
+            return result
+
+        fanout = FanOut(10)
+        fanout.submit("foo", wait, "foo")
+        fanout.submit("bar", wait, "bar")
+        self.assertEqual("foo", fanout.result("foo"))
+        self.assertEqual("bar", fanout.result("bar"))
+        self.assertEqual([], fanout.timed_out)
+        self.assertEqual(1, sum(latency.snapshot()["foo"]["buckets"].values()))
+
+    def test_deadline_is_shared(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def blocked():
+            release.wait(10)
+            return "slow"
+
+        fanout = FanOut(0.1)
+        fanout.submit("fast", lambda: "fast")
+        fanout.submit("slow", blocked)
+        start = time.monotonic()
+        self.assertEqual("fast", fanout.result("fast"))
+        self.assertEqual("default", fanout.result("slow", "default"))
+        # we didn't wait for the blocked call to finish
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(["slow"], fanout.timed_out)
+        self.assertEqual(1, latency.snapshot()["slow"]["timeouts"])
+
+    def test_exceptions(self):
+        def fail():
+            raise ValueError()
+
+        fanout = FanOut(5)
+        fanout.submit("fail", fail)
+        with self.assertRaises(ValueError):
+            fanout.result("fail")
+
+    def test_keeps_language(self):
+        fanout = FanOut(5)
+        with translation.override("cy-gb"):
+            fanout.submit("language", translation.get_language)
+        self.assertEqual("cy-gb", fanout.result("language"))
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from uk_geo_utils.geocoders import MultipleCodesException
+
+from data_finder.helpers.geocoders import GeocodeResult, GeocoderCache, PostcodeError
+
+
+class StubGeocoder:
+    centroid = Point(-0.14158760012261312, 51.50100893647978, srid=4326)
+
+    def __init__(self, lad):
+        self.lad = lad
+
+    def get_code(self, code_type):
+        if self.lad is None:
+            raise MultipleCodesException()
+        return self.lad
+
+
+class GeocoderCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.geocoder_cache = GeocoderCache()
+        patcher = mock.patch(
+            "data_finder.helpers.geocoders.geocode_result",
+            side_effect=lambda postcode: GeocodeResult.from_geocoder(
+                postcode, StubGeocoder("X01000001")
+            ),
+        )
+        self.geocode = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(GEOCODER_CACHE={"LRU_SIZE": 2, "BACKEND": None})
+    def test_lru(self):
+        for postcode in ["AA1 1AA", "aa11aa", "BB11BB", "AA11AA", "CC11CC", "BB11BB"]:
+            result = self.geocoder_cache.geocode(postcode)
+            self.assertEqual("X01000001", result.get_code("lad"))
+            self.assertEqual(StubGeocoder.centroid, result.centroid)
+        # BB11BB was dropped to make room for CC11CC
+        self.assertEqual(
+            ["AA11AA", "BB11BB", "CC11CC", "BB11BB"],
+            [c[0][0] for c in self.geocode.call_args_list],
+        )
+
+    @override_settings(GEOCODER_CACHE={"LRU_SIZE": 0})
+    def test_disabled(self):
+        self.geocoder_cache.geocode("AA11AA")
+        self.geocoder_cache.geocode("AA11AA")
+        self.assertEqual(2, self.geocode.call_count)
+
+    @override_settings(GEOCODER_CACHE={"LRU_SIZE": 2})
+    def test_errors(self):
+        self.geocode.side_effect = PostcodeError("No location information")
+        for _ in range(2):
+            with self.assertRaises(PostcodeError):
+                self.geocoder_cache.geocode("AA11AA")
+        self.assertEqual(1, self.geocode.call_count)
+
+    @override_settings(GEOCODER_CACHE={"LRU_SIZE": 2})
+    def test_multiple_codes(self):
+        self.geocode.side_effect = lambda postcode: GeocodeResult.from_geocoder(
+            postcode, StubGeocoder(None)
+        )
+        result = self.geocoder_cache.geocode("AA11AA")
+        with self.assertRaises(MultipleCodesException):
+            result.get_code("lad")
+
+    @override_settings(GEOCODER_CACHE={"BACKEND": "default"})
+    def test_shared(self):
+        self.geocoder_cache.geocode("AA11AA")
+        # another process
+        self.assertEqual("X01000001", GeocoderCache().geocode("AA11AA").get_code("lad"))
+        self.assertEqual(1, self.geocode.call_count)
+
+        # e.g: after re-importing ONSPD
+        self.geocoder_cache.clear()
+        self.geocoder_cache.geocode("AA11AA")
+        self.assertEqual(2, self.geocode.call_count)
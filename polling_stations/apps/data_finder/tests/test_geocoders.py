@@ -3,6 +3,7 @@ from django.test import TestCase, override_settings
 from data_finder.helpers.geocoders import (
     geocode,
     geocode_point_only,
+    geocode_result,
 )
 from uk_geo_utils.geocoders import (
     AddressBaseGeocoder,
@@ -26,6 +27,13 @@ def mock_geocode(self, uprn=None):
     return StubOnspdGeocoder("foo")
 
 
+class StubOnspdCodesGeocoder(StubOnspdGeocoder):
+    centroid = None
+
+    def get_code(self, code_type, *args, **kwargs):
+        return "X01000001"
+
+
 class GeocodeTest(TestCase):
 
     fixtures = ["test_addressbase.json"]
@@ -78,6 +86,21 @@ class GeocodeTest(TestCase):
         result = geocode("BB1 1BB")
         self.assertEqual(result.get_code("lad"), "fake temp gss code")
 
+    @mock.patch(
+        "data_finder.helpers.geocoders.OnspdGeocoderAdapter.geocode",
+        lambda self: StubOnspdCodesGeocoder("foo"),
+    )
+    def test_result_no_codes(self):
+        """
+        We find records for the given postcode in the AddressBase table
+        There are no corresponding records in the uprn to council lookup
+        for the UPRNs we found
+
+        We should fall back to ONSPD when building a GeocodeResult too
+        """
+        result = geocode_result("AA1 1AA")
+        self.assertEqual("X01000001", result.get_code("lad"))
+
 
 class GeocodePointOnlyTest(TestCase):
 
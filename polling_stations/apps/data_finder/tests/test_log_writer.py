@@ -0,0 +1,86 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from data_finder.helpers.log_writer import BufferedLogWriter
+from data_finder.models import LoggedPostcode
+
+
+class BufferedLogWriterTest(TestCase):
+    def test_unbuffered(self):
+        writer = BufferedLogWriter(background=False)
+        writer.write(postcode="AA11AA", brand="foo")
+        self.assertEqual(1, LoggedPostcode.objects.count())
+
+    @override_settings(
+        POSTCODE_LOGGING={"BUFFERED": True, "BATCH_SIZE": 2, "MAX_QUEUE_SIZE": 3}
+    )
+    def test_buffered(self):
+        writer = BufferedLogWriter(background=False)
+        for i in range(4):
+            writer.write(postcode="AA1%iAA" % i, brand="foo")
+        self.assertEqual(0, LoggedPostcode.objects.count())
+        self.assertEqual({"dropped": 1, "queued": 3}, writer.get_stats())
+
+        self.assertEqual(2, writer.flush())
+        self.assertEqual(2, LoggedPostcode.objects.count())
+
+        writer.close()
+        self.assertEqual(
+            ["AA10AA", "AA11AA", "AA12AA"],
+            sorted(LoggedPostcode.objects.values_list("postcode", flat=True)),
+        )
+        self.assertEqual({"written": 3, "dropped": 1, "queued": 0}, writer.get_stats())
+
+    @override_settings(POSTCODE_LOGGING={"BUFFERED": True})
+    def test_keeps_lookup_time(self):
+        writer = BufferedLogWriter(background=False)
+        before = timezone.now()
+        writer.write(postcode="AA11AA")
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        writer.write(postcode="BB11BB", created=an_hour_ago)
+        after = timezone.now()
+
+        writer.close()
+        created = dict(LoggedPostcode.objects.values_list("postcode", "created"))
+        self.assertTrue(before <= created["AA11AA"] <= after)
+        self.assertEqual(an_hour_ago, created["BB11BB"])
+
+    @override_settings(POSTCODE_LOGGING={"BUFFERED": True, "DATABASE": "logs"})
+    def test_database(self):
+        writer = BufferedLogWriter(background=False)
+        writer.write(postcode="AA11AA")
+        with mock.patch.object(LoggedPostcode.objects, "using") as using:
+            self.assertEqual(1, writer.flush())
+        using.assert_called_once_with("logs")
+        batch = using.return_value.bulk_create.call_args[0][0]
+        self.assertEqual(["AA11AA"], [record.postcode for record in batch])
+
+
+class BackgroundLogWriterTest(TransactionTestCase):
+    @override_settings(
+        POSTCODE_LOGGING={"BUFFERED": True, "BATCH_SIZE": 2, "FLUSH_INTERVAL": 60}
+    )
+    def test_background_thread(self):
+        writer = BufferedLogWriter()
+        with mock.patch("atexit.register") as register:
+            for i in range(3):
+                writer.write(postcode="AA1%iAA" % i)
+        register.assert_called_once_with(writer.close)
+        self.assertTrue(writer.thread.is_alive())
+
+        # a full batch is written straight away...
+        for _ in range(50):
+            if LoggedPostcode.objects.count():
+                break
+            time.sleep(0.1)
+        self.assertEqual(2, LoggedPostcode.objects.count())
+
+        # ...and the rest when we exit, without waiting for FLUSH_INTERVAL
+        writer.close()
+        self.assertIsNone(writer.thread)
+        self.assertEqual(3, LoggedPostcode.objects.count())
+        self.assertEqual({"written": 3, "queued": 0}, writer.get_stats())
@@ -0,0 +1,50 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from councils.tests.factories import CouncilFactory
+from data_finder.helpers import LookupEngine, PostcodeError
+
+
+class LookupEngineTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        CouncilFactory(
+            council_id="X01",
+            identifiers=["X01"],
+            geography__geography=None,
+        )
+        for fixture in [
+            "test_single_address_single_polling_station.json",
+            "test_multiple_polling_stations.json",
+        ]:
+            call_command("loaddata", fixture, verbosity=0)
+
+    def test_single_address(self):
+        lookup = LookupEngine("AA11AA", geocoder=mock.Mock())
+        self.assertEqual("X01", lookup.council.council_id)
+        self.assertEqual("1A", lookup.station.internal_council_id)
+        self.assertEqual([], lookup.addresses)
+
+    def test_multiple_addresses(self):
+        lookup = LookupEngine("DD1 1DD", geocoder=mock.Mock())
+        self.assertIsNone(lookup.station)
+        self.assertEqual(
+            sorted(a.uprn for a in lookup.routing.addresses),
+            sorted(a.uprn for a in lookup.addresses),
+        )
+
+    def test_geocodes_once(self):
+        geocoder = mock.Mock(side_effect=PostcodeError("Could not geocode"))
+        lookup = LookupEngine("AA11AA", geocoder=geocoder)
+        self.assertIsNone(lookup.location)
+        with self.assertRaises(PostcodeError):
+            lookup.geocode_result
+        self.assertIsNone(lookup.custom_finder_url)
+        geocoder.assert_called_once()
+
+    def test_for_uprn(self):
+        lookup = LookupEngine.for_uprn("100", geocoder=mock.Mock())
+        self.assertEqual("AA1 1AA", lookup.postcode.with_space)
+        self.assertEqual("1A", lookup.station.internal_council_id)
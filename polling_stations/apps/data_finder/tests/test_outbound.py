@@ -0,0 +1,120 @@
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from data_finder.helpers import EveryElectionWrapper
+from data_finder.helpers.outbound import (
+    CircuitBreaker,
+    CircuitOpenError,
+    OutboundHTTP,
+    outbound,
+)
+
+
+def response(status_code):
+    return mock.Mock(status_code=status_code)
+
+
+@override_settings(
+    OUTBOUND_HTTP={
+        "RETRIES": 1,
+        "BACKOFF": 0,
+        "FAILURE_THRESHOLD": 2,
+        "RESET_TIMEOUT": 30,
+        "POOL_SIZE": 1,
+    }
+)
+class OutboundHTTPTest(SimpleTestCase):
+    def setUp(self):
+        self.http = OutboundHTTP()
+        self.session = self.http.get_session("example.com")
+        patcher = mock.patch.object(self.session, "get")
+        self.session_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuses_session(self):
+        self.assertIs(self.session, self.http.get_session("example.com"))
+        self.assertIsNot(self.session, self.http.get_session("example.org"))
+
+    def test_retries(self):
+        self.session_get.side_effect = [
+            requests.exceptions.ConnectionError(),
+            response(503),
+        ]
+        self.assertEqual(503, self.http.get("https://example.com/foo").status_code)
+        self.assertEqual(2, self.session_get.call_count)
+        stats = self.http.get_stats()["example.com"]
+        self.assertEqual(1, stats["retries"])
+        self.assertEqual(1, stats["failures"])
+        self.assertEqual("closed", stats["breaker"])
+
+    def test_retries_connect_timeout(self):
+        self.session_get.side_effect = [
+            requests.exceptions.ConnectTimeout(),
+            response(200),
+        ]
+        self.assertEqual(200, self.http.get("https://example.com/foo").status_code)
+        self.assertEqual(2, self.session_get.call_count)
+
+    def test_doesnt_retry_read_timeout(self):
+        self.session_get.side_effect = requests.exceptions.ReadTimeout()
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.http.get("https://example.com/foo")
+        self.assertEqual(1, self.session_get.call_count)
+        stats = self.http.get_stats()["example.com"]
+        self.assertEqual(0, stats["retries"])
+        self.assertEqual(1, stats["failures"])
+
+    def test_circuit_breaker(self):
+        self.session_get.side_effect = requests.exceptions.ConnectionError()
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.http.get("https://example.com/foo")
+        self.assertEqual(4, self.session_get.call_count)
+
+        # now we fail fast without sending any requests
+        with self.assertRaises(CircuitOpenError):
+            self.http.get("https://example.com/foo")
+        self.assertEqual(4, self.session_get.call_count)
+        stats = self.http.get_stats()["example.com"]
+        self.assertEqual("open", stats["breaker"])
+        self.assertEqual(1, stats["rejected"])
+
+    def test_client_errors_dont_open_circuit(self):
+        self.session_get.return_value = response(404)
+        for _ in range(3):
+            self.assertEqual(404, self.http.get("https://example.com/foo").status_code)
+        self.assertEqual("closed", self.http.get_stats()["example.com"]["breaker"])
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def test_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow_request())
+
+        breaker.opened_at -= 30
+        self.assertEqual("half-open", breaker.state)
+        # only one trial request at a time
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual("open", breaker.state)
+
+        breaker.opened_at -= 30
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual("closed", breaker.state)
+
+
+class EveryElectionCircuitBreakerTest(SimpleTestCase):
+    @mock.patch.object(outbound, "get", mock.Mock(side_effect=CircuitOpenError("nope")))
+    @mock.patch(
+        "data_finder.helpers.every_election.ee_cache.get",
+        lambda key, fetch: fetch(),
+    )
+    def test_assume_election(self):
+        ee = EveryElectionWrapper(postcode="AA11AA")
+        self.assertFalse(ee.request_success)
+        self.assertTrue(ee.has_election())
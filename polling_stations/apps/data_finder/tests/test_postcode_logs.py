@@ -0,0 +1,113 @@
+from datetime import datetime
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from addressbase.partitions import get_partitions, is_partitioned, supports_partitioning
+from councils.tests.factories import CouncilFactory
+from data_finder.models import (
+    LoggedPostcode,
+    LoggedPostcodeRollup,
+    refresh_postcode_rollups,
+)
+
+
+def at(hour, minute=0, month=5):
+    return datetime(2020, month, 1, hour, minute, tzinfo=timezone.utc)
+
+
+def log_at(created, **kwargs):
+    """
+    Log a lookup which happened at created
+    """
+    log = LoggedPostcode.objects.create(**kwargs)
+    LoggedPostcode.objects.filter(pk=log.pk).update(created=created)
+    return log
+
+
+class PostcodeRollupTest(TestCase):
+    def setUp(self):
+        council = CouncilFactory(council_id="X01", geography__geography=None)
+        for created, brand, had_data in [
+            (at(9, 5), "democracyclub", True),
+            (at(9, 55), "democracyclub", True),
+            (at(9, 30), "democracyclub", False),
+            (at(10, 15), "democracyclub", True),
+            (at(10, 15), "foo", True),
+        ]:
+            log_at(
+                created,
+                postcode="AA11AA",
+                council=council,
+                brand=brand,
+                had_data=had_data,
+                view_used="PostcodeView",
+            )
+
+    def get_counts(self):
+        return {
+            (r.hour.hour, r.brand, r.had_data): r.count
+            for r in LoggedPostcodeRollup.objects.all()
+        }
+
+    def test_rollup(self):
+        self.assertEqual(4, refresh_postcode_rollups())
+        self.assertEqual(
+            {
+                (9, "democracyclub", True): 2,
+                (9, "democracyclub", False): 1,
+                (10, "democracyclub", True): 1,
+                (10, "foo", True): 1,
+            },
+            self.get_counts(),
+        )
+        self.assertEqual("", LoggedPostcodeRollup.objects.first().api_user)
+
+        # the last hour is recalculated next time, earlier ones are left alone
+        LoggedPostcode.objects.filter(created__lt=at(10)).delete()
+        log_at(at(10, 45), postcode="AA11AA", brand="foo")
+        self.assertEqual(3, refresh_postcode_rollups())
+        counts = self.get_counts()
+        self.assertEqual(2, counts[(9, "democracyclub", True)])
+        self.assertEqual(1, counts[(10, "democracyclub", True)])
+        self.assertEqual(1, counts[(10, "foo", False)])
+
+    def test_command(self):
+        call_command("rollup_postcode_logs", "--since", "2020-05-01", stdout=StringIO())
+        self.assertEqual(5, sum(self.get_counts().values()))
+
+
+@skipUnless(supports_partitioning(connection), "needs postgres 11 or later")
+class PartitionPostcodeLogsTest(TestCase):
+    def partition(self, **kwargs):
+        call_command("partition_postcode_logs", stdout=StringIO(), **kwargs)
+
+    def test_partition_and_undo(self):
+        log_at(at(9, month=1), postcode="AA11AA")
+        log_at(at(9, month=3), postcode="AA11AA")
+
+        self.partition(months_ahead=1)
+        cursor = connection.cursor()
+        self.assertTrue(is_partitioned(cursor, "data_finder_loggedpostcode"))
+        partitions = get_partitions(cursor, "data_finder_loggedpostcode")
+        self.assertIn("data_finder_loggedpostcode_202001", partitions)
+        self.assertIn("data_finder_loggedpostcode_default", partitions)
+
+        # new rows still get an id
+        log = LoggedPostcode.objects.create(postcode="BB11BB")
+        self.assertIsNotNone(log.pk)
+        self.assertEqual(3, LoggedPostcode.objects.count())
+        cursor.execute(
+            "SELECT COUNT(*) FROM data_finder_loggedpostcode_{:%Y%m};".format(
+                log.created
+            )
+        )
+        self.assertEqual(1, cursor.fetchone()[0])
+
+        self.partition(undo=True)
+        self.assertFalse(is_partitioned(cursor, "data_finder_loggedpostcode"))
+        self.assertEqual(3, LoggedPostcode.objects.count())
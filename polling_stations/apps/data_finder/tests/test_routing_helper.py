@@ -5,6 +5,7 @@ from django.core.management import call_command
 from django.http import QueryDict
 from django.test import TestCase
 
+from addressbase.models import refresh_postcode_routes
 from councils.tests.factories import CouncilFactory
 from data_finder.helpers import RoutingHelper
 
@@ -157,3 +158,15 @@ class RoutingHelperTest(TestCase):
         self.assertRegex(
             rh.get_canonical_url(request, preserve_query=False), r"/address/10[23]/"
         )
+
+    def test_precomputed_routes(self):
+        postcodes = ["AA1 1AA", "BB1 1BB", "CC1 1AA", "DD1 1DD", "EE1 1EE"]
+        expected = {pc: RoutingHelper(pc).view for pc in postcodes}
+
+        refresh_postcode_routes()
+        for postcode in postcodes:
+            with self.assertNumQueries(1):
+                rh = RoutingHelper(postcode)
+                self.assertEqual(expected[postcode], rh.view)
+                self.assertIsNone(rh.councils)
+        self.assertEqual("X01", RoutingHelper("AA1 1AA").route.council_ids[0])
@@ -0,0 +1,80 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.gis.geos import Point
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import translation
+
+from addressbase.models import update_uprn_councils
+from addressbase.tests.factories import UprnToCouncilFactory
+from councils.tests.factories import CouncilFactory
+from data_finder.helpers import PostcodeError
+from pollingstations.tests.factories import PollingStationFactory
+
+START = Point(-0.14158760012261312, 51.50100893647978, srid=4326)
+
+
+def geocode(postcode):
+    if postcode == "CC1 1CC":
+        raise PostcodeError("No location information")
+    return mock.Mock(centroid=START)
+
+
+class WarmDirectionsCacheTest(TestCase):
+    def setUp(self):
+        council = CouncilFactory(pk="ABC", identifiers=["X01000000"])
+        PollingStationFactory(
+            council=council,
+            internal_council_id="PS1",
+            location=Point(-0.14, 51.6, srid=4326),
+        )
+        PollingStationFactory(council=council, internal_council_id="PS2", location=None)
+        for postcode, station_id in [
+            ("AA1 1AA", "PS1"),
+            ("BB1 1BB", "PS2"),
+            ("CC1 1CC", "PS1"),
+        ]:
+            UprnToCouncilFactory(
+                lad="X01000000",
+                polling_station_id=station_id,
+                uprn__postcode=postcode,
+            )
+        update_uprn_councils()
+
+        self.languages = []
+
+        def get_directions(*args, **kwargs):
+            self.languages.append(translation.get_language())
+            return "directions"
+
+        for target, side_effect in [
+            ("data_finder.management.commands.warm_directions_cache.geocode", geocode),
+            (
+                "data_finder.management.commands.warm_directions_cache."
+                "DirectionsHelper.get_directions",
+                get_directions,
+            ),
+        ]:
+            patcher = mock.patch(target, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def warm(self, *args):
+        out = StringIO()
+        call_command("warm_directions_cache", "-c", "ABC", *args, stdout=out)
+        return out.getvalue()
+
+    def test_default_language(self):
+        output = self.warm()
+        self.assertEqual(["en"], self.languages)
+        self.assertIn("Cached 1 routes for ABC, couldn't get 0", output)
+        self.assertIn(
+            "Skipped 2 postcode/station pairs: 1 with no station location, "
+            "1 with a postcode we couldn't geocode",
+            output,
+        )
+
+    def test_other_languages(self):
+        self.warm("--languages", "en", "cy-gb")
+        self.assertEqual(["en", "cy-gb"], self.languages)
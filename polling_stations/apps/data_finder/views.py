@@ -5,25 +5,24 @@ from django.conf import settings
 from django.contrib.gis.geos import Point
 from django.urls import reverse
 from django.http import HttpResponseRedirect, Http404
-from django.shortcuts import get_object_or_404
 from django.views.generic import FormView, TemplateView
 from django.utils import translation, timezone
 from uk_geo_utils.geocoders import MultipleCodesException
 
 from addressbase.models import Address
 from councils.models import Council
-from data_finder.models import LoggedPostcode
 from pollingstations.models import PollingStation, CustomFinder
 from uk_geo_utils.helpers import AddressSorter, Postcode
 from whitelabel.views import WhiteLabelTemplateOverrideMixin
 from .forms import PostcodeLookupForm, AddressSelectForm
 from .helpers import (
     DirectionsHelper,
-    get_council,
-    geocode,
     EveryElectionWrapper,
+    FanOut,
+    LookupEngine,
     PostcodeError,
     RoutingHelper,
+    log_writer,
 )
 
 
@@ -60,7 +59,7 @@ class LogLookUpMixin(object):
         kwargs.update(
             {k: v[0:100] for k, v in self.request.session["utm_data"].items()}
         )
-        LoggedPostcode.objects.create(**kwargs)
+        log_writer.write(**kwargs)
 
 
 class LanguageMixin(object):
@@ -133,14 +132,28 @@ class BasePollingStationView(
     def get_station(self):
         pass
 
-    def get_ee_wrapper(self):
-        return EveryElectionWrapper(postcode=self.postcode)
+    def get_ee_query(self):
+        """
+        Keyword args for EveryElectionWrapper. This is called on the
+        request thread, so it can use the db: the EE thread doesn't.
+        """
+        return {"postcode": self.postcode}
+
+    def get_custom_finder(self, geocode_result):
+        try:
+            return CustomFinder.objects.get_custom_finder(
+                geocode_result, self.postcode.without_space
+            )
+        except MultipleCodesException:
+            return None
 
     def get_directions(self):
         if self.location and self.station and self.station.location:
             dh = DirectionsHelper()
             return dh.get_directions(
-                start_location=self.location, end_location=self.station.location
+                start_location=self.location,
+                end_location=self.station.location,
+                station=self.station,
             )
         else:
             return None
@@ -156,6 +169,11 @@ class BasePollingStationView(
             context["postcode_form"] = PostcodeLookupForm
             return context
 
+        # EE and directions are slow external calls, so start them
+        # as soon as we can and wait for them both at the end
+        fanout = FanOut(settings.LOOKUP_DEADLINE)
+        fanout.submit("every_election", EveryElectionWrapper, **self.get_ee_query())
+
         if loc is None:
             # AddressView.get_location() may legitimately return None
             self.location = None
@@ -164,9 +182,10 @@ class BasePollingStationView(
 
         self.council = self.get_council(loc)
         self.station = self.get_station()
-        self.directions = self.get_directions()
+        fanout.submit("directions", self.get_directions)
 
-        ee = self.get_ee_wrapper()
+        ee = fanout.result("every_election", EveryElectionWrapper.no_response())
+        self.directions = fanout.result("directions")
         context["has_election"] = ee.has_election()
         context["multiple_elections"] = ee.multiple_elections
         context["election_explainers"] = ee.get_explanations()
@@ -185,13 +204,7 @@ class BasePollingStationView(
             if loc is None:
                 context["custom"] = None
             else:
-                try:
-                    context["custom"] = CustomFinder.objects.get_custom_finder(
-                        loc, self.postcode.without_space
-                    )
-
-                except MultipleCodesException:
-                    context["custom"] = None
+                context["custom"] = self.get_custom_finder(loc)
 
         self.log_postcode(self.postcode, context, type(self).__name__)
 
@@ -205,22 +218,29 @@ class PostcodeView(BasePollingStationView):
         if "postcode" not in kwargs or kwargs["postcode"] == "":
             return HttpResponseRedirect(reverse("home"))
 
-        rh = RoutingHelper(self.kwargs["postcode"])
+        self.lookup = LookupEngine(self.kwargs["postcode"])
+        rh = self.lookup.routing
 
         if rh.view != "postcode_view":
             return HttpResponseRedirect(rh.get_canonical_url(request))
         else:
             # we are already in postcode_view
-            self.postcode = Postcode(kwargs["postcode"])
+            self.postcode = self.lookup.postcode
             context = self.get_context_data(**kwargs)
 
             return self.render_to_response(context)
 
     def get_location(self):
-        return geocode(self.postcode)
+        return self.lookup.geocode_result
 
     def get_council(self, geocode_result):
-        return get_council(geocode_result)
+        return self.lookup.council
+
+    def get_ee_query(self):
+        return self.lookup.ee_query
+
+    def get_custom_finder(self, geocode_result):
+        return self.lookup.custom_finder
 
     def get_station(self):
         """
@@ -234,23 +254,30 @@ class PostcodeView(BasePollingStationView):
 
 class AddressView(BasePollingStationView):
     def get(self, request, *args, **kwargs):
-        self.address = get_object_or_404(Address, uprn=self.kwargs["uprn"])
-        self.postcode = Postcode(self.address.postcode)
+        try:
+            self.lookup = LookupEngine.for_uprn(self.kwargs["uprn"])
+        except Address.DoesNotExist:
+            raise Http404
+        self.address = self.lookup.address
+        self.postcode = self.lookup.postcode
         context = self.get_context_data(**kwargs)
 
         return self.render_to_response(context)
 
     def get_location(self):
-        return geocode(self.postcode)
+        return self.lookup.geocode_result
 
     def get_council(self, geocode_result):
-        return self.address.council
+        return self.lookup.council
 
     def get_station(self):
-        return self.address.polling_station
+        return self.lookup.station
+
+    def get_ee_query(self):
+        return self.lookup.ee_query
 
-    def get_ee_wrapper(self):
-        return EveryElectionWrapper(point=self.address.location)
+    def get_custom_finder(self, geocode_result):
+        return self.lookup.custom_finder
 
 
 class ExamplePostcodeView(BasePollingStationView):
@@ -299,9 +326,9 @@ class ExamplePostcodeView(BasePollingStationView):
 
 class WeDontKnowView(PostcodeView):
     def get(self, request, *args, **kwargs):
-        self.postcode = Postcode(kwargs["postcode"])
-        rh = RoutingHelper(self.postcode)
-        if rh.councils:
+        self.lookup = LookupEngine(kwargs["postcode"])
+        self.postcode = self.lookup.postcode
+        if self.lookup.routing.councils:
             return HttpResponseRedirect(
                 reverse(
                     "multiple_councils_view",
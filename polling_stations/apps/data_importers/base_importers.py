@@ -8,15 +8,17 @@ import logging
 import os
 import tempfile
 import urllib.request
+from multiprocessing import get_context
 
 import rtree
+from django import db
 from django.apps import apps
 from django.contrib.gis import geos
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.contrib.gis.geos import Point, GEOSGeometry, GEOSException
 
-from addressbase.models import UprnToCouncil
+from addressbase.models import UprnToCouncil, refresh_postcode_routes
 from councils.models import Council
 from data_importers.data_types import AddressList, DistrictSet, StationSet
 from data_importers.data_quality_report import (
@@ -27,10 +29,13 @@ from data_importers.data_quality_report import (
 )
 from data_importers.contexthelpers import Dwellings
 from data_importers.filehelpers import FileHelperFactory
+from data_importers.geo_utils import fix_bad_polygons
 from data_importers.loghelper import LogHelper
 from data_importers.s3wrapper import S3Wrapper
+from data_importers.teardownhelpers import ChunkedTeardown
 from pollingstations.models import PollingDistrict, PollingStation
 from data_importers.models import DataQuality
+from uk_geo_utils.helpers import Postcode
 
 
 class CsvMixin:
@@ -48,6 +53,22 @@ class ShpMixin:
         return {"shp_encoding": self.shp_encoding}
 
 
+# Importer and input records for forked worker processes to read.
+# Passing them this way means we don't have to pickle them.
+_worker_state = {}
+
+
+def _address_records_to_dicts(chunk):
+    importer = _worker_state["importer"]
+    addresses = _worker_state["addresses"]
+    start, end = chunk
+
+    # start with a clean log so we only send back this chunk's events
+    importer.logger = LogHelper(importer.verbosity, council_id=importer.council_id)
+    records = [importer.address_record_to_dict(a) for a in addresses[start:end]]
+    return records, importer.logger.get_events()
+
+
 class BaseImporter(BaseCommand, metaclass=abc.ABCMeta):
 
     """
@@ -65,6 +86,7 @@ class BaseImporter(BaseCommand, metaclass=abc.ABCMeta):
     batch_size = None
     imports_districts = False
     use_postcode_centroids = False
+    workers = 1
 
     def write_info(self, message):
         if self.verbosity > 0:
@@ -89,11 +111,27 @@ class BaseImporter(BaseCommand, metaclass=abc.ABCMeta):
             default=False,
         )
 
+        parser.add_argument(
+            "-w",
+            "--workers",
+            help="<Optional> Number of processes to use when converting address records",
+            type=int,
+            required=False,
+            default=1,
+        )
+
     def teardown(self, council):
-        PollingStation.objects.filter(council=council).delete()
-        PollingDistrict.objects.filter(council=council).delete()
-        UprnToCouncil.objects.filter(lad__in=council.identifiers).update(
-            polling_station_id=""
+        teardown = ChunkedTeardown(
+            stdout=self.stdout if getattr(self, "verbosity", 1) > 1 else None
+        )
+        teardown.delete(
+            PollingStation.objects.filter(council=council), "delete polling stations"
+        )
+        teardown.delete(
+            PollingDistrict.objects.filter(council=council), "delete polling districts"
+        )
+        teardown.clear_station_ids(
+            UprnToCouncil.objects.filter(lad__in=council.identifiers)
         )
 
     def get_council(self, council_id):
@@ -187,13 +225,15 @@ class BaseImporter(BaseCommand, metaclass=abc.ABCMeta):
         )
 
         self.verbosity = kwargs.get("verbosity")
-        self.logger = LogHelper(self.verbosity)
         self.validation_checks = not (kwargs.get("nochecks"))
         self.allow_station_point_from_postcode = kwargs.get("use_postcode_centroids")
+        self.workers = kwargs.get("workers") or 1
 
         if self.council_id is None:
             self.council_id = args[0]
 
+        self.logger = LogHelper(self.verbosity, council_id=self.council_id)
+
         self.council = self.get_council(self.council_id)
         self.write_info("Importing data for %s..." % self.council.name)
 
@@ -210,6 +250,12 @@ class BaseImporter(BaseCommand, metaclass=abc.ABCMeta):
         except NotImplementedError:
             pass
 
+        # keep the precomputed routing for this council's postcodes up to date
+        refresh_postcode_routes(self.council.pk)
+
+        # summarise any warnings raised while importing
+        self.logger.log_summary()
+
         # save and output data quality report
         if self.verbosity > 0:
             self.report()
@@ -299,24 +345,28 @@ class BaseStationsImporter(BaseImporter, metaclass=abc.ABCMeta):
                 f"'{get_name(station.address)}' "
                 "are at approximately the same location, but have different postcodes:\n"
                 f"qgis filter exp: \"internal_council_id\" IN ('{station_record['internal_council_id']}','{station.internal_council_id}')",  # qgis filter expression
+                event="station_duplicate_location",
+                record_id=station_record["internal_council_id"],
             )
 
     def check_in_council_bounds(self, station_record):
         try:
-            council = Council.objects.get(
-                geography__geography__covers=station_record["location"]
-            )
+            council = Council.objects.get_by_point(station_record["location"])
             if self.council_id != council.council_id:
                 self.logger.log_message(
                     logging.WARNING,
                     f"Polling station {station_record['internal_council_id']} is in {council.name} ({council.council_id}) "
                     f"but target council is {self.council.name} ({self.council.council_id}) - manual check recommended\n",
+                    event="station_in_other_council",
+                    record_id=station_record["internal_council_id"],
                 )
         except Council.DoesNotExist:
             self.logger.log_message(
                 logging.WARNING,
                 "Polling station %s is not covered by any council area - manual check recommended\n",
                 variable=(station_record["internal_council_id"]),
+                event="station_outside_councils",
+                record_id=station_record["internal_council_id"],
             )
 
     def import_polling_stations(self):
@@ -348,6 +398,8 @@ class BaseStationsImporter(BaseImporter, metaclass=abc.ABCMeta):
                         "Polling station added to set:\n%s",
                         variable=station,
                         pretty=True,
+                        event="station_added",
+                        record_id=station_hash,
                     )
                     seen.add(station_hash)
             except NotImplementedError:
@@ -374,6 +426,7 @@ class BaseStationsImporter(BaseImporter, metaclass=abc.ABCMeta):
                     "station_record_to_dict() returned list with input:\n%s",
                     variable=record,
                     pretty=True,
+                    event="station_record_list",
                 )
                 station_records = station_info
             else:
@@ -393,6 +446,7 @@ class BaseStationsImporter(BaseImporter, metaclass=abc.ABCMeta):
                         "station_record_to_dict() returned None with input:\n%s",
                         variable=record,
                         pretty=True,
+                        event="station_record_skipped",
                     )
                     continue
 
@@ -419,6 +473,8 @@ class BaseStationsImporter(BaseImporter, metaclass=abc.ABCMeta):
                         self.logger.log_message(
                             logging.WARNING,
                             "Implicitly converting station geometry to point",
+                            event="station_geometry_to_point",
+                            record_id=station_record.get("internal_council_id"),
                         )
                         geojson = json.dumps(station.shape.__geo_interface__)
                         poly = self.clean_poly(GEOSGeometry(geojson))
@@ -438,6 +494,8 @@ class BaseDistrictsImporter(BaseImporter, metaclass=abc.ABCMeta):
 
     districts = None
     districts_srid = None
+    # internal_council_ids of the districts with invalid geometries
+    invalid_districts = None
 
     @property
     @abc.abstractmethod
@@ -478,6 +536,8 @@ class BaseDistrictsImporter(BaseImporter, metaclass=abc.ABCMeta):
                 logging.INFO,
                 "District %s is fully contained by target local auth",
                 variable=district_record["internal_council_id"],
+                event="district_contained",
+                record_id=district_record["internal_council_id"],
             )
             return 100
 
@@ -488,25 +548,61 @@ class BaseDistrictsImporter(BaseImporter, metaclass=abc.ABCMeta):
             district_area = district_record["area"].transform(27700, clone=True).area
             intersection_area = intersection.transform(27700, clone=True).area
         except GEOSException as e:
-            self.logger.log_message(logging.ERROR, str(e))
+            self.logger.log_message(
+                logging.ERROR,
+                str(e),
+                event="district_overlap_error",
+                record_id=district_record["internal_council_id"],
+            )
             return
 
         overlap_percentage = (intersection_area / district_area) * 100
         if overlap_percentage > 99:
             # meh - close enough
             level = logging.INFO
+            event = "district_contained"
         else:
             level = logging.WARNING
+            event = "district_overlap"
 
         self.logger.log_message(
             level,
             "District {0} is {1:.2f}% contained by target local auth".format(
                 district_record["internal_council_id"], overlap_percentage
             ),
+            event=event,
+            record_id=district_record["internal_council_id"],
         )
 
         return overlap_percentage
 
+    def check_district_geometry(self, district_record):
+        area = district_record.get("area")
+        if area is None or area.valid:
+            return
+        self.invalid_districts.add(district_record["internal_council_id"])
+        self.logger.log_message(
+            logging.WARNING,
+            "District %s has an invalid geometry: %s",
+            variable=(district_record["internal_council_id"], area.valid_reason),
+            event="district_invalid_geometry",
+            record_id=district_record["internal_council_id"],
+        )
+
+    def repair_district_geometries(self):
+        """
+        Repair any invalid district geometries we found while importing.
+        Only this council's districts are touched and we don't run
+        the query at all if every district was valid.
+        """
+        if not self.invalid_districts:
+            return
+        repaired = fix_bad_polygons(council_id=self.council.pk)
+        self.write_info(
+            "Repaired %i invalid district geometries (found: %s)"
+            % (repaired, ", ".join(sorted(map(str, self.invalid_districts))))
+        )
+
     def import_polling_districts(self):
         districts = self.get_districts()
         self.write_info("Districts: Found %i features in input file" % (len(districts)))
@@ -527,6 +623,7 @@ class BaseDistrictsImporter(BaseImporter, metaclass=abc.ABCMeta):
                     "district_record_to_dict() returned None with input:\n%s",
                     variable=district,
                     pretty=True,
+                    event="district_record_skipped",
                 )
                 continue
 
@@ -550,6 +647,7 @@ class BaseDistrictsImporter(BaseImporter, metaclass=abc.ABCMeta):
                 poly.srid = self.get_srid("districts")
                 district_info["area"] = poly
 
+            self.check_district_geometry(district_info)
             if self.validation_checks:
                 self.check_district_overlap(district_info)
             self.add_polling_district(district_info)
@@ -562,6 +660,18 @@ class BaseAddressesImporter(BaseImporter, metaclass=abc.ABCMeta):
 
     addresses = None
 
+    # Corrections to the council's address data. These are applied to the
+    # whole AddressList once the input file has been read, so scripts
+    # don't need to override address_record_to_dict() to fix up records.
+    # UPRNs to leave out of the import
+    excluded_uprns = frozenset()
+    # UPRN -> corrected postcode
+    uprn_postcode_fixes = {}
+    # UPRN -> polling station id
+    uprn_station_overrides = {}
+    # postcodes to leave out of the import
+    excluded_postcodes = frozenset()
+
     @property
     @abc.abstractmethod
     def addresses_filetype(self):
@@ -580,13 +690,87 @@ class BaseAddressesImporter(BaseImporter, metaclass=abc.ABCMeta):
     def address_record_to_dict(self, record):
         pass
 
+    def get_address_corrections(self):
+        """
+        Normalise this script's declarative corrections so they
+        can be matched against records in the AddressList
+        """
+        return {
+            "excluded_uprns": frozenset(
+                str(uprn).lstrip("0") for uprn in self.excluded_uprns
+            ),
+            "uprn_postcode_fixes": {
+                str(uprn).lstrip("0"): postcode
+                for uprn, postcode in self.uprn_postcode_fixes.items()
+            },
+            "uprn_station_overrides": {
+                str(uprn).lstrip("0"): station_id
+                for uprn, station_id in self.uprn_station_overrides.items()
+            },
+            "excluded_postcodes": frozenset(
+                Postcode(postcode).without_space for postcode in self.excluded_postcodes
+            ),
+        }
+
+    def address_records_to_dicts(self, addresses):
+        """
+        Call address_record_to_dict() on each input record
+
+        If self.workers > 1 the records are split into chunks and
+        converted in a pool of forked processes. Results are returned
+        in the same order as the input so the import is deterministic.
+        This relies on address_record_to_dict() not changing any state
+        on the importer.
+
+        Inside a transaction (e.g: a TestCase, or a caller which wraps
+        the import in atomic()) we convert the records serially instead:
+        closing the connection before forking would break the transaction.
+        """
+        if self.workers <= 1 or len(addresses) < self.workers:
+            return map(self.address_record_to_dict, addresses)
+
+        if any(conn.in_atomic_block for conn in db.connections.all()):
+            self.logger.log_message(
+                logging.WARNING,
+                "Can't fork %i workers inside a transaction, "
+                "converting address records in this process",
+                variable=self.workers,
+                event="workers_in_transaction",
+            )
+            return map(self.address_record_to_dict, addresses)
+
+        # use a few chunks per worker so one slow chunk doesn't hold up the rest
+        chunk_size = -(-len(addresses) // (self.workers * 4))
+        chunks = [
+            (start, min(start + chunk_size, len(addresses)))
+            for start in range(0, len(addresses), chunk_size)
+        ]
+        self.write_info(
+            "Converting address records with {} workers".format(self.workers)
+        )
+
+        _worker_state.update({"importer": self, "addresses": addresses})
+        # forked workers must not share our database connection
+        db.connections.close_all()
+        try:
+            with get_context("fork").Pool(self.workers) as pool:
+                results = pool.map(_address_records_to_dicts, chunks)
+        finally:
+            _worker_state.clear()
+
+        records = []
+        for chunk_records, events in results:
+            self.logger.merge_events(events)
+            records.extend(chunk_records)
+        return records
+
     def write_context_data(self):
         dwellings = Dwellings()
         self.write_info("----------------------------------")
         self.write_info("Contextual Data:")
         self.write_info(
             "Total UPRNs in AddressBase: {:,}".format(
-                dwellings.from_addressbase(self.council.geography.geography)
+                dwellings.from_addressbase(self.council)
             )
         )
         self.write_info(
@@ -605,20 +789,23 @@ class BaseAddressesImporter(BaseImporter, metaclass=abc.ABCMeta):
             "Addresses: Found {:,} rows in input file".format(self.csv_row_count)
         )
         self.write_info("----------------------------------")
-        for address in addresses:
-            address_info = self.address_record_to_dict(address)
-
+        for address, address_info in zip(
+            addresses, self.address_records_to_dicts(addresses)
+        ):
             if address_info is None:
                 self.logger.log_message(
                     logging.INFO,
                     "address_record_to_dict() returned None with input:\n%s",
                     variable=address,
                     pretty=True,
+                    event="address_record_skipped",
                 )
                 continue
 
             self.add_residential_address(address_info)
 
+        self.addresses.apply_corrections(**self.get_address_corrections())
+
     def add_residential_address(self, address_info):
 
         if "council" not in address_info:
@@ -650,11 +837,15 @@ class BaseStationsDistrictsImporter(BaseStationsImporter, BaseDistrictsImporter)
         """
         if len(self.districts.elements) < 1:
             self.logger.log_message(
-                logging.WARNING, "No district records added to self.districts"
+                logging.WARNING,
+                "No district records added to self.districts",
+                event="no_districts",
             )
         if len(self.stations.elements) < 1:
             self.logger.log_message(
-                logging.WARNING, "No station records added to self.stations"
+                logging.WARNING,
+                "No station records added to self.stations",
+                event="no_stations",
             )
 
         district_ids = {
@@ -689,6 +880,8 @@ class BaseStationsDistrictsImporter(BaseStationsImporter, BaseDistrictsImporter)
                     logging.WARNING,
                     "Station id: %s found in districts but not in stations",
                     variable=station_id,
+                    event="station_id_missing",
+                    record_id=station_id,
                 )
             return True
 
@@ -700,6 +893,8 @@ class BaseStationsDistrictsImporter(BaseStationsImporter, BaseDistrictsImporter)
                     logging.WARNING,
                     "Station id: %s found in districts but not in stations",
                     variable=district_id,
+                    event="district_id_missing",
+                    record_id=district_id,
                 )
             return False
 
@@ -713,9 +908,11 @@ class BaseStationsDistrictsImporter(BaseStationsImporter, BaseDistrictsImporter)
 
         self.stations = StationSet()
         self.districts = DistrictSet()
+        self.invalid_districts = set()
         self.import_polling_districts()
         self.import_polling_stations()
         self.districts.save()
+        self.repair_district_geometries()
         self.stations.save()
         self.districts.update_uprn_to_council_model(self.districts_have_station_ids)
 
@@ -908,6 +1105,7 @@ class BaseGenericApiImporter(BaseStationsDistrictsImporter):
             pass
 
         self.districts = DistrictSet()
+        self.invalid_districts = set()
         self.stations = StationSet()
 
         # deal with 'stations only' or 'districts only' data
@@ -917,6 +1115,7 @@ class BaseGenericApiImporter(BaseStationsDistrictsImporter):
             self.import_polling_stations()
 
         self.districts.save()
+        self.repair_district_geometries()
         self.stations.save()
         self.districts.update_uprn_to_council_model(self.districts_have_station_ids)
 
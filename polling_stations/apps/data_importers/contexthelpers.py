@@ -1,5 +1,6 @@
-import requests
-from addressbase.models import Address
+from django.db import connection
+
+from data_finder.helpers.outbound import outbound
 
 
 def get_stat_from_nomis(dataset, measure, gss_code):
@@ -12,7 +13,7 @@ def get_stat_from_nomis(dataset, measure, gss_code):
     url = "http://www.nomisweb.co.uk/api/v01/dataset/{dataset}.data.json?date=latest&geography={gss_code}&rural_urban=0&cell=0&measures={measures}".format(
         dataset=dataset, gss_code=gss_code, measures=measure
     )
-    r = requests.get(url)
+    r = outbound.get(url)
     if r.status_code != 200:
         return 0
     data = r.json()
@@ -25,5 +26,16 @@ class Dwellings:
     def from_census(self, gss_code):
         return get_stat_from_nomis("NM_618_1", "20100", gss_code)
 
-    def from_addressbase(self, polygon):
-        return Address.objects.filter(location__within=polygon).count()
+    def from_addressbase(self, council):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT COUNT(DISTINCT a.uprn)
+                FROM councils_councilsubdividedgeography s
+                    JOIN addressbase_address a
+                    ON ST_Covers(s.geography, a.location)
+                WHERE s.council_id = %s;
+                """,
+                [council.pk],
+            )
+            return cursor.fetchone()[0]
@@ -262,11 +262,80 @@ class AddressList(AssignPollingStationsMixin):
                 "Record with empty required fields found:\n%s",
                 variable=address,
                 pretty=True,
+                event="address_missing_fields",
+                record_id=address.get("uprn"),
             )
             return
 
         self.elements.append(address)
 
+    def apply_corrections(
+        self,
+        excluded_uprns=frozenset(),
+        uprn_postcode_fixes=None,
+        uprn_station_overrides=None,
+        excluded_postcodes=frozenset(),
+    ):
+        """
+        Apply an import script's declarative corrections to every record
+        in one pass. UPRNs are expected to be stripped of leading zeros
+        and excluded_postcodes to be normalised without a space.
+        """
+        uprn_postcode_fixes = uprn_postcode_fixes or {}
+        uprn_station_overrides = uprn_station_overrides or {}
+        if not (
+            excluded_uprns
+            or uprn_postcode_fixes
+            or uprn_station_overrides
+            or excluded_postcodes
+        ):
+            return
+
+        elements = []
+        for record in self.elements:
+            uprn = record["uprn"]
+            if uprn in excluded_uprns:
+                self.logger.log_message(
+                    logging.INFO,
+                    "Excluding UPRN %s",
+                    variable=uprn,
+                    event="address_excluded_uprn",
+                    record_id=uprn,
+                )
+                continue
+            if uprn in uprn_postcode_fixes:
+                record["postcode"] = uprn_postcode_fixes[uprn]
+                self.logger.log_message(
+                    logging.INFO,
+                    "Fixing postcode for UPRN %s",
+                    variable=uprn,
+                    event="address_postcode_fixed",
+                    record_id=uprn,
+                )
+            if (
+                excluded_postcodes
+                and Postcode(record["postcode"]).without_space in excluded_postcodes
+            ):
+                self.logger.log_message(
+                    logging.INFO,
+                    "Excluding postcode %s",
+                    variable=record["postcode"],
+                    event="address_excluded_postcode",
+                    record_id=uprn,
+                )
+                continue
+            if uprn in uprn_station_overrides:
+                record["polling_station_id"] = uprn_station_overrides[uprn]
+                self.logger.log_message(
+                    logging.INFO,
+                    "Overriding polling station for UPRN %s",
+                    variable=uprn,
+                    event="address_station_override",
+                    record_id=uprn,
+                )
+            elements.append(record)
+        self.elements = elements
+
     def get_uprn_lookup(self):
         # for each address, build a lookup of uprn -> set of station ids
         uprn_lookup = {}
@@ -348,6 +417,7 @@ class AddressList(AssignPollingStationsMixin):
                 f"These postcodes are split in council data: {', '.join(postcodes_to_warn)}, "
                 "but won't be in the db once imported.",
                 pretty=True,
+                event="split_postcodes_not_split",
             )
 
     def check_records(self):
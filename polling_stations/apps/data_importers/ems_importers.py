@@ -104,6 +104,8 @@ class BaseXpressCsvImporter(BaseCsvStationsCsvAddressesImporter, metaclass=abc.A
                     pc1=ab_postcode.with_space,
                     pc2=station_postcode.with_space,
                 ),
+                event="station_uprn_postcode_mismatch",
+                record_id=getattr(record, self.station_id_field),
             )
         return ab_rec.location
 
@@ -194,22 +196,22 @@ class BaseXpressWebLookupCsvImporter(BaseXpressCsvImporter, metaclass=abc.ABCMet
     residential_uprn_field = "uprn"
 
     def address_record_to_dict(self, record):
-        if record.postcode.strip() == "":
+        postcode = record.postcode.strip()
+        if postcode == "":
             return None
 
-        if record.propertynumber.strip() == "0" or record.propertynumber.strip() == "":
-            address = record.streetname.strip()
+        property_number = record.propertynumber.strip()
+        street_name = record.streetname.strip()
+        if property_number == "0" or property_number == "":
+            address = street_name
         else:
-            address = "%s %s" % (
-                record.propertynumber.strip(),
-                record.streetname.strip(),
-            )
+            address = "%s %s" % (property_number, street_name)
 
         uprn = getattr(record, self.residential_uprn_field).strip()
 
         return {
             "address": address.strip(),
-            "postcode": record.postcode.strip(),
+            "postcode": postcode,
             "polling_station_id": getattr(record, self.station_id_field).strip(),
             "uprn": uprn,
         }
@@ -238,7 +240,8 @@ class BaseXpressDemocracyClubCsvImporter(BaseXpressCsvImporter, metaclass=abc.AB
     residential_uprn_field = "property_urn"
 
     def address_record_to_dict(self, record):
-        if record.addressline6.strip() == "":
+        postcode = record.addressline6.strip()
+        if postcode == "":
             return None
 
         address = format_residential_address(
@@ -255,7 +258,7 @@ class BaseXpressDemocracyClubCsvImporter(BaseXpressCsvImporter, metaclass=abc.AB
 
         return {
             "address": address.strip(),
-            "postcode": record.addressline6.strip(),
+            "postcode": postcode,
             "polling_station_id": getattr(record, self.station_id_field).strip(),
             "uprn": uprn,
         }
@@ -318,6 +321,13 @@ but we can override them if necessary
 """
 
 
+def replace_na(text):
+    text = text.strip()
+    if text == "n/a":
+        return ""
+    return text
+
+
 class BaseHalaroseCsvImporter(
     BaseCsvStationsCsvAddressesImporter, metaclass=abc.ABCMeta
 ):
@@ -332,22 +342,25 @@ class BaseHalaroseCsvImporter(
         "pollingstationaddress_5",
     ]
     residential_uprn_field = "uprn"
+    excluded_street_names = frozenset(
+        ["other electors", "other voters", "other electors address"]
+    )
+    # station hashes we've worked out in this import, see get_station_hash()
+    station_hashes = None
 
     def get_station_hash(self, record):
-        return "-".join(
-            [
-                record.pollingstationnumber.strip(),
-                slugify(record.pollingstationname.strip())[:90],
-            ]
-        )
+        # every address row carries its station's details, so memoise this
+        # rather than calling slugify() once per row of the input file
+        if self.station_hashes is None:
+            self.station_hashes = {}
+        key = (record.pollingstationnumber.strip(), record.pollingstationname.strip())
+        if key not in self.station_hashes:
+            self.station_hashes[key] = "-".join([key[0], slugify(key[1])[:90]])
+        return self.station_hashes[key]
 
     def get_station_address(self, record):
         address = format_polling_station_address(
-            [
-                getattr(record, field).strip()
-                for field in self.station_address_fields
-                if getattr(record, field).strip()
-            ]
+            [getattr(record, field).strip() for field in self.station_address_fields]
         )
         return address
 
@@ -385,15 +398,11 @@ class BaseHalaroseCsvImporter(
         }
 
     def get_residential_address(self, record):
-        def replace_na(text):
-            if text.strip() == "n/a":
-                return ""
-            return text.strip()
-
         address_line_1 = replace_na(record.housename)
-        if replace_na(record.substreetname):
+        sub_street_name = replace_na(record.substreetname)
+        if sub_street_name:
             address_line_2 = (
-                replace_na(record.housenumber) + " " + replace_na(record.substreetname)
+                replace_na(record.housenumber) + " " + sub_street_name
             ).strip()
             address_line_3 = (
                 replace_na(record.streetnumber) + " " + replace_na(record.streetname)
@@ -406,9 +415,9 @@ class BaseHalaroseCsvImporter(
 
         address = format_residential_address(
             [
-                address_line_1.strip(),
-                address_line_2.strip(),
-                address_line_3.strip(),
+                address_line_1,
+                address_line_2,
+                address_line_3,
                 replace_na(record.locality),
                 replace_na(record.town),
                 replace_na(record.adminarea),
@@ -418,14 +427,11 @@ class BaseHalaroseCsvImporter(
         return address.strip()
 
     def address_record_to_dict(self, record):
-        if record.streetname.lower().strip() == "other electors":
-            return None
-        if record.streetname.lower().strip() == "other voters":
-            return None
-        if record.streetname.lower().strip() == "other electors address":
+        if record.streetname.lower().strip() in self.excluded_street_names:
             return None
 
-        if record.housepostcode.strip() == "":
+        postcode = record.housepostcode.strip()
+        if postcode == "":
             return None
 
         address = self.get_residential_address(record)
@@ -439,7 +445,7 @@ class BaseHalaroseCsvImporter(
 
         return {
             "address": address,
-            "postcode": record.housepostcode.strip(),
+            "postcode": postcode,
             "polling_station_id": station_id,
             "uprn": uprn,
         }
@@ -468,12 +474,13 @@ class BaseDemocracyCountsCsvImporter(
     residential_uprn_field = "uprn"
 
     def address_record_to_dict(self, record):
+        postcode = getattr(record, self.postcode_field).strip()
 
-        if getattr(record, self.postcode_field).strip() == "A1 1AA":
+        if postcode == "A1 1AA":
             # this is a dummy record
             return None
 
-        if not getattr(record, self.postcode_field).strip():
+        if not postcode:
             return None
 
         address = format_residential_address(
@@ -487,7 +494,7 @@ class BaseDemocracyCountsCsvImporter(
 
         return {
             "address": address,
-            "postcode": getattr(record, self.postcode_field).strip(),
+            "postcode": postcode,
             "polling_station_id": getattr(record, self.station_id_field).strip(),
             "uprn": uprn,
         }
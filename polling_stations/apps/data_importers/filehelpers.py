@@ -19,6 +19,32 @@ def recursive_find(path, pattern):
     return matches
 
 
+def clean_field_name(name):
+    """
+    Turn a CSV header into the attribute name CsvHelper
+    will use for it e.g: 'Property URN' -> 'property_urn'
+    """
+
+    # fmt: off
+    replace = {
+        " ": "_",
+        "-": "_",
+        ".": "_",
+        "(": "",
+        ")": "",
+        "/": "_",
+        "\\": "_",
+    }
+    # fmt: on
+
+    name = name.strip().lower()
+    for k, v in replace.items():
+        name = name.replace(k, v)
+    while "__" in name:
+        name = name.replace("__", "_")
+    return name
+
+
 class CsvHelper:
     """
     Helper class for reading data from CSV files
@@ -36,27 +62,7 @@ class CsvHelper:
 
         # mimic the data structure generated by ffs so existing import
         # scripts don't break
-
-        # fmt: off
-        replace = {
-            " ": "_",
-            "-": "_",
-            ".": "_",
-            "(": "",
-            ")": "",
-            "/": "_",
-            "\\": "_",
-        }
-        # fmt: on
-
-        clean = []
-        for s in header:
-            s = s.strip().lower()
-            for k, v in replace.items():
-                s = s.replace(k, v)
-            while "__" in s:
-                s = s.replace("__", "_")
-            clean.append(s)
+        clean = [clean_field_name(s) for s in header]
         RowKlass = namedtuple("RowKlass", clean)
 
         data = []
@@ -19,18 +19,28 @@ def convert_linestring_to_multiploygon(linestring):
 
 
 @transaction.atomic
-def fix_bad_polygons():
-    # fix self-intersecting polygons
-    print("running fixup SQL")
+def fix_bad_polygons(council_id=None):
+    """
+    Fix self-intersecting polygons. If council_id is given only that
+    council's districts are checked, otherwise the whole table is.
+    Returns the number of districts repaired.
+    """
     table_name = PollingDistrict()._meta.db_table
+    where = "NOT ST_IsValid(area)"
+    params = []
+    if council_id:
+        where += " AND council_id=%s"
+        params.append(council_id)
 
     cursor = connection.cursor()
     cursor.execute(
         """
         UPDATE {0}
         SET area=ST_Multi(ST_CollectionExtract(ST_MakeValid(area), 3))
-        WHERE NOT ST_IsValid(area);
+        WHERE {1};
         """.format(
-            table_name
-        )
+            table_name, where
+        ),
+        params,
     )
+    return cursor.rowcount
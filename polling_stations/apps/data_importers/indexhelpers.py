@@ -0,0 +1,92 @@
+import time
+
+from django.db import connection
+
+from addressbase.partitions import is_partitioned
+
+# (table, column) pairs with indexes the importers don't need. Every insert
+# and update has to maintain them though, which adds up when we're
+# importing every council at once. The spatial joins the importers do
+# go through council_id and addressbase_address.location instead.
+BULK_RELOAD_INDEXES = [
+    ("pollingstations_pollingdistrict", "area"),
+    ("pollingstations_pollingstation", "location"),
+    ("addressbase_uprntocouncil", "council_id"),
+]
+
+
+class DeferredIndexes:
+    """
+    Drop the indexes on columns for the duration of a with block,
+    then rebuild them and ANALYZE the tables afterwards, even if
+    something goes wrong in the meantime.
+
+    Primary keys and unique indexes are always left alone.
+    """
+
+    def __init__(self, columns=BULK_RELOAD_INDEXES, concurrently=True, stdout=None):
+        self.columns = columns
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction
+        self.concurrently = concurrently
+        self.stdout = stdout
+        self.dropped = []
+        self.timings = {}
+
+    def write(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def find_indexes(self, cursor):
+        indexes = []
+        for table, column in self.columns:
+            cursor.execute(
+                """
+                SELECT i.relname, pg_get_indexdef(i.oid)
+                FROM pg_index x
+                    JOIN pg_class i ON i.oid = x.indexrelid
+                    JOIN pg_class t ON t.oid = x.indrelid
+                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = x.indkey[0]
+                WHERE t.relname = %s AND a.attname = %s
+                AND x.indnatts = 1 AND NOT x.indisprimary AND NOT x.indisunique;
+                """,
+                [table, column],
+            )
+            indexes += [(name, table, definition) for name, definition in cursor]
+        return indexes
+
+    def drop(self):
+        start = time.time()
+        with connection.cursor() as cursor:
+            for name, table, definition in self.find_indexes(cursor):
+                # so it can be recreated by hand if we don't get to restore()
+                self.write(f"Dropping index {name}: {definition}")
+                cursor.execute(f"DROP INDEX {name};")
+                self.dropped.append((name, table, definition))
+        self.timings["drop indexes"] = time.time() - start
+
+    def restore(self):
+        start = time.time()
+        with connection.cursor() as cursor:
+            while self.dropped:
+                name, table, definition = self.dropped[0]
+                # indexes on partitioned tables can't be built concurrently
+                if self.concurrently and not is_partitioned(cursor, table):
+                    definition = definition.replace(
+                        "CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1
+                    )
+                self.write(f"Rebuilding index {name}...")
+                cursor.execute(definition)
+                self.dropped.pop(0)
+            self.timings["rebuild indexes"] = time.time() - start
+
+            start = time.time()
+            for table in sorted({table for table, _ in self.columns}):
+                cursor.execute(f"ANALYZE {table};")
+            self.timings["analyze"] = time.time() - start
+
+    def __enter__(self):
+        self.drop()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.restore()
@@ -1,12 +1,20 @@
 import logging
 import pprint
+from collections import Counter, namedtuple
+
+
+ImportEvent = namedtuple(
+    "ImportEvent", ["code", "council_id", "record_id", "level", "message"]
+)
 
 
 class LogHelper:
 
     logger = None
+    # number of example events we hang on to for each event code
+    max_samples = 3
 
-    def __init__(self, verbosity):
+    def __init__(self, verbosity, council_id=None):
         logformat = "%(levelname)s: %(message)s"
         logging.basicConfig(format=logformat)
         logger = logging.getLogger(__name__)
@@ -19,18 +27,85 @@ class LogHelper:
         elif verbosity >= 3:
             logger.setLevel(logging.DEBUG)
         self.logger = logger
+        self.council_id = council_id
+        self.event_counts = Counter()
+        self.event_levels = {}
+        self.event_samples = {}
 
-    def log_message(self, level, message, variable=None, pretty=False):
-        log_str = ""
+    def format_message(self, message, variable=None, pretty=False):
         if variable:
             if pretty:
                 try:
-                    log_str = message % pprint.pformat(variable._asdict(), indent=4)
+                    return message % pprint.pformat(variable._asdict(), indent=4)
                 except AttributeError:
-                    log_str = message % pprint.pformat(variable, indent=4)
-            else:
-                log_str = message % variable
-        else:
-            log_str = message
+                    return message % pprint.pformat(variable, indent=4)
+            return message % variable
+        return message
+
+    def record_event(self, code, level, message, record_id=None):
+        """
+        Count an event by code and keep a few samples of it so we
+        can summarise at the end of the import instead of relying
+        on one log line per record
+        """
+        self.event_counts[code] += 1
+        self.event_levels[code] = max(level, self.event_levels.get(code, level))
+        samples = self.event_samples.setdefault(code, [])
+        if len(samples) < self.max_samples:
+            samples.append(
+                ImportEvent(code, self.council_id, record_id, level, message)
+            )
+
+    def get_events(self):
+        return self.event_counts, self.event_levels, self.event_samples
+
+    def merge_events(self, events):
+        """
+        Combine events returned by get_events() on another
+        LogHelper (e.g: one in a worker process) into this one
+        """
+        counts, levels, samples = events
+        self.event_counts.update(counts)
+        for code, level in levels.items():
+            self.event_levels[code] = max(level, self.event_levels.get(code, level))
+        for code, code_samples in samples.items():
+            existing = self.event_samples.setdefault(code, [])
+            existing.extend(code_samples[: self.max_samples - len(existing)])
+
+    def log_message(
+        self, level, message, variable=None, pretty=False, event=None, record_id=None
+    ):
+        if event:
+            self.record_event(event, level, message, record_id=record_id)
+
+        # formatting records (especially with pprint) is expensive
+        # so don't do it unless we're actually going to output something
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(level, self.format_message(message, variable, pretty))
+
+    def get_summary(self, min_level=logging.WARNING):
+        """
+        Return (code, count, samples) for each event code
+        logged at min_level or above, most frequent first
+        """
+        return [
+            (code, count, self.event_samples[code])
+            for code, count in self.event_counts.most_common()
+            if self.event_levels[code] >= min_level
+        ]
+
+    def log_summary(self, min_level=logging.WARNING):
+        summary = self.get_summary(min_level)
+        if not summary or not self.logger.isEnabledFor(logging.WARNING):
+            return
 
-        self.logger.log(level, log_str)
+        lines = ["Import summary for %s:" % (self.council_id or "unknown council")]
+        for code, count, samples in summary:
+            record_ids = [str(s.record_id) for s in samples if s.record_id]
+            line = "  [%s] %s: %i event(s)" % (self.council_id, code, count)
+            if record_ids:
+                line += " e.g: %s" % ", ".join(record_ids)
+            lines.append(line)
+        self.logger.log(logging.WARNING, "\n".join(lines))
@@ -0,0 +1,100 @@
+import os
+import time
+from importlib.machinery import SourceFileLoader
+
+from django.core.management.base import BaseCommand
+
+from data_importers.loghelper import LogHelper
+
+
+"""
+Measure how quickly an import script turns input records into dicts
+without touching the database, e.g:
+
+python manage.py benchmark_importer import_birmingham -b /path/to/data/E08000025
+"""
+
+
+class Command(BaseCommand):
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "script",
+            help="Name of the import script e.g: import_birmingham, "
+            "or the path to one",
+        )
+        parser.add_argument(
+            "-b",
+            "--base-folder-path",
+            help="<Optional> Folder containing the input files "
+            "(defaults to the importer's own data path)",
+            required=False,
+        )
+        parser.add_argument(
+            "-r",
+            "--repeat",
+            help="<Optional> Number of passes over the input file (default: 3)",
+            type=int,
+            required=False,
+            default=3,
+        )
+
+    def time_pass(self, func, records):
+        start = time.perf_counter()
+        for record in records:
+            func(record)
+        return time.perf_counter() - start
+
+    def report(self, label, timings, num_records):
+        best = min(timings)
+        self.stdout.write(
+            "{}: {:,} records in {:.3f}s (best of {}) - {:,.0f} records/s".format(
+                label,
+                num_records,
+                best,
+                len(timings),
+                num_records / best if best else 0,
+            )
+        )
+
+    def handle(self, *args, **kwargs):
+        if kwargs["script"].endswith(".py"):
+            path = kwargs["script"]
+        else:
+            path = os.path.join(
+                os.path.dirname(__file__), "{}.py".format(kwargs["script"])
+            )
+        importer = SourceFileLoader("module.name", path).load_module().Command()
+        importer.verbosity = 0
+        importer.logger = LogHelper(0, council_id=importer.council_id)
+        importer.validation_checks = False
+        importer.allow_station_point_from_postcode = False
+        if kwargs.get("base_folder_path"):
+            importer.base_folder_path = kwargs["base_folder_path"]
+        else:
+            importer.base_folder_path = importer.get_base_folder_path()
+
+        start = time.perf_counter()
+        addresses = importer.get_addresses()
+        self.stdout.write(
+            "read {:,} address records in {:.3f}s".format(
+                len(addresses), time.perf_counter() - start
+            )
+        )
+
+        timings = [
+            self.time_pass(importer.address_record_to_dict, addresses)
+            for _ in range(kwargs["repeat"])
+        ]
+        self.report("address_record_to_dict", timings, len(addresses))
+
+        try:
+            importer.get_station_hash(addresses[0])
+        except (NotImplementedError, IndexError):
+            return
+        timings = [
+            self.time_pass(importer.get_station_hash, addresses)
+            for _ in range(kwargs["repeat"])
+        ]
+        self.report("get_station_hash", timings, len(addresses))
@@ -1,10 +1,11 @@
-import glob, os, re, traceback
+import glob, os, re, time, traceback
 from importlib.machinery import SourceFileLoader
 from multiprocessing import Pool
 from django import db
 from django.apps import apps
 from django.core.management.base import BaseCommand
 
+from data_importers.indexhelpers import DeferredIndexes
 from pollingstations.models import PollingStation
 
 
@@ -38,6 +39,9 @@ Run all of the import scripts relating to a particular election or elections
 Election id may be either a string or regex. For example:
 python manage.py import -e local.buckinghamshire.2017-05-04
 python manage.py import -r -e 'local.[a-z]+.2017-05-04'
+
+When re-importing everything, use --bulk-reload to drop the indexes the
+importers don't need first and rebuild them once at the end.
 """
 
 
@@ -89,6 +93,25 @@ class Command(BaseCommand):
             default=False,
         )
 
+        parser.add_argument(
+            "-w",
+            "--workers",
+            help="<Optional> Number of processes each import script should use "
+            "to convert address records (ignored with -m)",
+            type=int,
+            required=False,
+            default=1,
+        )
+
+        parser.add_argument(
+            "--bulk-reload",
+            help="<Optional> Drop non-essential indexes while importing "
+            "and rebuild them at the end",
+            action="store_true",
+            required=False,
+            default=False,
+        )
+
     def importer_covers_these_elections(
         self, args_elections, importer_elections, regex
     ):
@@ -147,6 +170,7 @@ class Command(BaseCommand):
             "nochecks": True,
             "verbosity": 1,
             "use_postcode_centroids": False,
+            "workers": kwargs["workers"],
         }
         if kwargs["multiprocessing"]:
             opts = {
@@ -154,6 +178,8 @@ class Command(BaseCommand):
                 "nochecks": True,
                 "verbosity": 0,
                 "use_postcode_centroids": False,
+                # pool workers can't start pools of their own
+                "workers": 1,
             }
 
         # loop over all the import scripts
@@ -194,6 +220,23 @@ class Command(BaseCommand):
             "running %i import scripts..."
             % (len(commands_series) + len(commands_parallel))
         )
+        if kwargs.get("bulk_reload"):
+            start = time.time()
+            with DeferredIndexes(stdout=self.stdout) as indexes:
+                import_start = time.time()
+                self.run_commands(kwargs, commands_series, commands_parallel)
+                indexes.timings["import"] = time.time() - import_start
+            indexes.timings["total"] = time.time() - start
+            for step, seconds in indexes.timings.items():
+                self.summary.append(
+                    ("INFO", f"Bulk reload: {step} took {seconds:.1f}s")
+                )
+        else:
+            self.run_commands(kwargs, commands_series, commands_parallel)
+
+        self.output_summary()
+
+    def run_commands(self, kwargs, commands_series, commands_parallel):
         # run all the import scripts
         if kwargs["multiprocessing"]:
             # do anything we want to run in series first
@@ -206,5 +249,3 @@ class Command(BaseCommand):
             self.run_commands_in_parallel(commands_parallel)
         else:
             self.run_commands_in_series(commands_parallel + commands_series)
-
-        self.output_summary()
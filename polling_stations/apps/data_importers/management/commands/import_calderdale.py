@@ -1,4 +1,3 @@
-from data_importers.geo_utils import fix_bad_polygons
 from data_importers.management.commands import BaseShpStationsShpDistrictsImporter
 
 
@@ -25,6 +24,3 @@ class Command(BaseShpStationsShpDistrictsImporter):
             return None
 
         return {"internal_council_id": code, "address": address, "postcode": ""}
-
-    def post_import(self):
-        fix_bad_polygons()
@@ -1,5 +1,4 @@
 from django.contrib.gis.geos import Point
-from data_importers.geo_utils import fix_bad_polygons
 from data_importers.github_importer import BaseGitHubImporter
 
 
@@ -55,6 +54,3 @@ class Command(BaseGitHubImporter):
             "address": "%s\n%s" % (record["pollingplace"], record["thoroughfare_name"]),
             "location": location,
         }
-
-    def post_import(self):
-        fix_bad_polygons()
@@ -1,4 +1,3 @@
-from data_importers.geo_utils import fix_bad_polygons
 from data_importers.github_importer import BaseGitHubImporter
 
 
@@ -30,6 +29,3 @@ class Command(BaseGitHubImporter):
             "location": location,
             "polling_district_id": record["polling_district"],
         }
-
-    def post_import(self):
-        fix_bad_polygons()
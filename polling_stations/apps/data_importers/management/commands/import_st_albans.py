@@ -1,7 +1,6 @@
 import json
 from django.contrib.gis.geos import GEOSGeometry
 from django.contrib.gis.geos.collections import MultiPolygon, Polygon
-from data_importers.geo_utils import fix_bad_polygons
 from data_importers.github_importer import BaseGitHubImporter
 
 
@@ -62,6 +61,3 @@ class Command(BaseGitHubImporter):
             "postcode": "",
             "location": location,
         }
-
-    def post_import(self):
-        fix_bad_polygons()
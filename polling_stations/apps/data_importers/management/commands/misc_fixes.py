@@ -3,7 +3,7 @@ from django.core.management.base import BaseCommand
 # from django.contrib.gis.geos import Point
 from pollingstations.models import PollingStation, PollingDistrict
 from councils.models import Council
-from addressbase.models import Address, UprnToCouncil
+from addressbase.models import Address, UprnToCouncil, refresh_postcode_routes
 
 
 def update_station_point(council_id, station_id, point):
@@ -50,6 +50,7 @@ class Command(BaseCommand):
             PollingStation.objects.filter(council=council_id).delete()
             PollingDistrict.objects.filter(council=council_id).delete()
             UprnToCouncil.objects.filter(lad=council_id).update(polling_station_id="")
+            refresh_postcode_routes(council_id)
             print("..deleted")
 
         print("..done")
@@ -1,9 +1,10 @@
 from django.apps import apps
 from django.core.management.base import BaseCommand
 
-from addressbase.models import UprnToCouncil
+from addressbase.models import UprnToCouncil, refresh_postcode_routes
 from councils.models import Council
 from data_importers.models import DataQuality
+from data_importers.teardownhelpers import ChunkedTeardown
 from pollingstations.models import PollingStation, PollingDistrict
 
 """
@@ -11,6 +12,10 @@ Clear PollingDistrict and PollingStation models
 Clear polling_station_id field in UprnToCouncil model
 Clear report, num_addresses, num_districts and num_stations
 fields in DataQuality model
+
+Rows are deleted/updated in chunks, committing after each one, so this
+can be run against a live database. Use --sleep to slow it down further
+or --dry-run to see how many rows would be affected.
 """
 
 
@@ -42,6 +47,27 @@ class Command(BaseCommand):
             default=False,
         )
 
+        parser.add_argument(
+            "--chunk-size",
+            help="<Optional> Number of rows to delete or update at a time (default: 10000)",
+            type=int,
+            default=10000,
+        )
+
+        parser.add_argument(
+            "--sleep",
+            help="<Optional> Seconds to wait between chunks (default: 0)",
+            type=float,
+            default=0,
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            help="<Optional> Report how many rows would be affected without changing anything",
+            action="store_true",
+            default=False,
+        )
+
     def handle(self, *args, **kwargs):
         """
         Manually run system checks for the
@@ -56,6 +82,13 @@ class Command(BaseCommand):
             ]
         )
 
+        teardown = ChunkedTeardown(
+            chunk_size=kwargs.get("chunk_size") or 10000,
+            sleep=kwargs.get("sleep") or 0,
+            dry_run=kwargs.get("dry_run", False),
+            stdout=self.stdout,
+        )
+
         if kwargs["council"]:
             council_id = kwargs["council"]
             print("Deleting data for council %s..." % (council_id))
@@ -63,10 +96,17 @@ class Command(BaseCommand):
             council_obj = Council.objects.get(pk=council_id)
             gss_code = council_obj.geography.gss
 
-            PollingStation.objects.filter(council=council_id).delete()
-            PollingDistrict.objects.filter(council=council_id).delete()
-
-            UprnToCouncil.objects.filter(lad=gss_code).update(polling_station_id="")
+            teardown.delete(
+                PollingStation.objects.filter(council=council_id),
+                "delete polling stations",
+            )
+            teardown.delete(
+                PollingDistrict.objects.filter(council=council_id),
+                "delete polling districts",
+            )
+            teardown.clear_station_ids(UprnToCouncil.objects.filter(lad=gss_code))
+            if teardown.dry_run:
+                return
 
             dq = DataQuality.objects.get(council_id=council_id)
             dq.report = ""
@@ -74,17 +114,19 @@ class Command(BaseCommand):
             dq.num_districts = 0
             dq.num_stations = 0
             dq.save()
+            refresh_postcode_routes(council_id)
             print("..done")
 
         elif kwargs.get("all"):
             print("Deleting ALL data...")
-            PollingDistrict.objects.all().delete()
-            PollingStation.objects.all().delete()
+            teardown.delete(PollingDistrict.objects.all(), "delete polling districts")
+            teardown.delete(PollingStation.objects.all(), "delete polling stations")
+            teardown.clear_station_ids(UprnToCouncil.objects.all())
+            if teardown.dry_run:
+                return
 
-            UprnToCouncil.objects.exclude(polling_station_id="").update(
-                polling_station_id=""
-            )
             DataQuality.objects.all().update(
                 report="", num_addresses=0, num_districts=0, num_stations=0
             )
+            refresh_postcode_routes()
             print("..done")
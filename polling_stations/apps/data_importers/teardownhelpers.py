@@ -0,0 +1,65 @@
+import time
+
+from django.db import transaction
+
+
+class ChunkedTeardown:
+    """
+    Delete or clear rows a chunk at a time, committing after each chunk,
+    so tearing down a big council (or all of them) doesn't hold locks on
+    the whole table for one enormous statement while the site is live.
+
+    chunk_size: rows per statement
+    sleep:      seconds to wait between chunks, to go easy on the database
+    dry_run:    just count the rows which would be affected
+    stdout:     write progress here (or nowhere if None)
+    """
+
+    def __init__(self, chunk_size=10000, sleep=0, dry_run=False, stdout=None):
+        self.chunk_size = chunk_size
+        self.sleep = sleep
+        self.dry_run = dry_run
+        self.stdout = stdout
+
+    def write(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def process(self, queryset, label, action):
+        total = queryset.count()
+        if self.dry_run:
+            self.write(f"Would {label}: {total:,} rows")
+            return total
+
+        done = 0
+        last_pk = None
+        while True:
+            chunk = queryset.order_by("pk")
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list("pk", flat=True)[: self.chunk_size])
+            if not pks:
+                break
+            with transaction.atomic():
+                action(queryset.model.objects.filter(pk__in=pks))
+            done += len(pks)
+            last_pk = pks[-1]
+            self.write(f"{label}: {done:,}/{total:,} rows")
+            if self.sleep and len(pks) == self.chunk_size:
+                time.sleep(self.sleep)
+        return done
+
+    def delete(self, queryset, label="delete"):
+        return self.process(queryset, label, lambda chunk: chunk.delete())
+
+    def update(self, queryset, label="update", **values):
+        return self.process(queryset, label, lambda chunk: chunk.update(**values))
+
+    def clear_station_ids(self, queryset, label="clear polling_station_id"):
+        """
+        queryset is UprnToCouncil records. Rows which don't have
+        a polling_station_id already are skipped.
+        """
+        return self.update(
+            queryset.exclude(polling_station_id=""), label, polling_station_id=""
+        )
@@ -0,0 +1,18 @@
+import os
+from data_importers.tests.stubs import BaseStubCsvStationsJsonDistrictsImporter
+
+
+"""
+Define a stub implementation of json importer where
+one of the districts is a self-intersecting polygon
+"""
+
+
+class Command(BaseStubCsvStationsJsonDistrictsImporter):
+
+    srid = 4326
+    districts_name = "test.geojson"
+    stations_name = "test_4326.csv"
+    base_folder_path = os.path.join(
+        os.path.dirname(__file__), "../fixtures/invalid_polygon"
+    )
@@ -7,7 +7,7 @@ from data_importers.data_types import AddressList
 class MockLogger:
     logs = []
 
-    def log_message(self, level, message, variable=None, pretty=False):
+    def log_message(self, level, message, variable=None, pretty=False, **kwargs):
         self.logs.append(message)
 
     def clear_logs(self):
@@ -442,6 +442,64 @@ class AddressListTest(TestCase):
         address_list.remove_records_missing_uprns()
         self.assertEqual(expected, address_list.elements)
 
+    def test_apply_corrections(self):
+        in_list = [
+            {
+                "address": "foo",
+                "postcode": "AA11AA",
+                "council": "AAA",
+                "polling_station_id": "01",
+                "uprn": "1",
+            },
+            {  # excluded by uprn
+                "address": "bar",
+                "postcode": "AA11AA",
+                "council": "AAA",
+                "polling_station_id": "01",
+                "uprn": "2",
+            },
+            {  # excluded by postcode
+                "address": "baz",
+                "postcode": "BB1 1BB",
+                "council": "AAA",
+                "polling_station_id": "01",
+                "uprn": "3",
+            },
+            {  # postcode fixed, so no longer excluded
+                "address": "qux",
+                "postcode": "BB11BB",
+                "council": "AAA",
+                "polling_station_id": "01",
+                "uprn": "4",
+            },
+        ]
+        expected = [
+            {
+                "address": "foo",
+                "postcode": "AA11AA",
+                "council": "AAA",
+                "polling_station_id": "02",
+                "uprn": "1",
+            },
+            {
+                "address": "qux",
+                "postcode": "AA1 1AB",
+                "council": "AAA",
+                "polling_station_id": "01",
+                "uprn": "4",
+            },
+        ]
+        address_list = AddressList(MockLogger())
+        for el in in_list:
+            address_list.append(el)
+        address_list.apply_corrections(
+            excluded_uprns=frozenset(["2"]),
+            uprn_postcode_fixes={"4": "AA1 1AB"},
+            uprn_station_overrides={"1": "02"},
+            excluded_postcodes=frozenset(["BB11BB"]),
+        )
+        self.assertEqual(expected, address_list.elements)
+
     def test_check_split_postcodes_are_split(self):
         """
         AddressBase                      | Council Data
@@ -0,0 +1,48 @@
+import logging
+
+from django.test import SimpleTestCase
+
+from data_importers.base_importers import BaseAddressesImporter
+from data_importers.loghelper import LogHelper
+
+
+class MockAddressesImporter(BaseAddressesImporter):
+    council_id = "AAA"
+    addresses_filetype = "csv"
+    addresses_name = "addresses.csv"
+
+    def import_data(self):
+        pass
+
+    def address_record_to_dict(self, record):
+        if record % 10 == 0:
+            self.logger.log_message(
+                logging.WARNING, "skipping %s", variable=record, event="skip"
+            )
+            return None
+        return {"uprn": str(record), "polling_station_id": str(record % 3)}
+
+
+class BaseAddressesImporterTest(SimpleTestCase):
+    def get_importer(self, workers):
+        importer = MockAddressesImporter()
+        importer.verbosity = 0
+        importer.workers = workers
+        importer.logger = LogHelper(0, council_id=importer.council_id)
+        return importer
+
+    def test_address_records_to_dicts_in_parallel(self):
+        addresses = list(range(1, 1001))
+        serial = self.get_importer(workers=1)
+        parallel = self.get_importer(workers=3)
+
+        self.assertEqual(
+            list(serial.address_records_to_dicts(addresses)),
+            list(parallel.address_records_to_dicts(addresses)),
+        )
+        # events logged in the workers are merged back into our logger
+        self.assertEqual(100, parallel.logger.event_counts["skip"])
+        self.assertEqual(
+            serial.logger.event_counts,
+            parallel.logger.event_counts,
+        )
@@ -6,7 +6,7 @@ from data_importers.data_types import StationSet, DistrictSet
 
 
 class MockLogger:
-    def log_message(self, level, message, variable=None, pretty=False):
+    def log_message(self, level, message, variable=None, pretty=False, **kwargs):
         pass
 
 
@@ -12,7 +12,7 @@ from data_importers.data_types import StationSet
 class MockLogger:
     logs = []
 
-    def log_message(self, level, message, variable=None, pretty=False):
+    def log_message(self, level, message, variable=None, pretty=False, **kwargs):
         self.logs.append(message)
 
     def clear_logs(self):
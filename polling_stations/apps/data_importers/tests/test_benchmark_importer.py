@@ -0,0 +1,18 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from data_importers.tests.stubs import stub_halaroseimport
+
+
+class BenchmarkImporterTest(SimpleTestCase):
+    def test_benchmark_stub_importer(self):
+        out = StringIO()
+        call_command(
+            "benchmark_importer", stub_halaroseimport.__file__, "-r", "1", stdout=out
+        )
+        output = out.getvalue()
+        self.assertIn("address records in", output)
+        self.assertIn("address_record_to_dict:", output)
+        self.assertIn("get_station_hash:", output)
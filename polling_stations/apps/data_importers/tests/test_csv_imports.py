@@ -1,3 +1,6 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
 from addressbase.models import UprnToCouncil, Address
@@ -9,7 +12,7 @@ from data_importers.tests.stubs import stub_addressimport
 class ImporterTest(TestCase):
     opts = {"nochecks": True, "verbosity": 0}
 
-    def set_up(self, addressbase, uprns, addresses_name):
+    def set_up(self, addressbase, uprns, addresses_name, workers=1):
         for address in addressbase:
             Address.objects.update_or_create(**address)
 
@@ -20,7 +23,13 @@ class ImporterTest(TestCase):
 
         cmd = stub_addressimport.Command()
         cmd.addresses_name = addresses_name
-        cmd.handle(**self.opts)
+        if workers > 1:
+            call_command(
+                cmd, "--nochecks", "-w", str(workers), verbosity=0, stdout=StringIO()
+            )
+        else:
+            cmd.handle(**self.opts)
+        return cmd
 
     def test_duplicate_uprns(self):
         """
@@ -56,6 +65,34 @@ class ImporterTest(TestCase):
         expected = {("6", "2")}
         self.assertEqual(set(imported_uprns), expected)
 
+    def test_workers_in_transaction(self):
+        """
+        TestCase wraps each test in a transaction, so we can't fork
+        workers: the import should still work, in a single process
+        """
+        cmd = self.set_up(
+            uprns=["1", "6"],
+            addressbase=[
+                {"address": "Haringey Park, London", "uprn": "1", "postcode": "N8 9JG"},
+                {
+                    "address": "80 Pine Vale Cres, Bournemouth",
+                    "uprn": "6",
+                    "postcode": "BH10 6BJ",
+                },
+            ],
+            addresses_name="duplicate_uprns.csv",
+            workers=2,
+        )
+
+        self.assertEqual(1, cmd.logger.event_counts["workers_in_transaction"])
+        # and the connection still works afterwards
+        imported_uprns = (
+            UprnToCouncil.objects.filter(lad="X01000000")
+            .exclude(polling_station_id="")
+            .values_list("uprn", "polling_station_id")
+        )
+        self.assertEqual({("6", "2")}, set(imported_uprns))
+
     def test_uprn_not_in_addressbase(self):
         """uprn does not appear in addressbase data, or in UprnToCouncil table"""
         test_params = {
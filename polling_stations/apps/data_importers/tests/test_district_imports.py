@@ -1,4 +1,5 @@
 # High-level functional tests for import scripts
+from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
 from django.db import IntegrityError
 from django.test import TestCase
 
@@ -11,6 +12,7 @@ from data_importers.tests.stubs import (
     stub_kmlimport,
     stub_jsonimport_different_srids,
     stub_jsonimport,
+    stub_jsonimport_invalid_polygon,
 )
 from pollingstations.models import PollingDistrict, PollingStation
 
@@ -145,3 +147,26 @@ class ImporterTest(TestCase):
         cmd.handle(**self.opts)
 
         self.run_assertions()
+
+    def test_invalid_polygons_are_repaired(self):
+        self.create_dummy_council()
+        # an invalid district belonging to some other council
+        other_council = CouncilFactory(pk="BBB", identifiers=["X01000001"])
+        bowtie = GEOSGeometry("POLYGON((0 0, 1 1, 1 0, 0 1, 0 0))", srid=4326)
+        PollingDistrict.objects.create(
+            council=other_council,
+            internal_council_id="X",
+            area=MultiPolygon(bowtie, srid=4326),
+        )
+
+        cmd = stub_jsonimport_invalid_polygon.Command()
+        cmd.handle(**self.opts)
+
+        self.assertEqual(1, cmd.logger.event_counts["district_invalid_geometry"])
+        self.assertEqual({"1"}, cmd.invalid_districts)
+        districts = PollingDistrict.objects.filter(council_id="AAA")
+        self.assertEqual(2, len(districts))
+        for district in districts:
+            self.assertTrue(district.area.valid)
+        # we only repair districts for the council we're importing
+        self.assertFalse(PollingDistrict.objects.get(council_id="BBB").area.valid)
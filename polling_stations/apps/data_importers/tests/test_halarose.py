@@ -193,3 +193,13 @@ class HalaroseImportTests(TestCase):
         cmd = stub_halaroseimport.Command()
         for case in test_cases:
             self.assertEqual(case["out"], cmd.get_residential_address(case["in"]))
+
+    def test_station_hashes_are_per_importer(self):
+        Record = namedtuple("Record", ["pollingstationnumber", "pollingstationname"])
+        record = Record(" 10 ", "Village Hall")
+        importer = stub_halaroseimport.Command()
+        self.assertEqual("10-village-hall", importer.get_station_hash(record))
+        self.assertEqual(
+            {("10", "Village Hall"): "10-village-hall"}, importer.station_hashes
+        )
+        self.assertIsNone(stub_halaroseimport.Command().station_hashes)
@@ -0,0 +1,39 @@
+from django.db import connection
+from django.test import TestCase
+
+from data_importers.indexhelpers import DeferredIndexes
+
+
+class DeferredIndexesTest(TestCase):
+    def get_indexes(self, table, column):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+        return {
+            name
+            for name, info in constraints.items()
+            if info["index"] and info["columns"] == [column]
+        }
+
+    def test_indexes_are_rebuilt(self):
+        table, column = "pollingstations_pollingstation", "location"
+        before = self.get_indexes(table, column)
+        self.assertTrue(before)
+
+        with DeferredIndexes(columns=[(table, column)], concurrently=False) as indexes:
+            self.assertEqual(set(), self.get_indexes(table, column))
+            self.assertEqual(before, {name for name, _, _ in indexes.dropped})
+
+        self.assertEqual(before, self.get_indexes(table, column))
+        self.assertEqual(
+            ["drop indexes", "rebuild indexes", "analyze"], list(indexes.timings)
+        )
+
+    def test_indexes_are_rebuilt_after_errors(self):
+        table, column = "pollingstations_pollingdistrict", "area"
+        before = self.get_indexes(table, column)
+
+        with self.assertRaises(ValueError):
+            with DeferredIndexes(columns=[(table, column)], concurrently=False):
+                raise ValueError("import failed")
+
+        self.assertEqual(before, self.get_indexes(table, column))
@@ -0,0 +1,81 @@
+import logging
+from collections import namedtuple
+
+from django.test import TestCase
+
+from data_importers.loghelper import LogHelper
+
+
+Record = namedtuple("Record", ["foo", "bar"])
+
+
+class ExplodingRecord:
+    def _asdict(self):
+        raise AssertionError("record should not have been formatted")
+
+
+class LogHelperTest(TestCase):
+    def test_does_not_format_when_level_disabled(self):
+        helper = LogHelper(verbosity=1, council_id="AAA")
+        # this would raise if we tried to pretty-print the record
+        helper.log_message(
+            logging.INFO, "record:\n%s", variable=ExplodingRecord(), pretty=True
+        )
+
+    def test_formats_when_level_enabled(self):
+        helper = LogHelper(verbosity=2, council_id="AAA")
+        with self.assertLogs(helper.logger, level=logging.INFO) as logs:
+            helper.log_message(
+                logging.INFO, "record:\n%s", variable=Record("1", "2"), pretty=True
+            )
+        self.assertEqual(
+            ["INFO:data_importers.loghelper:record:\n{'bar': '2', 'foo': '1'}"],
+            logs.output,
+        )
+
+    def test_events_are_counted_and_sampled(self):
+        helper = LogHelper(verbosity=0, council_id="AAA")
+        for i in range(5):
+            helper.log_message(
+                logging.WARNING, "foo %s", variable=i, event="foo", record_id=i + 1
+            )
+        helper.log_message(logging.INFO, "bar", event="bar")
+
+        self.assertEqual(5, helper.event_counts["foo"])
+        self.assertEqual(1, helper.event_counts["bar"])
+        self.assertEqual([1, 2, 3], [e.record_id for e in helper.event_samples["foo"]])
+        self.assertEqual({"AAA"}, {e.council_id for e in helper.event_samples["foo"]})
+
+        # INFO events are counted but not included in the warning summary
+        summary = helper.get_summary()
+        self.assertEqual(1, len(summary))
+        self.assertEqual(("foo", 5), summary[0][:2])
+
+    def test_log_summary(self):
+        helper = LogHelper(verbosity=1, council_id="AAA")
+        helper.log_message(logging.WARNING, "foo", event="foo", record_id="X1")
+        helper.log_message(logging.WARNING, "foo", event="foo", record_id="X2")
+        helper.log_message(logging.WARNING, "bar", event="bar")
+        with self.assertLogs(helper.logger, level=logging.WARNING) as logs:
+            helper.log_summary()
+        self.assertEqual(
+            [
+                "WARNING:data_importers.loghelper:Import summary for AAA:\n"
+                "  [AAA] foo: 2 event(s) e.g: X1, X2\n"
+                "  [AAA] bar: 1 event(s)"
+            ],
+            logs.output,
+        )
+
+    def test_merge_events(self):
+        helper = LogHelper(verbosity=0, council_id="AAA")
+        helper.log_message(logging.INFO, "foo", event="foo", record_id=1)
+        other = LogHelper(verbosity=0, council_id="AAA")
+        for i in range(2, 6):
+            other.log_message(logging.WARNING, "foo", event="foo", record_id=i)
+
+        helper.merge_events(other.get_events())
+
+        self.assertEqual(5, helper.event_counts["foo"])
+        self.assertEqual(logging.WARNING, helper.event_levels["foo"])
+        self.assertEqual([1, 2, 3], [e.record_id for e in helper.event_samples["foo"]])
@@ -1,3 +1,5 @@
+from io import StringIO
+
 from django.test import TestCase
 
 from addressbase.models import UprnToCouncil, Address
@@ -195,3 +197,26 @@ class TestTeardown(TestCase):
                 }
             ),
         )
+
+    def test_teardown_all_councils_in_chunks(self):
+        cmd = Command(stdout=StringIO())
+        cmd.handle(council=None, all=True, chunk_size=1)
+
+        self.assertEqual(PollingStation.objects.count(), 0)
+        self.assertEqual(PollingDistrict.objects.count(), 0)
+        self.assertFalse(UprnToCouncil.objects.exclude(polling_station_id="").exists())
+        self.assertIn("clear polling_station_id: 3/3 rows", cmd.stdout.getvalue())
+
+    def test_teardown_dry_run(self):
+        out = StringIO()
+        cmd = Command(stdout=out)
+        cmd.handle(council="AAA", dry_run=True)
+
+        self.assertIn("Would delete polling stations: 2 rows", out.getvalue())
+        self.assertIn("Would clear polling_station_id: 2 rows", out.getvalue())
+        self.assertEqual(PollingStation.objects.count(), 3)
+        self.assertEqual(PollingDistrict.objects.count(), 3)
+        self.assertEqual(
+            UprnToCouncil.objects.exclude(polling_station_id="").count(), 3
+        )
+        self.assertEqual(DataQuality.objects.get(council_id="AAA").report, "foo")
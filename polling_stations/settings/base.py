@@ -273,6 +273,40 @@ CHECK_SERVER_CLEAN = True
 CLEAN_SERVER_FILE = "~/clean"
 
 
+# requests to EE, Google directions, etc
+# see data_finder.helpers.outbound.OutboundHTTP
+OUTBOUND_HTTP = {
+    "RETRIES": 1,
+    "BACKOFF": 0.1,
+    "FAILURE_THRESHOLD": 5,
+    "RESET_TIMEOUT": 30,
+    "POOL_SIZE": 10,
+}
+
+# seconds to wait for EE and directions when rendering a lookup,
+# and threads to make those requests in (see data_finder.helpers.fanout)
+LOOKUP_DEADLINE = 5
+LOOKUP_WORKERS = 20
+
+# see data_finder.helpers.geocoders.GeocoderCache
+GEOCODER_CACHE = {
+    "LRU_SIZE": 10000,
+    "LOCAL_TIMEOUT": 60,
+    "BACKEND": None,
+    "TIMEOUT": 60 * 60 * 24,
+}
+
+# how to write LoggedPostcode records
+# see data_finder.helpers.log_writer.BufferedLogWriter
+POSTCODE_LOGGING = {
+    "BUFFERED": False,
+    "BATCH_SIZE": 500,
+    "FLUSH_INTERVAL": 5,
+    "MAX_QUEUE_SIZE": 10000,
+    "DATABASE": "default",
+}
+
+
 # import application constants
 from .constants.councils import *  # noqa
 from .constants.directions import *  # noqa
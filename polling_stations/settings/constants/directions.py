@@ -6,3 +6,13 @@ BASE_GOOGLE_URL = "https://maps.googleapis.com/maps/api/directions/json?units=im
 
 MAPZEN_API_KEY = os.environ.get("MAPZEN_API_KEY", "")
 BASE_MAPZEN_URL = "https://valhalla.mapzen.com/route"
+
+# Routes from a postcode to a polling station are cached for TIMEOUT
+# seconds, then served for up to STALE_TIMEOUT seconds while they are
+# refreshed (see data_finder.helpers.response_cache)
+DIRECTIONS_CACHE = {
+    "BACKEND": "default",
+    "TIMEOUT": 60 * 60 * 24 * 30,
+    "STALE_TIMEOUT": 60 * 60 * 24 * 7,
+    "ERROR_TIMEOUT": 60,
+}
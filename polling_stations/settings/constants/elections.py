@@ -16,3 +16,18 @@ EVERY_ELECTION = {"CHECK": True, "HAS_ELECTION": True}
 ELECTION_BLACKLIST = [
     "local.epping-forest.moreton-and-fyfield.by.2018-05-03"  # uncontested
 ]
+
+"""
+Every Election responses are cached (see data_finder.helpers.response_cache)
+
+BACKEND is the name of the django cache to use. A response is fresh for
+TIMEOUT seconds, then served for up to another STALE_TIMEOUT seconds
+while it is refreshed in the background. Failed requests are remembered
+for ERROR_TIMEOUT seconds.
+"""
+EE_CACHE = {
+    "BACKEND": "default",
+    "TIMEOUT": 60 * 5,
+    "STALE_TIMEOUT": 60 * 60,
+    "ERROR_TIMEOUT": 30,
+}
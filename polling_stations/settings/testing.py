@@ -4,6 +4,8 @@ from .base import *  # noqa
 EVERY_ELECTION["CHECK"] = True  # noqa
 NEXT_CHARISMATIC_ELECTION_DATE = None
 DISABLE_GA = True  # don't log to Google Analytics when we are running tests
+# tests load different fixtures for the same postcodes
+GEOCODER_CACHE = {"LRU_SIZE": 0, "BACKEND": None}
 
 INSTALLED_APPS = list(INSTALLED_APPS)  # noqa
 INSTALLED_APPS.append("aloe_django")